@@ -1,19 +1,50 @@
 # freeze_setup.py
 import sys
+from pathlib import Path
 from cx_Freeze import setup, Executable
 
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE / "src"))
+from anycubic_nfc_qt5.config.filaments import FILAMENT_CACHE_NAME, write_filament_cache
+
+# Filament-Cache vorab erzeugen (spart das INI-Parsen beim App-Start) – nur wenn
+# wirklich gebaut wird, nicht bei --help oder einer fehlerhaften Kommandozeile
+if any(a == "build" or a.startswith(("build_", "bdist")) for a in sys.argv[1:]):
+    write_filament_cache()
+
 # Dateien/Ordner, die ins Bundle müssen
 include_files = [
     ("src/anycubic_nfc_qt5/config/ac_filaments.ini", "anycubic_nfc_qt5/config/ac_filaments.ini"),
-    ("src/anycubic_nfc_qt5/ui/resources", "anycubic_nfc_qt5/ui/resources"),
+    (f"src/anycubic_nfc_qt5/config/{FILAMENT_CACHE_NAME}", f"anycubic_nfc_qt5/config/{FILAMENT_CACHE_NAME}"),
+    # Icons sind über ui/resources_rc.py (pyrcc5) einkompiliert, keine losen PNGs nötig
+]
+
+# PyQt5-Module, die die App nicht nutzt – sonst zieht der PyQt5-Hook
+# die zugehörigen Qt-Libraries/Frameworks mit ins Bundle.
+unused_qt_modules = [
+    "PyQt5.QtNetwork", "PyQt5.QtSql", "PyQt5.QtWebEngine", "PyQt5.QtWebEngineCore",
+    "PyQt5.QtWebEngineWidgets", "PyQt5.QtWebChannel", "PyQt5.QtWebSockets",
+    "PyQt5.QtQml", "PyQt5.QtQuick", "PyQt5.QtQuickWidgets",
+    "PyQt5.QtMultimedia", "PyQt5.QtMultimediaWidgets", "PyQt5.QtPrintSupport",
+    "PyQt5.QtSvg", "PyQt5.QtDBus", "PyQt5.QtXml", "PyQt5.QtXmlPatterns", "PyQt5.QtTest",
+    "PyQt5.QtOpenGL", "PyQt5.QtBluetooth", "PyQt5.QtNfc", "PyQt5.QtPositioning",
+    "PyQt5.QtLocation", "PyQt5.QtSensors", "PyQt5.QtSerialPort", "PyQt5.QtDesigner",
+    "PyQt5.QtHelp", "PyQt5.QtRemoteObjects", "PyQt5.QtTextToSpeech",
 ]
 
 build_exe_options = dict(
-    excludes=["tkinter", "tests"],
-    includes=["PyQt5", "smartcard"],
+    excludes=["tkinter", "tests"] + unused_qt_modules,
+    includes=["PyQt5.QtCore", "PyQt5.QtGui", "PyQt5.QtWidgets", "smartcard"],
     packages=["os", "sys", "anycubic_nfc_qt5"],
     include_files=include_files,
-    optimize=1,
+    # Reine Python-Pakete (stdlib etc.) in library.zip packen: beim Start wird dann
+    # ein einziges Archiv gelesen statt hunderter kleiner .pyc-Dateien.
+    # Ausgenommen: PyQt5/smartcard (Extension-Module + Qt-Plugins) und unser eigenes
+    # Paket, weil ac_filaments.ini zur Laufzeit beschrieben wird und die Icons
+    # relativ zum Paket aufgelöst werden.
+    zip_include_packages=["*"],
+    zip_exclude_packages=["PyQt5", "smartcard", "anycubic_nfc_qt5"],
+    optimize=2,  # strip asserts + docstrings from the bundled bytecode
 )
 
 # Auf macOS brauchst du kein spezielles Base für GUI; None ist ok.
@@ -2,55 +2,78 @@
 import sys
 import time
 import re
+import functools
+from collections import deque
+from contextlib import contextmanager
 from pathlib import Path
 from PyQt5 import QtWidgets, QtGui, QtCore
-from importlib import resources
-from smartcard.Exceptions import NoCardException
-
-from .config.filaments import load_filaments
-from anycubic_nfc_qt5.nfc.pcsc import (
-    list_readers,
-    connect_first_reader,
-    read_atr,
-    read_uid,
-    read_anycubic_fields,
-    interpret_anycubic,
-    write_anycubic_basic
+
+from .config.filaments import (
+    FilamentRecord, append_filament_line, load_filaments, normalize_hex_full, unique_colors,
+    update_color_for_sku,
 )
+# Registers the NFC icons under ":/icons/..." with Qt's resource system.
+# Regenerate after changing an icon (from the repository root):
+#   pyrcc5 src/anycubic_nfc_qt5/ui/resources/resources.qrc -o src/anycubic_nfc_qt5/ui/resources_rc.py
+from .ui import resources_rc  # noqa: F401
 
-# pyscard presence monitor (no APDU, just insert/remove)
-from smartcard.CardMonitoring import CardMonitor, CardObserver
-from smartcard.Exceptions import NoCardException
+# NOTE: pyscard (smartcard.*) and .nfc.pcsc / .nfc.monitor are imported lazily
+# inside the methods that use them, so loading pcsclite/WinSCard does not
+# delay window construction.
 
 PLACEHOLDER_FILAMENT = "select filament"
 PLACEHOLDER_COLOR = "select color"
+ICON_WIDTH = 100   # NFC state icons are pre-scaled once to this width
+LOG_FLUSH_MS = 200  # log lines are batched and appended at most this often
+CLOSE_WAIT_MS = 300  # closeEvent: max wait for a tag worker to disconnect the card
+LOG_MAX_LINES = 2000  # older log lines are dropped by the widget itself
+FILAMENT_INI = Path(__file__).resolve().parent / "config" / "ac_filaments.ini"  # resolved once
 
 
 # ------------------------- Helpers (module-level) -------------------------
 
+_SKU_BASE_RE = re.compile(r"[^A-Za-z0-9]")
+
+
 def sku_base(sku: str) -> str:
     """Return alphanumeric part before '-', e.g. 'AHHSCG-101' -> 'AHHSCG'."""
     if not sku:
         return ""
     head = sku.split("-", 1)[0]
-    return re.sub(r"[^A-Za-z0-9]", "", head)
+    if head.isascii() and head.isalnum():
+        return head  # common case, nothing to strip
+    return _SKU_BASE_RE.sub("", head)
+
+
+_HEX_RE = re.compile(r"#[0-9A-Fa-f]{6}")
 
 
 def normalize_hex(hex_str: str) -> str:
-    """Convert '#RRGGBBAA' -> '#RRGGBB'. Keep '#RRGGBB' unchanged."""
-    s = (hex_str or "").strip()
-    if not s.startswith("#"):
-        return "#000000"
-    if len(s) >= 9:
-        return s[:7].upper()
-    if len(s) == 7:
-        return s.upper()
+    """Convert '#RRGGBBAA' -> '#RRGGBB' (uppercased). Accepted after strip():
+    '#RRGGBB', and '#RRGGBB' followed by 2+ more characters (alpha etc., only the
+    first 7 characters are used). Anything else (no '#', 8 chars, non-hex digits)
+    yields '#000000'."""
+    return _normalize_hex6((hex_str or "").strip())
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_hex6(s: str) -> str:
+    # cached: the UI re-normalizes the same few colors
+    if len(s) == 7 or len(s) >= 9:
+        m = _HEX_RE.match(s)
+        if m:
+            return m.group(0).upper()
     return "#000000"
 
 
+def _fmt_hex(data) -> str:
+    """Bytes (or pyscard int list) as spaced uppercase hex, e.g. '04 A1 FF'."""
+    return bytes(data).hex(" ").upper()
+
+
 def color_core6(hex_str: str) -> str:
     """Return '#RRGGBB' uppercase for comparisons (drop alpha)."""
-    return normalize_hex(hex_str).upper()
+    return normalize_hex(hex_str)  # already uppercase
 
 
 def set_placeholder(combo: QtWidgets.QComboBox, text: str):
@@ -70,96 +93,291 @@ def set_placeholder(combo: QtWidgets.QComboBox, text: str):
     combo.setCurrentIndex(0)
 
 
-def _normalize_hex_full(h: str) -> str:
-    """Return '#RRGGBBAA' uppercase if possible; accept '#RRGGBB' -> '#RRGGBBFF'."""
-    s = (h or "").strip()
-    if not s.startswith("#"):
-        return "#000000FF"
-    s = s.upper()
-    if len(s) == 7:
-        return s + "FF"
-    if len(s) >= 9:
-        return s[:9]
-    return "#000000FF"
-
-
-def update_color_for_sku(sku: str, new_hex: str, file_path: Path | None = None) -> bool:
-    """
-    Update the color hex for a given full SKU in ac_filaments.ini.
-    Returns True on success, False on failure.
-    """
+@contextmanager
+def frozen(*widgets: QtWidgets.QWidget):
+    """Rebuild widgets silently: no change signals and no intermediate repaints.
+    Restored in reverse order on exit; re-enabling updates schedules one repaint."""
+    for w in widgets:
+        w.blockSignals(True)
+        w.setUpdatesEnabled(False)
     try:
-        ini_path = (file_path if file_path is not None
-                    else Path(__file__).parent / "ac_filaments.ini")
-        text = ini_path.read_text(encoding="utf-8", errors="ignore")
-        lines = text.splitlines()
-        changed = False
-        new_hex_full = _normalize_hex_full(new_hex)
-
-        out_lines = []
-        for ln in lines:
-            parts = [p.strip() for p in ln.split(";")]
-            if not parts or parts[0] != sku:
-                out_lines.append(ln)
-                continue
-            while len(parts) < 4:
-                parts.append("")
-            parts[3] = new_hex_full
-            out_lines.append(";".join(parts))
-            changed = True
-
-        if not changed:
-            return False
-
-        ini_path.write_text("\n".join(out_lines) + "\n", encoding="utf-8")
-        return True
-    except Exception:
-        return False
+        yield
+    finally:
+        for w in reversed(widgets):
+            w.setUpdatesEnabled(True)
+            w.blockSignals(False)
+
+
+def add_items_with_data(combo: QtWidgets.QComboBox, items):
+    """Append (text, userData) items in one model insert (single rowsInserted)
+    instead of one addItem() round-trip per entry."""
+    rows = []
+    for text, data in items:
+        it = QtGui.QStandardItem(text)
+        it.setData(data, QtCore.Qt.UserRole)
+        rows.append(it)
+    if rows:
+        combo.model().invisibleRootItem().appendRows(rows)
+
+
+def tint_image(img: QtGui.QImage, color_hex: str) -> QtGui.QImage:
+    """Copy of img with every visible pixel recolored to color_hex (alpha kept)."""
+    out = img.copy()
+    if out.isNull():
+        return out
+    p = QtGui.QPainter(out)
+    p.setCompositionMode(QtGui.QPainter.CompositionMode_SourceIn)
+    p.fillRect(out.rect(), QtGui.QColor(color_hex))
+    p.end()
+    return out
 
 
 # ------------------------------ UI Widgets --------------------------------
 
+class LazyComboBox(QtWidgets.QComboBox):
+    """QComboBox whose items can be built on first use (popup, keyboard, wheel)
+    instead of whenever the underlying list changes; see set_populator()."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._populator = None
+
+    def set_populator(self, fn):
+        """Defer fn() (appends the items) until the list is actually needed."""
+        self._populator = fn
+
+    def ensure_populated(self):
+        fn, self._populator = self._populator, None
+        if fn is not None:
+            fn()
+
+    def clear(self):
+        self._populator = None  # pending items belong to the old list
+        super().clear()
+
+    def showPopup(self):
+        self.ensure_populated()
+        super().showPopup()
+
+    def keyPressEvent(self, event):
+        self.ensure_populated()
+        super().keyPressEvent(event)
+
+    def wheelEvent(self, event):
+        self.ensure_populated()
+        super().wheelEvent(event)
+
+
 class ColorDot(QtWidgets.QWidget):
-    """Simple circular color indicator next to the color combo."""
+    """Simple circular color indicator next to the color combo.
+    The antialiased circle is rendered once per color/size into a QPixmap
+    (shared via QPixmapCache); paintEvent only blits it."""
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._pen = QtGui.QPen(QtGui.QColor("#444"), 1)
         self._color = QtGui.QColor("#000000")
+        self._pm = None  # rendered circle, rebuilt lazily in paintEvent
         self.setFixedSize(22, 22)
 
     def set_color_hex(self, hex_str: str):
-        """Set color from '#RRGGBB' string."""
-        self._color = QtGui.QColor(normalize_hex(hex_str))
+        """Set color from '#RRGGBB' string (no repaint if the color is unchanged)."""
+        color = QtGui.QColor(normalize_hex(hex_str))
+        if color == self._color:
+            return
+        self._color = color
+        self._pm = None
         self.update()
 
+    def resizeEvent(self, event):
+        self._pm = None
+        super().resizeEvent(event)
+
+    def _render(self) -> QtGui.QPixmap:
+        dpr = self.devicePixelRatioF()
+        key = f"colordot:{self.width()}x{self.height()}@{dpr}:{self._color.name()}"
+        pm = QtGui.QPixmapCache.find(key)
+        if pm is None or pm.isNull():
+            pm = QtGui.QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(QtCore.Qt.transparent)
+            p = QtGui.QPainter(pm)
+            p.setRenderHint(QtGui.QPainter.Antialiasing, True)
+            p.setPen(self._pen)
+            p.setBrush(self._color)
+            p.drawEllipse(self.rect().adjusted(2, 2, -2, -2))
+            p.end()
+            QtGui.QPixmapCache.insert(key, pm)
+        return pm
+
     def paintEvent(self, event):
+        if self._pm is None:
+            self._pm = self._render()
         p = QtGui.QPainter(self)
-        p.setRenderHint(QtGui.QPainter.Antialiasing, True)
-        r = self.rect().adjusted(2, 2, -2, -2)
-        p.setPen(QtGui.QPen(QtGui.QColor("#444"), 1))
-        p.setBrush(QtGui.QBrush(self._color))
-        p.drawEllipse(r)
+        p.drawPixmap(0, 0, self._pm)
         p.end()
 
 
 # ---------- Card presence monitor (no reading) ----------
 class _QtPresenceBridge(QtCore.QObject):
-    """Qt bridge object to emit signals from CardObserver callbacks (which run in a background thread)."""
+    """Qt bridge object to emit signals from pyscard observer callbacks (which run in a background thread).
+    The observers themselves live in .nfc.monitor (imported lazily)."""
     presenceChanged = QtCore.pyqtSignal(bool)  # True = card present, False = removed
+    readersChanged = QtCore.pyqtSignal(bool)   # True = at least one reader attached
+
+
+# ---------- Background workers (run in QThreadPool) ----------
+class _WorkerSignals(QtCore.QObject):
+    done = QtCore.pyqtSignal(object)  # result object, see the worker's run()
+    finished = QtCore.pyqtSignal()    # tag workers: card session torn down (after done)
 
 
-class _CardPresenceObserver(CardObserver):
-    """pyscard CardObserver that forwards insert/remove events to Qt via a bridge."""
-    def __init__(self, bridge: _QtPresenceBridge):
+class _IconWorker(QtCore.QRunnable):
+    """Decode, scale and tint the NFC state icon off the GUI thread.
+    Emits {state: QImage}; QPixmaps are created on the GUI thread only."""
+    STATES = {
+        "black": None,        # no reader connected
+        "red":   "#FF2600",   # reader present, no card
+        "green": "#78A942",   # card present (presence monitor)
+    }
+
+    def __init__(self):
         super().__init__()
-        self._bridge = bridge
+        self.sig = _WorkerSignals()
 
-    def update(self, observable, actions):
-        """Called by pyscard on card inserted/removed."""
-        (added, removed) = actions
-        if added and len(added) > 0:
-            self._bridge.presenceChanged.emit(True)
-        if removed and len(removed) > 0:
-            self._bridge.presenceChanged.emit(False)
+    def run(self):
+        images = {}
+        try:
+            base = QtGui.QImage(":/icons/nfc_black.png")
+            if base.isNull():
+                print("[WARN] Could not load nfc_black.png from Qt resources")
+            else:
+                base = base.scaledToWidth(ICON_WIDTH, QtCore.Qt.SmoothTransformation).convertToFormat(
+                    QtGui.QImage.Format_ARGB32_Premultiplied)
+                for state, tint in self.STATES.items():
+                    images[state] = tint_image(base, tint) if tint else base
+        finally:
+            self.sig.done.emit(images)
+
+
+class _ReaderCheckWorker(QtCore.QRunnable):
+    """list_readers() off the GUI thread (PC/SC IPC, can block for tens of ms).
+    Emits True if at least one reader is attached; False also without pyscard."""
+    def __init__(self):
+        super().__init__()
+        self.sig = _WorkerSignals()
+
+    def run(self):
+        available = False
+        try:
+            from .nfc.pcsc import invalidate_readers_cache, list_readers
+            invalidate_readers_cache()  # explicit check (startup / Refresh): enumerate again
+            available = bool(list_readers())
+        except ImportError:
+            pass  # no pyscard -> same as "no reader"
+        finally:
+            self.sig.done.emit(available)
+
+
+class _ReadWorker(QtCore.QRunnable):
+    """Connect + ATR/UID + Anycubic pages off the GUI thread (PC/SC calls block).
+    Result dict: status ('ok' | 'no_reader' | 'no_card' | 'connect_failed' | 'read_failed'
+    | 'cancelled'), plus 'atr', 'uid', 'info' as far as they were read and 'error' on failure."""
+    def __init__(self):
+        super().__init__()
+        self.sig = _WorkerSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        """Window is closing: skip the card session if it has not started yet."""
+        self._cancelled = True
+
+    def run(self):
+        res = {"status": "ok"}
+        conn = None
+        try:
+            from smartcard.Exceptions import NoCardException
+            from .nfc.pcsc import connect_first_reader, read_anycubic_fields
+
+            conn = connect_first_reader()
+            if conn is None:
+                res = {"status": "no_reader"}
+                return
+            if self._cancelled:
+                res = {"status": "cancelled"}
+                return
+            # 1) Nur den Verbindungsaufbau gezielt abfangen
+            try:
+                conn.connect()  # wirft NoCardException, wenn keine Karte aufgelegt ist
+            except NoCardException:
+                res = {"status": "no_card"}
+                return
+            except Exception as e:
+                res = {"status": "connect_failed", "error": e}
+                return
+            # 2) Ab hier ist die Karte verbunden – Fehler NICHT als „No card“ melden
+            # ATR/UID come with the Anycubic fields (one UID APDU, pages in 4-page blocks)
+            info = res["info"] = read_anycubic_fields(conn)
+            res["atr"] = info.get("atr") or b""
+            res["uid"] = info.get("uid")
+        except Exception as e:
+            res.update(status="read_failed", error=e)
+        finally:
+            # hand the result to the GUI first; the session teardown (can take tens
+            # of ms on some readers) then runs here without delaying the UI.
+            # The GUI keeps the worker "in flight" until `finished`: the default
+            # disconnect disposition unpowers the card, a new session must not overlap it
+            self.sig.done.emit(res)
+            if conn is not None:
+                try:
+                    conn.disconnect()
+                except Exception:
+                    pass
+            self.sig.finished.emit()
+
+
+class _WriteWorker(QtCore.QRunnable):
+    """Connect + write the basic Anycubic fields off the GUI thread.
+    Result dict: status ('ok' | 'no_reader' | 'no_card' | 'write_failed' | 'cancelled'),
+    plus 'results' (per-field flags of write_anycubic_basic) or 'error'."""
+    def __init__(self, **fields):
+        super().__init__()
+        self.sig = _WorkerSignals()
+        self._fields = fields  # sku, manufacturer, material, color_hex
+        self._cancelled = False
+
+    def cancel(self):
+        """Window is closing: skip the card session if it has not started yet."""
+        self._cancelled = True
+
+    def run(self):
+        res = {"status": "ok"}
+        conn = None
+        try:
+            from smartcard.Exceptions import NoCardException
+            from .nfc.pcsc import connect_first_reader, write_anycubic_basic
+
+            conn = connect_first_reader()
+            if conn is None:
+                res = {"status": "no_reader"}
+                return
+            if self._cancelled:
+                res = {"status": "cancelled"}
+                return
+            try:
+                conn.connect()
+            except NoCardException:
+                res = {"status": "no_card"}
+                return
+            res["results"] = write_anycubic_basic(conn, **self._fields)
+        except Exception as e:
+            res = {"status": "write_failed", "error": e}
+        finally:
+            self.sig.done.emit(res)  # see _ReadWorker.run: `finished` follows the disconnect
+            if conn is not None:
+                try:
+                    conn.disconnect()
+                except Exception:
+                    pass
+            self.sig.finished.emit()
 
 
 # ------------------------------- MainWindow --------------------------------
@@ -170,7 +388,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setWindowTitle("AnycubicNFCTaggerQT5 - V0.2")
         self.resize(800, 600)
 
-        self._filament_ini_path = Path(__file__).parent / "config" / "ac_filaments.ini"
+        self._filament_ini_path = FILAMENT_INI
         self._last_read_full_sku = ""
 
         central = QtWidgets.QWidget()
@@ -193,25 +411,23 @@ class MainWindow(QtWidgets.QMainWindow):
         icon_row.addWidget(self.btn_refresh)
         icon_row.addStretch()
 
-        # Load icons from packaged resources
+        # The icon is decoded/scaled/tinted once in the thread pool (see _IconWorker);
+        # until it arrives set_icon_state() only remembers the wanted state
         self.icons = {}
-        for state, fname in {
-            "black": "nfc_black.png",  # no reader connected
-            "red":   "nfc_red.png",    # reader present, no card
-            "green": "nfc_green.png",  # card present (presence monitor)
-        }.items():
-            try:
-                data = resources.files("anycubic_nfc_qt5.ui.resources").joinpath(fname).read_bytes()
-                pm = QtGui.QPixmap()
-                pm.loadFromData(data)
-                self.icons[state] = pm
-            except Exception as e:
-                print(f"[WARN] Could not load {fname}: {e}")
+        self._icon_worker = _IconWorker()
+        self._icon_worker.sig.done.connect(self._on_icons_loaded, QtCore.Qt.QueuedConnection)
+        QtCore.QThreadPool.globalInstance().start(self._icon_worker)
 
-        # internal state
-        self._icon_state = "black"
+        # internal state (no icon shown yet)
+        self._icon_state = None
+        self._icon_wanted = None
         self.reader_available = False
         self.card_present = False
+        self._actions_pending = False  # _update_actions already scheduled
+        self._actions_state = None     # last (read_enabled, write_enabled)
+        self._read_worker = None       # _ReadWorker in flight
+        self._write_worker = None      # _WriteWorker in flight
+        self._reader_check = None      # _ReaderCheckWorker in flight
 
         # === Selection row ===
         row = QtWidgets.QHBoxLayout()
@@ -228,7 +444,7 @@ class MainWindow(QtWidgets.QMainWindow):
         v_left.addWidget(self.combo_filament)
 
         # Right: color combo + color dot + hex label
-        self.combo_color = QtWidgets.QComboBox()
+        self.combo_color = LazyComboBox()  # items are built when first opened
         self.color_dot = ColorDot()
         self.color_hex_label = QtWidgets.QLabel("")
         right_row = QtWidgets.QHBoxLayout()
@@ -268,6 +484,13 @@ class MainWindow(QtWidgets.QMainWindow):
         log_row = QtWidgets.QHBoxLayout()
         self.output = QtWidgets.QPlainTextEdit()
         self.output.setReadOnly(True)
+        self.output.setMaximumBlockCount(LOG_MAX_LINES)
+        # batched logging: log() queues lines, _flush_log() appends them in one go
+        self._log_buf = deque()
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(LOG_FLUSH_MS)
+        self._log_timer.timeout.connect(self._flush_log)
         self.btn_clear_log = QtWidgets.QToolButton()
         self.btn_clear_log.setText("Clear Log")
         self.btn_clear_log.setToolTip("Clear the log window")
@@ -291,15 +514,15 @@ class MainWindow(QtWidgets.QMainWindow):
         set_placeholder(self.combo_filament, PLACEHOLDER_FILAMENT)
         set_placeholder(self.combo_color, PLACEHOLDER_COLOR)
         self.combo_color.setEnabled(False)
+        self._cur_filament = None  # filament the color combo was last built for
         self._set_color_indicator(None)
 
         # Load filaments
+        self._set_filaments({}, {})
         try:
-            self.by_filament, self.by_sku = load_filaments(None)
-            names = sorted(self.by_filament.keys(), key=str.casefold)
-            for name in names:
-                self.combo_filament.addItem(name)
-            self.log(f"Loaded {sum(len(v) for v in self.by_filament.values())} filament records.")
+            self._set_filaments(*load_filaments(None))
+            self.combo_filament.addItems(self._filament_names)
+            self.log(f"Loaded {self._total_records} filament records.")
         except Exception as e:
             self.log(f"[Error] Failed to load filaments: {e}")
 
@@ -308,70 +531,170 @@ class MainWindow(QtWidgets.QMainWindow):
         self.combo_color.currentTextChanged.connect(self.on_color_changed)
         self.btn_read.clicked.connect(self.on_read)
         self.btn_write.clicked.connect(self.on_write)
-        self.btn_refresh.clicked.connect(self.refresh_reader_status)
         self.btn_reset.clicked.connect(self.on_reset_selection) 
 
 
-        # Initial reader status + auto-refresh (no APDUs)
-        self.refresh_reader_status()
-        self.reader_timer = QtCore.QTimer(self)
-        self.reader_timer.setInterval(2000)           # only checks list_readers()
-        self.reader_timer.timeout.connect(self.refresh_reader_status)
-        self.reader_timer.start()
+        # pyscard/PC-SC is set up right after the window is shown (see _init_pcsc)
+        self.set_icon_state("black")
+        self._queue_update_actions()
+        QtCore.QTimer.singleShot(0, self._init_pcsc)
 
-        # Start presence monitor (no reading) → toggles green/red
+    def _init_pcsc(self):
+        """Initial reader status (no APDUs) + presence monitors, deferred so the
+        window appears before pyscard/libpcsclite are loaded. Afterwards reader
+        attach/detach is event-driven, "Refresh" re-checks manually."""
+        self.refresh_reader_status()
+        try:
+            # Start presence monitors (no reading) → toggles black/red/green
+            self._start_presence_monitors()
+        except ImportError as e:
+            self.log(f"[WARN] pyscard not available, reader functions disabled ({e}).")
+
+    def _start_presence_monitors(self):
+        """Attach pyscard reader/card observers; imports pyscard on first use."""
+        from .nfc.monitor import (
+            CardMonitor, ReaderMonitor, CardPresenceObserver, ReaderPresenceObserver,
+        )
         self._presence_bridge = _QtPresenceBridge()
-        self._presence_bridge.presenceChanged.connect(self.on_card_presence_changed)
+        # observers emit from pyscard threads -> always queue onto the GUI thread
+        self._presence_bridge.presenceChanged.connect(self.on_card_presence_changed, QtCore.Qt.QueuedConnection)
+        self._presence_bridge.readersChanged.connect(self.on_readers_changed, QtCore.Qt.QueuedConnection)
+        self._reader_monitor = ReaderMonitor()
+        self._reader_observer = ReaderPresenceObserver(self._presence_bridge)
+        self._reader_monitor.addObserver(self._reader_observer)
         self._card_monitor = CardMonitor()
-        self._presence_observer = _CardPresenceObserver(self._presence_bridge)
+        self._presence_observer = CardPresenceObserver(self._presence_bridge)
         self._card_monitor.addObserver(self._presence_observer)
 
-        self._update_actions()
-
     # === UI Helpers ===
 
     def clear_log(self):
-        """Clear the text log."""
+        """Clear the text log (including lines not yet flushed)."""
+        self._log_buf.clear()
         self.output.clear()
 
     def set_icon_state(self, key: str):
         """Set icon by state key: 'black' (no reader), 'red' (reader no card), 'green' (card present)."""
+        if key == self._icon_state:
+            return  # already shown, skip repaint
+        self._icon_wanted = key
+        if self._icon_worker is not None:
+            return  # icons still loading, _on_icons_loaded() shows it
         pix = self.icons.get(key)
         if not pix or pix.isNull():
             self.icon_label.setText("[missing icon]")
             return
-        self.icon_label.setPixmap(pix.scaledToWidth(100, QtCore.Qt.SmoothTransformation))
+        self.icon_label.setPixmap(pix)
         self._icon_state = key
 
+    def _on_icons_loaded(self, images: dict):
+        """Slot for _IconWorker: build the pixmaps on the GUI thread and show the current state."""
+        self._icon_worker = None
+        self.icons = {state: QtGui.QPixmap.fromImage(img) for state, img in images.items()}
+        if self._icon_wanted is not None:
+            self.set_icon_state(self._icon_wanted)
+
     def refresh_reader_status(self):
-        """Detect reader presence once and update UI (icon + buttons)."""
-        self.reader_available = bool(list_readers())
+        """Detect reader presence once (in the thread pool) and update UI (icon + buttons)."""
+        if self._reader_check is not None:
+            return  # a check is already running, its result is applied
+        self._reader_check = _ReaderCheckWorker()
+        self._reader_check.sig.done.connect(self._on_reader_checked, QtCore.Qt.QueuedConnection)
+        QtCore.QThreadPool.globalInstance().start(self._reader_check)
+
+    def _on_reader_checked(self, available: bool):
+        """Slot for _ReaderCheckWorker."""
+        self._reader_check = None
+        self._apply_reader_state(available)
+
+    def _apply_reader_state(self, available: bool):
+        """Store reader availability and update UI (icon + buttons) on transitions only."""
+        if available == self.reader_available and self._icon_state is not None:
+            return  # unchanged; card presence keeps the icon current on its own
+        self.reader_available = available
         if not self.reader_available:
             self.card_present = False
             self.set_icon_state("black")
         else:
             self.set_icon_state("green" if self.card_present else "red")
-        self._update_actions()
+        self._queue_update_actions()
+
+    def _set_filaments(self, by_filament: dict, by_sku: dict):
+        """Store loaded filament data and derive the lookup tables used by the combos."""
+        self.by_filament, self.by_sku = by_filament, by_sku
+        self._filament_names = list(by_filament)  # already sorted by load_filaments
+        self._total_records = sum(map(len, by_filament.values()))
+        # SKU base ('AHHSCG' of 'AHHSCG-101') -> [(sku, rec), ...] in INI order
+        self._by_sku_base = {}
+        for sku, rec in by_sku.items():
+            head, sep, _ = sku.partition("-")
+            if sep:
+                self._by_sku_base.setdefault(head, []).append((sku, rec))
+        # keyed by the exact filament name (= combo text); names differing only in
+        # case are separate INI entries, casefold() is only used for the sort order
+        self._colors_by_filament = unique_colors(by_filament)
+        # color -> row in the color combo (row 0 = placeholder), same order as above
+        self._color_rows = {
+            k: {color: row for row, (color, _sku, _hex) in enumerate(colors, 1)}
+            for k, colors in self._colors_by_filament.items()
+        }
 
     def _set_sku(self, sku: str | None):
         """Update prominent SKU label."""
         self.sku_label.setText(f"SKU: {sku}" if sku else "")
 
     def log(self, msg: str):
-        self.output.appendPlainText(msg)
+        """Queue a log line; lines are appended in batches every LOG_FLUSH_MS."""
+        self._log_buf.append(msg)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        """Append all queued log lines with a single appendPlainText (one relayout)."""
+        if not self._log_buf:
+            return
+        lines = list(self._log_buf)
+        self._log_buf.clear()
+        self.output.appendPlainText("\n".join(lines))
+
+    def _patch_record_color(self, sku: str, rec: FilamentRecord):
+        """After an in-place INI color edit: refresh the derived color tables and,
+        if the color combo currently lists this SKU, its item data + indicator."""
+        self._set_filaments(self.by_filament, self.by_sku)
+        if self._cur_filament != rec.filament:
+            return
+        row = self._color_rows.get(rec.filament, {}).get(rec.color, 0)
+        data = self.combo_color.itemData(row) if row > 0 else None
+        if data and data[0] == sku:
+            self.combo_color.setItemData(row, (sku, rec.color_hex))
+            if row == self.combo_color.currentIndex():
+                self._set_color_indicator(rec.color_hex)
+
+    def _queue_update_actions(self):
+        """Schedule _update_actions for the next event-loop pass; one user action often
+        goes through several handlers, this collapses them into a single update."""
+        if self._actions_pending:
+            return
+        self._actions_pending = True
+        QtCore.QTimer.singleShot(0, self._update_actions)
 
     def _update_actions(self):
         """Enable/disable buttons based on selection state and reader/card availability."""
+        self._actions_pending = False
         filament_ok = self.combo_filament.currentIndex() > 0
         color_ok = self.combo_color.isEnabled() and self.combo_color.currentIndex() > 0
         reader_ok = self.reader_available
         card_ok = getattr(self, "card_present", False)
 
-        # READ: reader required
-        self.btn_read.setEnabled(reader_ok)
-
-        # WRITE: reader + card + valid selection
-        self.btn_write.setEnabled(reader_ok and card_ok and filament_ok and color_ok)
+        # READ: reader required; WRITE: reader + card + valid selection; neither while tag I/O is in flight
+        idle = self._read_worker is None and self._write_worker is None
+        state = (reader_ok and idle,
+                 reader_ok and card_ok and filament_ok and color_ok and idle)
+        if state == self._actions_state:
+            return
+        self._actions_state = state
+        self.btn_read.setEnabled(state[0])
+        self.btn_write.setEnabled(state[1])
 
     def _set_color_indicator(self, hex_str: str | None):
         """Update the color dot and hex text (expects '#RRGGBB' or None)."""
@@ -383,9 +706,11 @@ class MainWindow(QtWidgets.QMainWindow):
         self.color_dot.set_color_hex(rgb)
         self.color_hex_label.setText(rgb)
 
-    def _select_by_sku(self, sku_read: str) -> bool:
-        """Preselect filament & color strictly by SKU base (ignore numeric part)."""
-        base = sku_base(sku_read)
+    def _select_by_sku(self, sku_read: str, base: str | None = None) -> bool:
+        """Preselect filament & color strictly by SKU base (ignore numeric part).
+        base: sku_base(sku_read) if the caller already has it."""
+        if base is None:
+            base = sku_base(sku_read)
         if not base:
             self.log(f"[INFO] Keine gültige SKU-Basis für '{sku_read}' ermittelt.")
             return False
@@ -397,7 +722,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Filament auswählen
         filament_name = chosen.filament
-        idx_f = self.combo_filament.findText(filament_name, QtCore.Qt.MatchFixedString)
+        idx_f = self.combo_filament.findText(filament_name, QtCore.Qt.MatchFixedString | QtCore.Qt.MatchCaseSensitive)
         if idx_f <= 0:
             self.log(f"[INFO] Filament '{filament_name}' nicht in Liste gefunden.")
             return False
@@ -405,57 +730,66 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Farbe auswählen (Items: Text=color, Data=(sku, hex))
         color_name = chosen.color
-        for i in range(1, self.combo_color.count()):
-            if self.combo_color.itemText(i) == color_name:
-                self.combo_color.setCurrentIndex(i)
-                break
-        else:
+        row = self._color_rows.get(filament_name, {}).get(color_name, 0)
+        if row <= 0:
             self.log(f"[INFO] Farbe '{color_name}' nicht in Liste für '{filament_name}'.")
             return False
+        self.combo_color.ensure_populated()
+        self.combo_color.setCurrentIndex(row)
 
         self.log(f"[DBG] Vorauswahl anhand SKU-Basis '{base}' (Match: {sku_key}).")
         return True
 
-    def _reload_filaments(self, reseat_by_sku: bool = True):
+    def _reload_filaments(self, reseat_by_sku: bool = True, added: FilamentRecord | None = None):
         """Reload ac_filaments.ini into memory and refresh combos.
+        added: record that was just appended to the INI; it is patched into the
+        in-memory tables instead of re-parsing the whole file.
         If reseat_by_sku is True and a last-read full SKU exists,
         try to auto-select via SKU base; otherwise restore previous selections."""
         # remember current selections (by text)
         prev_filament = self.combo_filament.currentText() if self.combo_filament.currentIndex() > 0 else None
         prev_color = self.combo_color.currentText() if self.combo_color.currentIndex() > 0 else None
 
-        try:
-            self.by_filament, self.by_sku = load_filaments(None)
-        except Exception as e:
-            self.log(f"[ERROR] Reload filaments failed: {e}")
-            return
-
-        # rebuild filament combo
-        self.combo_filament.blockSignals(True)
-        set_placeholder(self.combo_filament, PLACEHOLDER_FILAMENT)
-        names = sorted(self.by_filament.keys(), key=str.casefold)
-        for name in names:
-            self.combo_filament.addItem(name)
-        self.combo_filament.blockSignals(False)
+        if added is not None:
+            by_filament, by_sku = self.by_filament, self.by_sku
+            by_sku[added.sku] = added
+            if added.filament in by_filament:
+                by_filament[added.filament].append(added)
+            else:
+                by_filament[added.filament] = [added]
+                by_filament = {k: by_filament[k] for k in sorted(by_filament, key=str.casefold)}
+            self._set_filaments(by_filament, by_sku)
+        else:
+            try:
+                self._set_filaments(*load_filaments(None))
+            except Exception as e:
+                self.log(f"[ERROR] Reload filaments failed: {e}")
+                return
 
-        # default: reset color box
-        set_placeholder(self.combo_color, PLACEHOLDER_COLOR)
+        # rebuild filament combo, default: reset color box
+        with frozen(self.combo_filament, self.combo_color):
+            set_placeholder(self.combo_filament, PLACEHOLDER_FILAMENT)
+            self.combo_filament.addItems(self._filament_names)
+            set_placeholder(self.combo_color, PLACEHOLDER_COLOR)
         self.combo_color.setEnabled(False)
+        self._cur_filament = None
         self._set_color_indicator(None)
+        self._set_sku(None)
 
         # reseat preference
         if reseat_by_sku and getattr(self, "_last_read_full_sku", ""):
             if self._select_by_sku(self._last_read_full_sku):
                 # _select_by_sku setzt die Farbe & rebuildet die Color-Combo
-                self._update_actions()
+                self._queue_update_actions()
                 return
 
         # try to restore previous selection by text
         if prev_filament:
-            idx_f = self.combo_filament.findText(prev_filament, QtCore.Qt.MatchFixedString)
+            idx_f = self.combo_filament.findText(prev_filament, QtCore.Qt.MatchFixedString | QtCore.Qt.MatchCaseSensitive)
             if idx_f > 0:
                 self.combo_filament.setCurrentIndex(idx_f)  # triggers on_filament_changed -> rebuilds color combo
                 if prev_color:
+                    self.combo_color.ensure_populated()
                     idx_c = self.combo_color.findText(prev_color, QtCore.Qt.MatchFixedString)
                     if idx_c > 0:
                         self.combo_color.setCurrentIndex(idx_c)
@@ -464,41 +798,24 @@ class MainWindow(QtWidgets.QMainWindow):
                         if data and len(data) >= 2:
                             self._set_color_indicator(data[1])
 
-        self._update_actions()
+        self._queue_update_actions()
 
-    def _append_ini_line(self, sku: str, filament: str, color_name: str, color_hex: str) -> bool:
+    def _append_ini_line(self, sku: str, filament: str, color_name: str, color_hex: str) -> FilamentRecord | None:
         """
         Append a new line to ac_filaments.ini in the form:
         SKU;FILAMENT;COLOR;#RRGGBBAA
-        Returns True on success, False on failure.
+        Returns the appended record on success, None on failure.
         """
         try:
-            ini_path = self._filament_ini_path
-            # normalize fields
-            sku = (sku or "").strip()
-            filament = (filament or "").strip()
-            color_name = (color_name or "").strip()
-            color_hex = (color_hex or "").strip().upper()
-            if not color_hex.startswith("#"):
-                color_hex = "#" + color_hex
-            if len(color_hex) == 7:
-                color_hex += "FF"
-
-            if not (sku and filament and color_name):
-                self.log("[ERROR] _append_ini_line: missing required fields.")
-                return False
-
-            new_line = f"{sku};{filament};{color_name};{color_hex}"
-
-            with open(ini_path, "a", encoding="utf-8") as f:
-                # Ensure newline if file doesn’t end with one
-                f.write(("\n" if not str(ini_path.read_text()).endswith("\n") else "") + new_line + "\n")
-
-            self.log(f"[DBG] Added new line to INI: {new_line}")
-            return True
+            rec = append_filament_line(sku, filament, color_name, color_hex, self._filament_ini_path)
+        except ValueError:
+            self.log("[ERROR] _append_ini_line: missing required fields.")
+            return None
         except Exception as e:
             self.log(f"[ERROR] _append_ini_line failed: {e}")
-            return False
+            return None
+        self.log(f"[DBG] Added new line to INI: {rec.sku};{rec.filament};{rec.color};{rec.color_hex}")
+        return rec
 
     def _find_ini_record_for_base(self, base: str):
         """Find config record by SKU base only (e.g. 'AHHSCG'), ignoring the numeric suffix.
@@ -506,7 +823,7 @@ class MainWindow(QtWidgets.QMainWindow):
         Returns (sku_key, rec) or (None, None)."""
         if not base:
             return (None, None)
-        candidates = [(k, v) for (k, v) in self.by_sku.items() if k.startswith(base + "-")]
+        candidates = self._by_sku_base.get(base)
         if not candidates:
             self.log(f"[DBG] _find_ini_record_for_base: no candidates for base '{base}'")
             return (None, None)
@@ -523,7 +840,12 @@ class MainWindow(QtWidgets.QMainWindow):
         # Fallback: first candidate
         return candidates[0]
 
-    # === Presence callback (no reading) ===
+    # === Presence callbacks (no reading) ===
+    @QtCore.pyqtSlot(bool)
+    def on_readers_changed(self, available: bool):
+        """React to reader attach/detach events without polling list_readers()."""
+        self._apply_reader_state(available)
+
     @QtCore.pyqtSlot(bool)
     def on_card_presence_changed(self, present: bool):
         """React to card insert/remove events without reading any data."""
@@ -532,7 +854,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.set_icon_state("black")
         else:
             self.set_icon_state("green" if present else "red")
-        self._update_actions()
+        self._queue_update_actions()
 
     # === Selection handlers ===
     def on_filament_changed(self, filament_name: str):
@@ -540,104 +862,126 @@ class MainWindow(QtWidgets.QMainWindow):
         if self.combo_filament.currentIndex() == 0 or filament_name == PLACEHOLDER_FILAMENT:
             set_placeholder(self.combo_color, PLACEHOLDER_COLOR)
             self.combo_color.setEnabled(False)
+            self._cur_filament = None
             self._set_color_indicator(None)
             self._set_sku(None)
-            self._update_actions()
+            self._queue_update_actions()
             return
 
+        if filament_name == self._cur_filament:
+            return  # color combo already built for this filament
         records = self.by_filament.get(filament_name, [])
         self.log(f"Selected filament: {filament_name} ({len(records)} variants)")
 
-        set_placeholder(self.combo_color, PLACEHOLDER_COLOR)
+        # only the placeholder now; the colors are appended when the list is first
+        # opened/scrolled or a color is preselected (LazyComboBox.ensure_populated)
+        with frozen(self.combo_color):
+            set_placeholder(self.combo_color, PLACEHOLDER_COLOR)
+        self.combo_color.set_populator(functools.partial(self._fill_color_combo, filament_name))
         self.combo_color.setEnabled(True)
-        seen = set()
-        for rec in records:
-            if rec.color not in seen:
-                self.combo_color.addItem(rec.color, (rec.sku, rec.color_hex))
-                seen.add(rec.color)
+        self._cur_filament = filament_name
 
         self._set_color_indicator(None)
         self._set_sku(None)
-        self._update_actions()
+        self._queue_update_actions()
+
+    def _fill_color_combo(self, key: str):
+        """Populator for combo_color: append the colors of filament `key`."""
+        # silently: appending must not fire on_color_changed (placeholder stays current)
+        with frozen(self.combo_color):
+            add_items_with_data(self.combo_color, [
+                (color, (sku, color_hex))
+                for color, sku, color_hex in self._colors_by_filament.get(key, ())
+            ])
 
     def on_color_changed(self, color_name: str):
         """Update color dot on color selection."""
         if self.combo_color.currentIndex() == 0 or color_name == PLACEHOLDER_COLOR:
             self._set_color_indicator(None)
             self._set_sku(None)
-            self._update_actions()
+            self._queue_update_actions()
             return
         data = self.combo_color.currentData()  # (sku, color_hex)
         if data:
             sku, hex_str = data
-            self._set_color_indicator(hex_str)
+            rgb = normalize_hex(hex_str)
+            self._set_color_indicator(rgb)
             self._set_sku(sku)
-            self.log(f"Selected color: {color_name} [{normalize_hex(hex_str)}], SKU={sku}")
-        self._update_actions()
+            self.log(f"Selected color: {color_name} [{rgb}], SKU={sku}")
+        self._queue_update_actions()
 
     # === Buttons ===
 
     def on_read(self):
-        """On-demand read: connect once; log ATR/UID; parse Anycubic; compare/update INI color."""
-        self.refresh_reader_status()
+        """On-demand read: tag I/O runs in a _ReadWorker, _on_read_done logs ATR/UID,
+        parses Anycubic data and compares/updates the INI color."""
+        # reader_available is kept current by the reader monitor, no re-enumeration here
         if not self.reader_available:
             self.log("[ERROR] No NFC reader connected.")
             return
-
-        conn = connect_first_reader()
-        if conn is None:
+        if self._read_worker is not None or self._write_worker is not None:
+            return  # tag I/O already in flight
+        self._read_worker = _ReadWorker()
+        self._read_worker.sig.done.connect(self._on_read_done, QtCore.Qt.QueuedConnection)
+        self._read_worker.sig.finished.connect(self._on_read_finished, QtCore.Qt.QueuedConnection)
+        self._queue_update_actions()  # disables READ while in flight
+        QtCore.QThreadPool.globalInstance().start(self._read_worker)
+
+    @QtCore.pyqtSlot()
+    def _on_read_finished(self):
+        """_ReadWorker has disconnected: READ/WRITE may start a new card session."""
+        self._read_worker = None
+        self._queue_update_actions()
+
+    @QtCore.pyqtSlot(object)
+    def _on_read_done(self, res: dict):
+        """Handle a _ReadWorker result on the GUI thread (logging, dialogs, INI, combos)."""
+        from .nfc.pcsc import interpret_anycubic
+        status = res.get("status")
+        if status == "cancelled":
+            return  # window is closing
+        if status == "no_reader":
+            # may be a transient PC/SC error: re-check instead of disabling READ/WRITE
+            # until the next reader event (there is no poll timer any more)
             self.log("[ERROR] No NFC reader available.")
-            self.reader_available = False
-            self.set_icon_state("black")
-            self._update_actions()
+            self.refresh_reader_status()
             return
-
-        # 1) Nur den Verbindungsaufbau gezielt abfangen
-        try:
-            conn.connect()  # wirft NoCardException, wenn keine Karte aufgelegt ist
-        except NoCardException:
+        if status == "no_card":
             if self.reader_available:
                 self.set_icon_state("red")
             self.log("[INFO] No card detected. Place a tag on the reader and try again.")
-            try:
-                conn.disconnect()
-            except Exception:
-                pass
             return
-        except Exception as e:
+        if status == "connect_failed":
             # Unerwarteter Fehler beim Verbinden
-            self.log(f"[ERROR] Connect failed: {e}")
-            try:
-                conn.disconnect()
-            except Exception:
-                pass
+            self.log(f"[ERROR] Connect failed: {res['error']}")
             return
 
-        # 2) Ab hier ist die Karte verbunden – alle anderen Fehler NICHT als „No card“ melden
-        try:
-            # ATR/UID
-            atr = read_atr(conn) or b""
-            uid, sw1, sw2 = read_uid(conn)
-            if atr:
-                self.log(f"[OK] ATR: {' '.join(f'{x:02X}' for x in atr)}")
-            if uid is not None:
-                self.log(f"[OK] UID: {' '.join(f'{x:02X}' for x in uid)}")
-            else:
-                self.log("[INFO] UID not available on this reader/card.")
+        # ATR/UID
+        atr, uid = res.get("atr"), res.get("uid")
+        if atr:
+            self.log(f"[OK] ATR: {_fmt_hex(atr)}")
+        if uid is not None:
+            self.log(f"[OK] UID: {_fmt_hex(uid)}")
+        elif "uid" in res:
+            self.log("[INFO] UID not available on this reader/card.")
+        if status == "read_failed":
+            self.log(f"[ERROR] Read failed: {res['error']}")
+            return
 
+        try:
             # Anycubic-Rohdaten
-            info = read_anycubic_fields(conn)
+            info = res["info"]
 
             # --- Farbe vom Tag vs. INI vergleichen & ggf. speichern (Basis-Suche) ---
-            self._last_read_full_sku = info.get("sku") or ""
+            sku = self._last_read_full_sku = info.get("sku") or ""
             tag_hex_full = (info.get("color_hex") or "").upper()
-            base = sku_base(self._last_read_full_sku)
+            base = sku_base(sku)
 
             if base and tag_hex_full:
                 sku_key, ini_rec = self._find_ini_record_for_base(base)
                 if not ini_rec:
                     msg = (f"No INI entry for SKU base '{base}'.\n"
-                        f"Create new INI entry for full SKU '{self._last_read_full_sku}' with tag color {tag_hex_full}?")
+                        f"Create new INI entry for full SKU '{sku}' with tag color {tag_hex_full}?")
                     ans = QtWidgets.QMessageBox.question(
                         self, "Add new INI entry?", msg,
                         QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
@@ -646,10 +990,11 @@ class MainWindow(QtWidgets.QMainWindow):
                     if ans == QtWidgets.QMessageBox.Yes:
                         filament_name = self.combo_filament.currentText().strip() if self.combo_filament.currentIndex() > 0 else ((info.get("material") or "").strip() or "Unknown")
                         color_name = self.combo_color.currentText().strip() if self.combo_color.currentIndex() > 0 else "Unknown"
-                        if self._append_ini_line(self._last_read_full_sku, filament_name, color_name, tag_hex_full):
-                            self.log(f"[OK] Added INI entry: {self._last_read_full_sku};{filament_name};{color_name};{tag_hex_full}")
-                            self._reload_filaments(reseat_by_sku=True)
-                            self.log(f"[OK] Reload INI: {self._last_read_full_sku};{filament_name};{color_name};{tag_hex_full}")
+                        added = self._append_ini_line(sku, filament_name, color_name, tag_hex_full)
+                        if added:
+                            self.log(f"[OK] Added INI entry: {sku};{filament_name};{color_name};{tag_hex_full}")
+                            self._reload_filaments(reseat_by_sku=True, added=added)
+                            self.log(f"[OK] Reload INI: {sku};{filament_name};{color_name};{tag_hex_full}")
 
                         else:
                             self.log("[ERROR] Could not add new INI entry.")
@@ -675,14 +1020,7 @@ class MainWindow(QtWidgets.QMainWindow):
                             if ok:
                                 self.log(f"[OK] Updated INI color for {sku_key} -> {tag_hex_full}")
                                 ini_rec.color_hex = tag_hex_full
-                                if self.combo_color.currentIndex() > 0:
-                                    data = self.combo_color.currentData()
-                                    if data and data[0] == sku_key:
-                                        self.combo_color.setItemData(
-                                            self.combo_color.currentIndex(),
-                                            (sku_key, tag_hex_full)
-                                        )
-                                        self._set_color_indicator(tag_hex_full)
+                                self._patch_record_color(sku_key, ini_rec)
                             else:
                                 self.log("[ERROR] Failed to update ac_filaments.ini — check path/permissions.")
                     else:
@@ -694,14 +1032,12 @@ class MainWindow(QtWidgets.QMainWindow):
                     self.log("[DBG] skip color compare: no color_hex on tag")
 
             # Anzeige/Auto-Select
-            from anycubic_nfc_qt5.nfc.pcsc import interpret_anycubic
             nice = interpret_anycubic(info)
-            sku = info.get("sku") or ""
             mat = info.get("material") or ""
             if sku:
                 self._set_sku(sku)
                 self.log(f"[OK] SKU: {sku}")
-                if self._select_by_sku(sku):
+                if self._select_by_sku(sku, base):
                     self.log("[OK] Vorauswahl per SKU-Basis gesetzt (Filament & Color).")
             else:
                 self.log("[INFO] Keine SKU erkannt.")
@@ -719,35 +1055,20 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.log(f"[OK] Spulen-Gewicht: {fr['spool_weight_g']} g ({fr['spool_weight_kg']:.3f} kg)")
 
         except Exception as e:
-            # Irgendein *anderer* Fehler beim Lesen/Parsen → als Error loggen,
-            # NICHT als "No card" (die Karte ist ja verbunden)
+            # Irgendein *anderer* Fehler beim Parsen/Auswerten → als Error loggen,
+            # NICHT als "No card" (die Karte war ja verbunden)
             self.log(f"[ERROR] Read failed: {e}")
-        finally:
-            try:
-                conn.disconnect()
-            except Exception:
-                pass
 
     def on_reset_selection(self):
         """Reset both combo boxes to their placeholders, clear SKU and color indicator."""
-        # Block signals to avoid triggering change handlers during reset
-        self.combo_filament.blockSignals(True)
-        self.combo_color.blockSignals(True)
-
-        set_placeholder(self.combo_filament, PLACEHOLDER_FILAMENT)
-        set_placeholder(self.combo_color, PLACEHOLDER_COLOR)
+        # Block signals to avoid triggering change handlers during reset.
+        # Filament names stay in the combo (needed for auto-select on READ),
+        # only jump back to the placeholder instead of clearing + re-adding them
+        with frozen(self.combo_filament, self.combo_color):
+            self.combo_filament.setCurrentIndex(0)
+            set_placeholder(self.combo_color, PLACEHOLDER_COLOR)
         self.combo_color.setEnabled(False)
-
-        # Re-populate filament names so auto-select on READ works after reset
-        try:
-            names = sorted(self.by_filament.keys(), key=str.casefold)
-            for name in names:
-                self.combo_filament.addItem(name)
-        except Exception:
-            pass
-
-        self.combo_filament.blockSignals(False)
-        self.combo_color.blockSignals(False)
+        self._cur_filament = None
 
         # Clear helpers/labels
         self._set_color_indicator(None)
@@ -755,19 +1076,21 @@ class MainWindow(QtWidgets.QMainWindow):
         self._last_read_full_sku = ""
 
         # Update UI state and inform user
-        self._update_actions()
+        self._queue_update_actions()
         self.log("[INFO] Selection reset.")
 
     def on_write(self):
-        """Write basic Anycubic fields to the tag currently present."""
-        # Reader + UI state checks
-        self.refresh_reader_status()
+        """Write basic Anycubic fields to the tag currently present.
+        Tag I/O runs in a _WriteWorker, _on_write_done logs the per-field results."""
+        # Reader + UI state checks (reader_available is kept current by the reader monitor)
         if not self.reader_available:
             self.log("[ERROR] No NFC reader connected.")
             return
         if not self.card_present:
             self.log("[INFO] No card detected. Place a tag on the reader first.")
             return
+        if self._read_worker is not None or self._write_worker is not None:
+            return  # tag I/O already in flight
 
         filament_ok = self.combo_filament.currentIndex() > 0
         color_ok = self.combo_color.isEnabled() and self.combo_color.currentIndex() > 0
@@ -777,82 +1100,99 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Collect values from UI
         material = self.combo_filament.currentText().strip()  # e.g., 'PLA High Speed'
-        color_name = self.combo_color.currentText().strip()
         data = self.combo_color.currentData()  # (sku, color_hex)
         if not data or len(data) < 2:
             self.log("[ERROR] Internal error: no SKU/color data attached to color item.")
             return
 
         full_sku = data[0] or ""          # full SKU (e.g. 'AHHSCG-101')
-        color_hex_full = (data[1] or "").upper()  # may be '#RRGGBB' or '#RRGGBBAA'
-        if color_hex_full and len(color_hex_full) == 7:
-            color_hex_full += "FF"  # ensure alpha
+        # may be '#RRGGBB' or '#RRGGBBAA' -> always with alpha
+        color_hex_full = normalize_hex_full(data[1]) if data[1] else ""
 
         manufacturer = "AC"  # default for now
 
-        # Connect to reader
-        conn = connect_first_reader()
-        if conn is None:
+        self.log(f"[INFO] Writing tag… SKU={full_sku}, Material={material}, Color={color_hex_full}, Manufacturer={manufacturer}")
+        self._write_worker = _WriteWorker(
+            sku=full_sku,
+            manufacturer=manufacturer,
+            material=material,
+            color_hex=color_hex_full,
+        )
+        self._write_worker.sig.done.connect(self._on_write_done, QtCore.Qt.QueuedConnection)
+        self._write_worker.sig.finished.connect(self._on_write_finished, QtCore.Qt.QueuedConnection)
+        self._queue_update_actions()  # disables READ/WRITE while in flight
+        QtCore.QThreadPool.globalInstance().start(self._write_worker)
+
+    @QtCore.pyqtSlot()
+    def _on_write_finished(self):
+        """_WriteWorker has disconnected: READ/WRITE may start a new card session."""
+        self._write_worker = None
+        self._queue_update_actions()
+
+    @QtCore.pyqtSlot(object)
+    def _on_write_done(self, res: dict):
+        """Handle a _WriteWorker result on the GUI thread."""
+        status = res.get("status")
+        if status == "cancelled":
+            return  # window is closing
+        if status == "no_reader":
+            # may be a transient PC/SC error: re-check instead of disabling READ/WRITE
+            # until the next reader event (there is no poll timer any more)
             self.log("[ERROR] No NFC reader available.")
-            self.reader_available = False
-            self.set_icon_state("black")
-            self._update_actions()
+            self.refresh_reader_status()
             return
-
-        try:
-            try:
-                conn.connect()
-            except NoCardException:
+        if status == "no_card":
+            if self.reader_available:
                 self.set_icon_state("red")
-                self.log("[INFO] No card detected. Place a tag on the reader and try again.")
-                return
+            self.log("[INFO] No card detected. Place a tag on the reader and try again.")
+            return
+        if status == "write_failed":
+            self.log(f"[ERROR] Write failed: {res['error']}")
+            return
 
-            # Perform write
-            self.log(f"[INFO] Writing tag… SKU={full_sku}, Material={material}, Color={color_hex_full}, Manufacturer={manufacturer}")
-            res = write_anycubic_basic(
-                conn,
-                sku=full_sku,
-                manufacturer=manufacturer,
-                material=material,
-                color_hex=color_hex_full,
-            )
-
-            # Summarize results
-            ok_sku    = res.get("p05_sku", False)
-            ok_manu   = res.get("p0A_manu", False)
-            ok_mat    = res.get("p0F_mat", False)
-            ok_color  = res.get("p14_color", False)
-
-            self.log(f"[{'OK' if ok_sku else 'ERR'}] Write p05 (SKU)")
-            self.log(f"[{'OK' if ok_manu else 'ERR'}] Write p10 (Manufacturer)")
-            self.log(f"[{'OK' if ok_mat else 'ERR'}] Write p15 (Material)")
-            self.log(f"[{'OK' if ok_color else 'ERR'}] Write p20 (Color)")
-
-            if all((ok_sku, ok_manu, ok_mat, ok_color)):
-                self.log("[OK] Basic data written successfully.")
-            else:
-                self.log("[WARN] Some fields could not be written. The tag may be locked or protected.")
+        # Summarize results
+        results = res["results"]
+        ok_sku    = results.get("p05_sku", False)
+        ok_manu   = results.get("p0A_manu", False)
+        ok_mat    = results.get("p0F_mat", False)
+        ok_color  = results.get("p14_color", False)
 
-            # Optional: sofort verifizieren (READ erneut ausführen)
-            # -> du kannst hier `self.on_read()` rufen, wenn du die Werte gleich prüfen willst
-            # self.on_read()
+        self.log(f"[{'OK' if ok_sku else 'ERR'}] Write p05 (SKU)")
+        self.log(f"[{'OK' if ok_manu else 'ERR'}] Write p10 (Manufacturer)")
+        self.log(f"[{'OK' if ok_mat else 'ERR'}] Write p15 (Material)")
+        self.log(f"[{'OK' if ok_color else 'ERR'}] Write p20 (Color)")
 
-        except Exception as e:
-            self.log(f"[ERROR] Write failed: {e}")
-        finally:
-            try:
-                conn.disconnect()
-            except Exception:
-                pass
+        if all((ok_sku, ok_manu, ok_mat, ok_color)):
+            self.log("[OK] Basic data written successfully.")
+        else:
+            self.log("[WARN] Some fields could not be written. The tag may be locked or protected.")
+
+        # Optional: sofort verifizieren (READ erneut ausführen)
+        # -> du kannst hier `self.on_read()` rufen, wenn du die Werte gleich prüfen willst
+        # self.on_read()
 
     def closeEvent(self, event: QtGui.QCloseEvent):
-        """Detach presence observer on close."""
+        """Detach presence observers on close and abort/briefly await tag I/O."""
         try:
             if hasattr(self, "_card_monitor") and hasattr(self, "_presence_observer"):
                 try:
                     self._card_monitor.deleteObserver(self._presence_observer)
                 except Exception:
                     pass
+            if hasattr(self, "_reader_monitor") and hasattr(self, "_reader_observer"):
+                try:
+                    self._reader_monitor.deleteObserver(self._reader_observer)
+                except Exception:
+                    pass
+            # Workers that have not connected yet skip the card session. One that is
+            # already talking to the tag must still reach conn.disconnect(): a process
+            # exit mid-session can leave a half-written tag / held reader. A session is
+            # a few APDUs, so a short bound suffices and the GUI does not hang on close.
+            workers = [w for w in (self._read_worker, self._write_worker) if w is not None]
+            for w in workers:
+                w.cancel()
+            if workers:
+                QtCore.QThreadPool.globalInstance().waitForDone(CLOSE_WAIT_MS)
         finally:
             super().closeEvent(event)
 
@@ -860,6 +1200,8 @@ class MainWindow(QtWidgets.QMainWindow):
 def run_app():
     QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling, True)
     QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_UseHighDpiPixmaps, True)
+    # merge bursts of mouse-move/resize/tablet events (default only on X11)
+    QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_CompressHighFrequencyEvents, True)
     app = QtWidgets.QApplication(sys.argv)
     win = MainWindow()
     win.show()
@@ -1,6 +1,12 @@
 # src/anycubic_nfc_qt5/config/filaments.py
 from __future__ import annotations
-import csv
+import functools
+import marshal
+import os
+import stat
+import tempfile
+import zlib
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 from importlib import resources
@@ -8,103 +14,258 @@ from pathlib import Path
 
 @dataclass(frozen=False)    # False=change properties is possible, True=this class is readonly
 class FilamentRecord:
+    # no per-instance __dict__; written by hand since dataclass(slots=True) needs Python 3.10
+    __slots__ = ("sku", "filament", "color", "color_hex")
     sku: str
     filament: str
     color: str
     color_hex: str
 
-def _open_filament_file(path: Optional[str]):
+# Vorab geparste Zeilen (Build-Schritt in freeze_setup.py), liegt neben der INI
+FILAMENT_CACHE_NAME = "ac_filaments.marshal"
+_HERE = Path(__file__).parent
+_DEFAULT_INI = _HERE / "ac_filaments.ini"
+
+Row = Tuple[str, str, str, str]   # (sku, filament, color, color_hex)
+
+def _filament_source(path: Optional[str]):
     if path:
-        return open(path, "r", encoding="utf-8")
-    # packaged default
-    return (resources.files(__package__).joinpath("ac_filaments.ini")
-            .open("r", encoding="utf-8"))
+        return Path(path)
+    # packaged default (a Path unless the package is imported from a zip)
+    return resources.files(__package__).joinpath("ac_filaments.ini")
+
+def _parse_rows(data: bytes) -> List[Row]:
+    # plain ';' split per line: the INI uses no quoting, csv.reader is not needed
+    rows: List[Row] = []
+    first = True
+    for line in data.splitlines():
+        s = line.strip()
+        # ignore empty lines / comments (classified on bytes, only kept lines are decoded)
+        if not s or s[:1] == b"#":
+            continue
+        parts = s.decode("utf-8").split(";", 4)
+        if first:
+            first = False
+            # header optional
+            if parts[0].strip().upper() == "SKU":
+                continue
+        if len(parts) < 2:
+            continue  # no filament column
+        # tolerate short rows (color / hex missing) without building a padded list
+        sku, filament, color, color_hex = (*parts, "", "")[:4]
+        sku, filament = sku.strip(), filament.strip()
+        if not sku or not filament:
+            continue
+        rows.append((sku, filament, color.strip(), color_hex.strip() or "#000000FF"))
+    return rows
+
+def _read_filament_cache():
+    """(size, mtime_ns, crc32, rows) from the prebuilt marshal cache, or None if it is
+    missing/unreadable (or an older format)."""
+    try:
+        blob = resources.files(__package__).joinpath(FILAMENT_CACHE_NAME).read_bytes()
+        size, mtime_ns, crc, rows = marshal.loads(blob)
+    except Exception:
+        return None
+    return size, mtime_ns, crc, rows
+
+def _read_rows(src, stamp: Optional[Tuple[int, int]], packaged: bool) -> Tuple[Row, ...]:
+    """
+    Rows of the INI `src` (stamp: its (size, mtime_ns) if known). For the packaged default the prebuilt cache is used if
+    it was built from this INI: an unchanged (size, mtime) skips reading the INI
+    entirely; otherwise (e.g. mtime not preserved by the bundler) the CRC of the
+    current bytes decides - the app edits the INI at runtime.
+    """
+    data = None
+    cache = _read_filament_cache() if packaged else None
+    if cache is not None:
+        size, mtime_ns, crc, rows = cache
+        if stamp == (size, mtime_ns):
+            return tuple(rows)
+        data = src.read_bytes()
+        if zlib.crc32(data) == crc:
+            return tuple(rows)
+    return tuple(_parse_rows(src.read_bytes() if data is None else data))
+
+@functools.lru_cache(maxsize=8)
+def _load_rows(path: str, mtime_ns: int, size: int, packaged: bool) -> Tuple[Row, ...]:
+    # (mtime_ns, size) are only part of the key: an edited INI is parsed again.
+    # An equal-length edit within the mtime granularity keeps the key, so the
+    # writers below (update_color_for_sku, append_filament_line) clear it as well
+    return _read_rows(Path(path), (size, mtime_ns), packaged)
 
 def load_filaments(path: Optional[str] = None) -> Tuple[Dict[str, List[FilamentRecord]], Dict[str, FilamentRecord]]:
     """
     Returns:
-      - by_filament: { FILAMENT: [FilamentRecord, ...] }
+      - by_filament: { FILAMENT: [FilamentRecord, ...] }, keys sorted case-insensitively
+                     (list(by_filament) is the display order for the filament combo)
       - by_sku:      { SKU: FilamentRecord }
+    The packaged default uses the prebuilt cache when it matches the INI.
+    Parsed rows are memoized per file (path, mtime, size); the records and
+    dicts are built fresh on every call, callers may modify them.
     """
-    by_filament: Dict[str, List[FilamentRecord]] = {}
-    by_sku: Dict[str, FilamentRecord] = {}
-
-    with _open_filament_file(path) as f:
-        # ignore empty lines / comments
-        def non_comment_lines():
-            for line in f:
-                s = line.strip()
-                if not s or s.startswith("#"):
-                    continue
-                yield line
-
-        reader = csv.reader(non_comment_lines(), delimiter=";")
-        # header optional
-        first = next(reader, None)
-        rows = []
-        if first is None:
-            return by_filament, by_sku
-        if first and first[0].strip().upper() == "SKU":
-            rows = list(reader)
-        else:
-            rows = [first] + list(reader)
+    src = _filament_source(path)
+    if isinstance(src, Path):
+        st = src.stat()
+        rows = _load_rows(str(src.resolve()), st.st_mtime_ns, st.st_size, not path)
+    else:
+        rows = _read_rows(src, None, not path)
 
-        for row in rows:
-            # tolerate short rows
-            parts = [c.strip() for c in row] + ["", "", "", ""]
-            sku, filament, color, color_hex = parts[0], parts[1], parts[2], parts[3]
-            if not sku or not filament:
-                continue
-            rec = FilamentRecord(sku=sku, filament=filament, color=color, color_hex=color_hex or "#000000FF")
-            by_sku[sku] = rec
-            by_filament.setdefault(filament, []).append(rec)
+    recs = [FilamentRecord(*row) for row in rows]
+    by_sku: Dict[str, FilamentRecord] = {rec.sku: rec for rec in recs}
+    grouped: Dict[str, List[FilamentRecord]] = defaultdict(list)
+    for rec in recs:
+        grouped[rec.filament].append(rec)
 
+    # sort once here so callers can use the key order directly (plain dict again)
+    by_filament = {k: grouped[k] for k in sorted(grouped, key=str.casefold)}
     return by_filament, by_sku
 
 
-def _normalize_hex_full(h: str) -> str:
-    """Return '#RRGGBBAA' uppercase if possible; accept '#RRGGBB' -> '#RRGGBBFF'."""
+def write_filament_cache(ini_path: Optional[str] = None, out_path: Optional[str] = None) -> Path:
+    """
+    Build step: pre-parse the INI into a marshal blob
+    (size, mtime_ns and crc32 of the INI, rows).
+    Defaults to the packaged INI and FILAMENT_CACHE_NAME next to it.
+    """
+    ini = Path(ini_path or _DEFAULT_INI)
+    st = ini.stat()
+    data = ini.read_bytes()
+    out = Path(out_path or _HERE / FILAMENT_CACHE_NAME)
+    out.write_bytes(marshal.dumps((st.st_size, st.st_mtime_ns, zlib.crc32(data), _parse_rows(data))))
+    return out
+
+
+def unique_colors(by_filament: Dict[str, List[FilamentRecord]]) -> Dict[str, List[Tuple[str, str, str]]]:
+    """
+    Per filament, the distinct colors in file order as (color, sku, color_hex) tuples.
+    The first record of a color wins (same rule the color combo always used).
+    """
+    out: Dict[str, List[Tuple[str, str, str]]] = {}
+    for name, records in by_filament.items():
+        uniq: Dict[str, Tuple[str, str, str]] = {}
+        for rec in records:
+            uniq.setdefault(rec.color, (rec.color, rec.sku, rec.color_hex))
+        out[name] = list(uniq.values())
+    return out
+
+
+@functools.lru_cache(maxsize=256)
+def normalize_hex_full(h: str) -> str:
+    """Return '#RRGGBBAA' uppercase if possible; accept '#RRGGBB' -> '#RRGGBBFF'.
+    Cached: only a few hundred distinct colors exist (INI, tags, combo data)."""
+    if h and len(h) == 9 and h[0] == "#":
+        t = h[1:]
+        if t.isalnum() and (t.isupper() or t.isdigit()):
+            return h  # already canonical, no strip()/upper() copies
     s = (h or "").strip()
     if not s.startswith("#"):
         return "#000000FF"
     s = s.upper()
-    if len(s) == 7:
-        return s + "FF"
-    if len(s) >= 9:
-        return s[:9]
+    if len(s) == 7 or len(s) >= 9:
+        return (s + "FF")[:9]  # '#RRGGBB' gets alpha FF, longer is cut to '#RRGGBBAA'
     return "#000000FF"
 
+def _sku_hex_spans(data: bytes, sku: bytes):
+    """Yield (start, end, line_end) of the (stripped) hex field of every line
+    whose first field is `sku`. start == end == line_end means the line has < 4 fields.
+    Only candidate lines found via bytes.find() are split, never the whole file."""
+    pos = data.find(sku)
+    while pos != -1:
+        ls = data.rfind(b"\n", 0, pos) + 1
+        le = data.find(b"\n", pos)
+        if le == -1:
+            le = len(data)
+        line = data[ls:le].rstrip(b"\r")
+        parts = line.split(b";")
+        if parts[0].strip() == sku:
+            if len(parts) < 4:
+                yield ls + len(line), ls + len(line), ls + len(line)
+            else:
+                field = parts[3]
+                fs = ls + sum(len(p) + 1 for p in parts[:3]) + len(field) - len(field.lstrip())
+                yield fs, fs + len(field.strip()), ls + len(line)
+        pos = data.find(sku, le)
+
+def _splice_hex(data: bytes, spans, new_hex: bytes) -> bytes:
+    """Replace the hex field at every span from _sku_hex_spans() in one pass
+    (short lines are padded with ';' first); unchanged bytes are only sliced."""
+    out, last = [], 0
+    for s, e, le in spans:
+        if s == le and e == le:
+            line = data[data.rfind(b"\n", 0, s) + 1:s]
+            out += [data[last:s], b";" * (3 - line.count(b";")), new_hex]
+        else:
+            out += [data[last:s], new_hex]
+        last = e
+    out.append(data[last:])
+    return b"".join(out)
+
+def _replace_file(path: Path, data: bytes) -> None:
+    """Write data to a temp file next to path and os.replace() it over path,
+    so a crash never leaves a half-written INI (file mode is kept)."""
+    fd, tmp = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp, stat.S_IMODE(path.stat().st_mode))
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
 def update_color_for_sku(sku: str, new_hex: str, file_path: Path | None = None) -> bool:
     """
     Update the color hex for a given full SKU in ac_filaments.ini.
     Returns True on success, False on failure.
+    The file is rebuilt once (unchanged bytes are only sliced) and atomically
+    replaced, so an interrupted write never leaves a half-updated INI.
     """
     try:
-        ini_path = (file_path if file_path is not None
-                    else Path(__file__).parent / "ac_filaments.ini")
-        text = ini_path.read_text(encoding="utf-8", errors="ignore")
-        lines = text.splitlines()
-        changed = False
-        new_hex_full = _normalize_hex_full(new_hex)
-
-        out_lines = []
-        for ln in lines:
-            # tolerate spaces/tabs; compare by first field before ';'
-            parts = [p.strip() for p in ln.split(";")]
-            if not parts or parts[0] != sku:
-                out_lines.append(ln)
-                continue
-            # ensure at least 4 fields: SKU;FILAMENT;COLOR;COLOR_HEX
-            while len(parts) < 4:
-                parts.append("")
-            parts[3] = new_hex_full
-            out_lines.append(";".join(parts))
-            changed = True
-
-        if not changed:
+        ini_path = Path(file_path) if file_path is not None else _DEFAULT_INI
+        # als Bytes bearbeiten; nur die Trefferzeilen werden zerlegt, der Rest nur kopiert
+        sku_b = sku.strip().encode("utf-8")
+        if not sku_b:
+            return False
+        new_b = normalize_hex_full(new_hex).encode("utf-8")
+        data = ini_path.read_bytes()
+        spans = list(_sku_hex_spans(data, sku_b))
+        if not spans:
             return False  # sku not found
 
-        ini_path.write_text("\n".join(out_lines) + "\n", encoding="utf-8")
+        # Datei einmal neu zusammensetzen und per os.replace() austauschen
+        _replace_file(ini_path, _splice_hex(data, spans, new_b))
+        _load_rows.cache_clear()
         return True
     except Exception:
-        return False
\ No newline at end of file
+        return False
+
+def append_filament_line(sku: str, filament: str, color: str, color_hex: str,
+                         file_path: Path | None = None) -> FilamentRecord:
+    """
+    Append 'SKU;FILAMENT;COLOR;#RRGGBBAA' to ac_filaments.ini and return the new record.
+    color_hex may lack the '#' and/or the alpha. Raises ValueError if sku, filament
+    or color is empty, OSError if the file cannot be written.
+    """
+    ini_path = Path(file_path) if file_path is not None else _DEFAULT_INI
+    sku, filament, color = (sku or "").strip(), (filament or "").strip(), (color or "").strip()
+    if not (sku and filament and color):
+        raise ValueError("missing required fields")
+    color_hex = (color_hex or "").strip()
+    if not color_hex.startswith("#"):
+        color_hex = "#" + color_hex
+    color_hex = normalize_hex_full(color_hex)
+
+    new_line = f"{sku};{filament};{color};{color_hex}"
+    with open(ini_path, "a+b") as f:
+        # Ensure newline if file doesn’t end with one (only the last byte is read)
+        sep = b""
+        if f.seek(0, 2):
+            f.seek(-1, 2)
+            sep = b"" if f.read(1) == b"\n" else b"\n"
+        f.write(sep + (new_line + "\n").encode("utf-8"))
+    _load_rows.cache_clear()  # memoized rows of the old file content
+    return FilamentRecord(sku=sku, filament=filament, color=color, color_hex=color_hex)
@@ -0,0 +1,59 @@
+# src/anycubic_nfc_qt5/nfc/monitor.py
+# pyscard presence observers (no APDU, just insert/remove).
+# Callbacks run in pyscard's background threads; events are forwarded to a
+# "bridge" object exposing Qt signals (presenceChanged / readersChanged).
+from __future__ import annotations
+
+from smartcard.CardMonitoring import CardMonitor, CardObserver
+from smartcard.ReaderMonitoring import ReaderMonitor, ReaderObserver
+
+from .pcsc import invalidate_readers_cache
+
+__all__ = [
+    "CardMonitor",
+    "ReaderMonitor",
+    "CardPresenceObserver",
+    "ReaderPresenceObserver",
+]
+
+
+class CardPresenceObserver(CardObserver):
+    """pyscard CardObserver that forwards insert/remove events to Qt via a bridge.
+    Present cards are tracked by identity (pyscard Card = ATR + reader), so only
+    real presence transitions are emitted; a card swap or a repeated event for
+    the same card does not cross the thread boundary again."""
+    def __init__(self, bridge):
+        super().__init__()
+        self._bridge = bridge
+        self._present = set()
+
+    def update(self, observable, actions):
+        """Called by pyscard on card inserted/removed."""
+        (added, removed) = actions
+        was_present = bool(self._present)
+        self._present.difference_update(removed or ())
+        self._present.update(added or ())
+        is_present = bool(self._present)
+        if is_present != was_present:
+            self._bridge.presenceChanged.emit(is_present)
+
+
+class ReaderPresenceObserver(ReaderObserver):
+    """pyscard ReaderObserver that forwards reader attach/detach events to Qt via a bridge.
+    Emits only when availability flips (no reader <-> at least one reader)."""
+    def __init__(self, bridge):
+        super().__init__()
+        self._bridge = bridge
+        self._readers = set()
+
+    def update(self, observable, actions):
+        """Called by pyscard when readers are attached/detached (first call lists all present readers)."""
+        (added, removed) = actions
+        if added or removed:
+            invalidate_readers_cache()  # next list_readers() enumerates again
+        was_available = bool(self._readers)
+        self._readers.difference_update(str(r) for r in (removed or ()))
+        self._readers.update(str(r) for r in (added or ()))
+        is_available = bool(self._readers)
+        if is_available != was_available:
+            self._bridge.readersChanged.emit(is_available)
@@ -6,14 +6,34 @@ from typing import List, Optional, Tuple
 
 from smartcard.System import readers
 from smartcard.CardConnection import CardConnection
+from smartcard.CardRequest import CardRequest
+from smartcard.CardType import AnyCardType
+from smartcard.Exceptions import CardRequestTimeoutException
+
+
+READERS_CACHE_S = 1.0  # list_readers() result is reused this long (see invalidate_readers_cache)
+_readers_cache: Optional[List] = None
+_readers_cache_ts = 0.0
+
+
+def invalidate_readers_cache() -> None:
+    """Drop the cached reader list (called on reader attach/detach events)."""
+    global _readers_cache
+    _readers_cache = None
 
 
 def list_readers() -> List:
-    """Return available PC/SC readers."""
+    """Return available PC/SC readers (enumerated at most once per READERS_CACHE_S)."""
+    global _readers_cache, _readers_cache_ts
+    cached = _readers_cache
+    if cached is not None and time.monotonic() - _readers_cache_ts < READERS_CACHE_S:
+        return list(cached)
     try:
-        return readers()
+        rlist = readers()
     except Exception:
-        return []
+        return []  # transient PC/SC error: not cached, the next call asks again
+    _readers_cache, _readers_cache_ts = list(rlist), time.monotonic()
+    return rlist
 
 
 def connect_first_reader() -> Optional[CardConnection]:
@@ -25,18 +45,27 @@ def connect_first_reader() -> Optional[CardConnection]:
 
 
 def wait_for_card(timeout_s: float = 30.0, poll_interval_s: float = 0.5) -> Optional[CardConnection]:
-    """Poll the first reader until a card is present or timeout."""
-    conn = connect_first_reader()
-    if conn is None:
+    """Wait on the first reader until a card is present (connected) or timeout.
+    Blocks in PC/SC (CardRequest -> SCardGetStatusChange) instead of polling;
+    poll_interval_s is only the retry delay if a present card fails to connect."""
+    rlist = list_readers()
+    if not rlist:
         return None
-    deadline = time.time() + timeout_s
-    while time.time() < deadline:
+    deadline = time.monotonic() + timeout_s
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        try:
+            service = CardRequest(timeout=remaining, cardType=AnyCardType(), readers=rlist[:1]).waitforcard()
+        except CardRequestTimeoutException:
+            return None
+        conn = service.connection
         try:
-            conn.connect()  # will raise until a card is present
+            conn.connect()
             return conn
         except Exception:
             time.sleep(poll_interval_s)
-    return None
 
 
 def read_atr(conn: CardConnection) -> bytes:
@@ -75,15 +104,76 @@ def read_page_ultralight(conn, page: int):
         return None
 
 
-def read_pages_ultralight(conn, start_page: int, page_count: int) -> bytes:
-    """Read multiple 4-byte pages consecutively; returns concatenated bytes (best-effort)."""
-    out = bytearray()
-    for p in range(start_page, start_page + page_count):
+def read_block_ultralight(conn, page: int):
+    """Read 16 bytes (4 pages) starting at page with one READ BINARY (Le=0x10),
+    matching the native NTAG/Ultralight READ. Returns 16 bytes, or None if the
+    reader/tag only answers single pages."""
+    try:
+        # APDU: FF B0 00 <page> 10 -> read 16 bytes (four pages)
+        data, sw1, sw2 = conn.transmit([0xFF, 0xB0, 0x00, page & 0xFF, 0x10])
+        if sw1 == 0x90 and sw2 == 0x00 and len(data) == 16:
+            return bytes(data)
+        return None
+    except Exception:
+        return None
+
+
+def read_page_map(conn, start_page: int, page_count: int) -> dict:
+    """Read pages start_page..start_page+page_count-1 with as few APDUs as possible:
+    4-page block reads, single pages if the reader does not answer block reads.
+    Stops at the first unreadable page (end of memory / protected area) and returns
+    {page: 4 bytes} for the readable prefix.
+    A block READ near the end of tag memory rolls over to page 0 (NTAG213: block at
+    page 44 -> pages 44, 0, 1, 2), so block data is only kept up to a page known to
+    exist: confirmed by the next accepted READ, or by one single-page READ at the end."""
+    pages = {}
+    end = start_page + page_count
+
+    def keep(first, blk, count):
+        for i in range(min(count, end - first)):
+            pages[first + i] = blk[4 * i:4 * i + 4]
+
+    pending = None  # (page, 16 bytes) of the last block, not yet known to lie inside memory
+    p = start_page
+    use_blocks = True
+    while p < end:
+        blk = read_block_ultralight(conn, p) if use_blocks else None
+        if blk is not None:
+            if pending is not None:
+                keep(*pending, 4)  # READ at p was accepted -> all pages before p exist
+            pending = (p, blk)
+            p += 4
+            continue
+        use_blocks = False
         b = read_page_ultralight(conn, p)
         if b is None:
-            break
-        out.extend(b)
-    return bytes(out)
+            break  # first gap
+        if pending is not None:
+            keep(*pending, 4)
+            pending = None
+        pages[p] = b
+        p += 1
+
+    if pending is not None:
+        first, blk = pending
+        last = min(first + 3, end - 1)
+        if last == first or read_page_ultralight(conn, last) is not None:
+            keep(first, blk, last - first + 1)
+        else:
+            # memory ends inside this block: keep pages up to the first one that fails
+            keep(first, blk, 1)  # READ at `first` was accepted
+            for q in range(first + 1, last):
+                if read_page_ultralight(conn, q) is None:
+                    break
+                keep(first, blk, q - first + 1)
+    return pages
+
+
+def read_pages_ultralight(conn, start_page: int, page_count: int) -> bytes:
+    """Read multiple 4-byte pages consecutively; returns concatenated bytes (best-effort),
+    stopping at the first unreadable page."""
+    pages = read_page_map(conn, start_page, page_count)
+    return b"".join(pages[p] for p in range(start_page, start_page + len(pages)))
 
 
 def find_ndef_tlv(mem: bytes):
@@ -350,21 +440,26 @@ def interpret_anycubic(info: dict) -> dict:
     return out
 
 # --- Low-level helpers for Anycubic layout ---
-def _read_u16_at(conn, page: int, byte_offset: int) -> int | None:
-    """Read little-endian uint16 at page+offset (offset 0 or 2)."""
-    b = read_page_ultralight(conn, page)
+# All work on a {page: 4 bytes} map from read_page_map(), so each page crosses
+# the air interface once (in 4-page blocks) instead of once per field.
+ANYCUBIC_FIRST_PAGE = 0x05
+ANYCUBIC_LAST_PAGE = 0x2A   # p42_raw
+
+def _read_u16_at(pages: dict, page: int, byte_offset: int) -> int | None:
+    """Little-endian uint16 at page+offset (offset 0 or 2)."""
+    b = pages.get(page)
     if not b or byte_offset not in (0, 2):
         return None
     lo = b[byte_offset]
     hi = b[byte_offset + 1]
     return lo | (hi << 8)
 
-def _read_string_page(conn, page: int, max_len: int = 32) -> str:
-    """Read zero-terminated ASCII starting at given page (4 bytes/page)."""
+def _read_string_page(pages: dict, page: int, max_len: int = 32) -> str:
+    """Zero-terminated ASCII starting at given page (4 bytes/page)."""
     buf = bytearray()
     p = page
     while len(buf) < max_len:
-        q = read_page_ultralight(conn, p)
+        q = pages.get(p)
         if not q:
             break
         buf.extend(q)
@@ -373,10 +468,10 @@ def _read_string_page(conn, page: int, max_len: int = 32) -> str:
         p += 1
     return bytes(buf).split(b"\x00", 1)[0].decode("ascii", errors="ignore")
 
-def _read_color_rgba_hex(conn, page: int) -> str | None:
-    """Read 4 bytes at page and return '#RRGGBBAA'.
+def _read_color_rgba_hex(pages: dict, page: int) -> str | None:
+    """4 bytes at page as '#RRGGBBAA'.
     Many tags store bytes in reverse order; using reversed bytes is robust."""
-    b = read_page_ultralight(conn, page)
+    b = pages.get(page)
     if not b or len(b) != 4:
         return None
     # Reverse to get RGBA: [R,G,B,A] = reversed([b0,b1,b2,b3])
@@ -407,21 +502,24 @@ def read_anycubic_fields(conn):
     if uid is not None:
         out["uid"] = uid
 
+    # All Anycubic pages in one go (4-page blocks), parsed from memory below
+    pages = read_page_map(conn, ANYCUBIC_FIRST_PAGE, ANYCUBIC_LAST_PAGE - ANYCUBIC_FIRST_PAGE + 1)
+
     # ASCII strings
-    out["sku"] = _read_ascii_z(conn, start_page=5, max_len=32)  # bereits vorhanden
-    out["manufacturer"] = _read_string_page(conn, 0x0A, 16) or ""
-    out["material"] = _read_string_page(conn, 0x0F, 16) or ""
+    out["sku"] = _read_string_page(pages, 0x05, 32)
+    out["manufacturer"] = _read_string_page(pages, 0x0A, 16) or ""
+    out["material"] = _read_string_page(pages, 0x0F, 16) or ""
 
     # Color
-    out["color_hex"] = _read_color_rgba_hex(conn, 0x14)  # '#RRGGBBAA' or None
+    out["color_hex"] = _read_color_rgba_hex(pages, 0x14)  # '#RRGGBBAA' or None
 
     # Ranges A/B/C (speed/nozzle)
     def _range_tuple(p_speed: int, p_noz: int) -> dict:
         return {
-            "speed_min": _read_u16_at(conn, p_speed, 0),
-            "speed_max": _read_u16_at(conn, p_speed, 2),
-            "nozzle_min": _read_u16_at(conn, p_noz, 0),
-            "nozzle_max": _read_u16_at(conn, p_noz, 2),
+            "speed_min": _read_u16_at(pages, p_speed, 0),
+            "speed_max": _read_u16_at(pages, p_speed, 2),
+            "nozzle_min": _read_u16_at(pages, p_noz, 0),
+            "nozzle_max": _read_u16_at(pages, p_noz, 2),
         }
 
     out["range_a"] = _range_tuple(0x17, 0x18)
@@ -429,19 +527,19 @@ def read_anycubic_fields(conn):
     out["range_c"] = _range_tuple(0x1B, 0x1C)
 
     # Bed temps
-    out["bed_min"] = _read_u16_at(conn, 0x1D, 0)
-    out["bed_max"] = _read_u16_at(conn, 0x1D, 2)
+    out["bed_min"] = _read_u16_at(pages, 0x1D, 0)
+    out["bed_max"] = _read_u16_at(pages, 0x1D, 2)
 
     # Diameter / Length / Weight
-    dia_raw = _read_u16_at(conn, 0x1E, 0)
+    dia_raw = _read_u16_at(pages, 0x1E, 0)
     out["diameter_mm"] = (dia_raw / 100.0) if isinstance(dia_raw, int) else None
-    out["length_m"] = _read_u16_at(conn, 0x1E, 2)  # meters (typ. ~330)
-    out["weight_g"] = _read_u16_at(conn, 0x1F, 0)  # grams (typ. 1000)
+    out["length_m"] = _read_u16_at(pages, 0x1E, 2)  # meters (typ. ~330)
+    out["weight_g"] = _read_u16_at(pages, 0x1F, 0)  # grams (typ. 1000)
 
     # Keep existing 'params' for backward-compat / debugging:
     params = {}
     for pg in range(23, 32):
-        b = read_page_ultralight(conn, pg)
+        b = pages.get(pg)
         if b:
             lo = b[0] | (b[1] << 8)
             hi = b[2] | (b[3] << 8)
@@ -450,10 +548,10 @@ def read_anycubic_fields(conn):
     out["params"] = params
 
     # Raw bytes we previously surfaced as dbg
-    out["p20_raw"] = read_page_ultralight(conn, 20)
-    out["p40_raw"] = read_page_ultralight(conn, 40)
-    out["p41_raw"] = read_page_ultralight(conn, 41)
-    out["p42_raw"] = read_page_ultralight(conn, 42)
+    out["p20_raw"] = pages.get(20)
+    out["p40_raw"] = pages.get(40)
+    out["p41_raw"] = pages.get(41)
+    out["p42_raw"] = pages.get(42)
 
     return out
 
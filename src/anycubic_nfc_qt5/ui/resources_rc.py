@@ -0,0 +1,1272 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x4b\xfe\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x76\x1c\x00\x00\x76\x1c\
+\x01\xa7\xc2\x78\xea\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
+\x41\x54\x78\x9c\xed\xdd\x79\xbc\x5d\xd3\xfd\xff\xf1\xd7\xcd\xcd\
+\x28\x32\x91\x48\x08\x91\xa0\xe6\x31\xc6\xa2\x4a\x0d\x35\x96\xd6\
+\x50\xca\x97\x0e\x4a\x51\xa5\xb4\xf5\x53\xd5\xaa\xaa\xce\x83\xa2\
+\x86\xea\xb7\xea\x5b\xb4\x54\xab\xd2\x12\x35\xd5\x5c\xc4\x14\x25\
+\x66\x82\x08\x22\x91\x79\xbe\xb9\xbf\x3f\x3e\xf7\x36\x37\x37\xb9\
+\xb9\xf7\x9c\x35\xee\xbd\xdf\xcf\xc7\x63\x3d\x2e\xda\x7d\xce\x67\
+\xed\xb3\xcf\xde\x9f\xb3\xf6\xda\x9f\x05\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x9d\x6b\x48\x1d\x80\x88\xd4\
+\xa4\x1f\x30\x1c\x18\x0c\xf4\x6f\xd3\x06\x01\x03\xda\xfd\xb7\xbe\
+\x2d\xdb\x74\x6f\xd9\xae\x55\xb7\x96\xff\x6f\x7b\x0b\x81\x39\xed\
+\xfe\x5b\x33\x30\xbd\xe5\xbf\xcf\x05\x66\xb5\xb4\xb9\x2d\xff\x6d\
+\x3a\x30\x03\x78\x07\x78\x1f\x98\xd2\xf2\xb7\xa9\xfe\x2e\x8a\x48\
+\x0c\x4a\x00\x44\xf2\xb1\x36\xb0\x3e\x30\x12\x58\xb3\x5d\x1b\x06\
+\xac\x05\xac\x92\x2a\xb8\x1a\x34\xb3\x6c\x32\xf0\x16\xf0\x06\x30\
+\xb1\x4d\x7b\x0d\x98\x97\x2a\x40\x11\x51\x02\x20\x12\x53\x03\x30\
+\x0a\xbb\xc8\x6f\xd0\xee\xef\xfa\x40\x9f\x74\xa1\x25\xf1\x1e\x96\
+\x18\xbc\x0a\x4c\x00\x9e\x03\x5e\x00\x9e\x07\x16\x24\x8c\x4b\xa4\
+\x12\x94\x00\x88\x84\x31\x10\xd8\x12\xd8\xa2\xe5\xef\x96\xc0\xe6\
+\xc0\xaa\x29\x83\x2a\x88\x26\xe0\x75\x2c\x29\x98\x00\xfc\x07\x78\
+\x1c\x4b\x0c\x74\x6b\x41\xc4\x13\x25\x00\x22\xee\x06\x03\x3b\x01\
+\x3b\x02\x5b\x63\x17\xfb\x11\x49\x23\x2a\xa7\x39\xc0\xd3\x58\x32\
+\xf0\x44\xcb\xdf\x09\xc0\xe2\x94\x41\x89\x14\x95\x12\x00\x91\xda\
+\x34\x62\xbf\xe4\x3f\xdc\xd2\x76\x02\x36\x4c\x1a\x51\xb5\xcd\x03\
+\xc6\x01\xf7\x03\x0f\xb6\xb4\x19\x49\x23\x12\x29\x08\x25\x00\x22\
+\x2b\xd7\x03\xfb\x65\xbf\x17\xb0\x1b\xb0\x3d\x1a\xc6\xcf\x59\x13\
+\xf0\x0c\x96\x10\x3c\xd0\xf2\x77\x72\xd2\x88\x44\x32\xa5\x04\x40\
+\x64\x79\xeb\x61\x17\xfc\xbd\x80\x7d\x58\xf1\x23\x73\x52\x1c\xaf\
+\x02\x77\xb6\xb4\xb1\xd8\x63\x8c\x22\x95\xa7\x04\x40\x04\x86\x02\
+\x07\x60\x17\xfc\x3d\x81\x35\xd2\x86\x23\x01\xcd\xc3\x46\x05\x6e\
+\x6f\x69\xcf\xa6\x0d\x47\x24\x1d\x25\x00\x52\x55\x9b\x00\x07\x03\
+\x9f\xc0\x86\xf8\xbb\xa5\x0d\x47\x12\x79\x03\xb8\xb9\xa5\xdd\x87\
+\x9e\x32\x90\x0a\x51\x02\x20\x55\xd1\x0d\xd8\x06\x38\x08\x38\x02\
+\x4b\x00\x44\xda\x9a\x06\xfc\x03\x18\x03\xdc\x06\xcc\x4e\x1b\x8e\
+\x48\x58\x4a\x00\xa4\xcc\xba\x61\x13\xf7\x3e\x03\x1c\x02\x0c\x49\
+\x1b\x8e\x14\xc8\x6c\x2c\x09\xf8\x13\x96\x14\xcc\x4f\x1b\x8e\x88\
+\x7f\x4a\x00\xa4\x8c\x36\x03\x0e\x07\x8e\xc5\x2a\xef\x89\xb8\x98\
+\x01\xdc\x02\xdc\x08\xdc\x8a\x6e\x13\x48\x49\x28\x01\x90\xb2\x58\
+\x17\x38\x12\xf8\x2c\xb0\x71\xda\x50\xa4\xc4\x26\x01\x37\x01\xbf\
+\xc7\x8a\x11\x89\x88\x48\x02\xab\x02\x5f\x04\x1e\xc1\x16\xa0\x51\
+\x53\x8b\xd9\x1e\x07\x4e\x64\xd9\x95\x16\x45\x0a\x43\x23\x00\x52\
+\x44\xdb\x02\x27\x00\x47\x51\xcd\x93\xef\x6c\xe0\x4d\x6c\x68\x7a\
+\x06\x30\x13\xf8\xa0\xdd\xbf\xb7\xfe\x5d\xd1\x44\xb6\x59\x2c\x5f\
+\x3e\xb7\x2f\xd0\x13\xab\x79\xd0\x88\xad\x65\xd0\x03\x4b\xb2\xfa\
+\x60\xab\x10\x0e\xc1\xca\x1e\x0f\xc1\x56\x28\x1c\x42\xf5\x16\x30\
+\x5a\x91\xd9\xc0\xf5\xc0\x95\x58\x55\x42\x91\x42\x50\x02\x20\x45\
+\xd1\x1f\xbb\xe0\x9f\x00\x8c\x4e\x1c\x4b\x48\xb3\x81\x97\xb1\x25\
+\x74\xdf\xc2\xaa\xd8\xbd\x01\xbc\xdd\xe6\xbf\xcd\x4c\x16\xdd\xf2\
+\xfa\x62\x75\x14\x86\x62\xc9\xc1\xba\x58\x21\xa5\x51\x2d\x7f\xd7\
+\xa3\x5a\x95\x13\x9f\x00\x7e\x03\x5c\x8b\x0a\x0e\x49\xe6\x94\x00\
+\x48\xee\xb6\x00\xbe\x82\xdd\xdf\x2f\xd3\x85\xe4\x1d\x6c\x21\x9b\
+\xe7\xdb\xfc\x7d\x1e\xfb\x65\x5f\x36\x6b\xb0\x34\x19\x58\x0f\x7b\
+\x04\x73\x0b\x6c\xae\x46\x8f\x84\x71\x85\x34\x13\xf8\x2d\x70\x31\
+\xf0\x5a\xe2\x58\x44\x56\x48\x09\x80\xe4\xa8\x01\xd8\x17\xf8\x2a\
+\x56\x9d\xaf\xc8\xc7\xe9\x62\x6c\x39\xdb\xc7\x5a\xda\x78\x6c\xcd\
+\xfb\xe9\x29\x83\xca\x44\x4f\x60\x53\x96\x2e\x9b\xbc\x55\xcb\x3f\
+\x0f\x4d\x19\x94\x67\x4d\xc0\x5f\x81\x5f\x00\x0f\x25\x8e\x45\x44\
+\x24\x5b\x7d\xb0\x49\x7d\xcf\x91\x7e\x82\x57\x3d\x6d\x09\x76\x71\
+\xff\x03\x70\x1a\xb0\x33\xba\x47\x5e\x8f\xa1\xc0\x81\xc0\xf7\x81\
+\x7f\x61\xcb\x00\xa7\xfe\x6c\x7d\xb4\x47\x80\x4f\x03\xdd\xbd\xed\
+\x29\x11\x91\x82\x1b\x0a\x9c\x0f\xbc\x47\xfa\x93\x74\x2d\x6d\x31\
+\xf0\x6f\xec\x42\xb5\x0f\x36\x71\x4e\xfc\xeb\x81\xad\xc2\x78\x1a\
+\x56\x98\xe7\x4d\xd2\x7f\xf6\x2e\xed\x75\xe0\x24\xa0\x97\xc7\x7d\
+\x24\x22\x52\x28\xeb\x00\x97\x62\x55\xd6\x52\x9f\x94\xbb\xda\x9e\
+\x05\x2e\xc2\xd6\x10\xd0\x2a\x81\xe9\x8c\xc0\x6a\x3e\x5c\x47\xf1\
+\x12\xc7\xd6\x36\x09\x38\x1d\x7b\xc2\x42\x44\xa4\x12\xd6\x05\x2e\
+\x07\x16\x90\xfe\x24\xdc\x95\x93\xf4\xff\x02\x47\x63\x8f\xbe\x49\
+\x7e\xba\x01\xdb\x01\xdf\xc4\x6e\x19\x2c\x24\xfd\x71\x53\x4b\x7b\
+\x17\x38\x8b\x6a\x3e\xd2\x2a\x22\x15\x31\x0a\x7b\x44\x2a\xf7\x13\
+\xf4\x0b\xc0\x0f\x81\x9d\x28\xf6\x04\xc4\xaa\x5a\x15\x1b\xa1\xb9\
+\x94\x62\xdd\x2e\x98\x0a\x7c\x8b\x72\x3d\xed\x22\x22\x15\x37\x12\
+\x1b\x36\xcf\x79\xa8\xff\x59\xe0\x3c\xac\xc8\x90\x94\xcb\x66\xd8\
+\x67\xfb\x3c\xe9\x8f\xb3\xae\xb4\x29\xd8\x88\x80\xe6\x08\x88\x48\
+\x61\x0d\xc3\x86\xfa\x17\x91\xfe\xa4\xda\xbe\x35\x01\xf7\x00\xa7\
+\x62\x73\x11\xa4\x1a\xb6\x01\xbe\x47\x31\x9e\x34\x79\x15\x38\x06\
+\xbb\xc5\x21\x22\x52\x08\xfd\x80\xef\x62\x55\xed\x52\x9f\x44\xdb\
+\xb7\x17\xb1\x61\xd6\x11\xc1\x7a\x2f\x45\xb1\x29\xf0\x1d\xac\xf2\
+\x62\xea\xe3\x72\x65\xed\x69\xec\xb1\x48\x11\x91\x6c\xf5\xc0\x4a\
+\xf5\x4e\x26\xfd\x49\xb3\x6d\x9b\x0e\x5c\x43\xf1\x8b\x0a\x49\x38\
+\xdb\x62\xb7\xa9\xa6\x92\xfe\x78\xed\xa8\xdd\x83\x15\x4b\x12\x11\
+\xc9\xca\x41\xd8\xaf\xeb\xd4\x27\xc9\xd6\xd6\x04\xdc\x01\x1c\x8b\
+\xd5\xab\x17\xe9\x8a\xde\xc0\xe1\xc0\x18\xf2\xbd\x75\x75\x0d\x56\
+\x5e\x59\x44\x24\xa9\xed\x80\x87\x49\x7f\x62\x6c\x6d\x6f\x03\xdf\
+\x06\xd6\x0a\xd9\x69\xa9\x84\x75\x80\x73\xb0\x7b\xf1\xa9\x8f\xeb\
+\xf6\x6d\x1a\x56\x18\xa9\xac\x6b\x29\x88\x48\xc6\x56\xc3\x26\xf8\
+\x35\x91\xfe\x64\xd8\x8c\xd5\x59\x3f\x0a\x9d\x10\xc5\xbf\x6e\xd8\
+\x63\x85\xff\xc4\xca\x3d\xa7\x3e\xd6\xdb\xb6\xe7\xb0\x2a\x94\x22\
+\x22\xc1\x35\x60\xc3\xea\x39\x54\x5f\x5b\x00\xdc\x80\xd5\xdc\x17\
+\x89\xe1\x43\x58\x8d\x88\x69\xa4\x3f\xfe\xdb\xb6\x31\xc0\xda\x01\
+\xfb\x2d\x22\x15\x37\x1a\xfb\xa5\x9d\xfa\x64\x37\x19\x3b\x09\x0f\
+\x0f\xdb\x5d\x91\x0e\xf5\xc3\x26\xbc\x3e\x43\xfa\xef\x43\x6b\x9b\
+\x8e\xdd\x16\x68\x0c\xd8\x6f\x11\xa9\x98\xd5\x81\x2b\x48\x3f\xdc\
+\xff\x2c\x56\x92\x57\xc3\xfc\x92\x8b\x06\xe0\xe3\xd8\x0c\xfd\xd4\
+\x09\x40\x6b\x7b\x08\x5b\x5e\x59\x44\xc4\xc9\xe1\x58\xad\xf2\x94\
+\x27\xb4\xa7\x5b\xe2\x50\x41\x14\xc9\xd9\x87\x81\x5b\xc8\x63\x9e\
+\xc0\x42\xe0\x07\x68\x39\x6a\x11\xa9\xc3\x50\xe0\x46\xd2\x9e\xc4\
+\x9e\xc2\x2e\xfc\x7a\x76\x5f\x8a\x64\x73\xec\x51\xbd\x1c\x1e\x23\
+\x7c\x05\xd8\x2d\x6c\x77\x45\xa4\x4c\x0e\xc7\xea\x91\xa7\x3a\x69\
+\x3d\x84\xd5\x15\xd0\x85\x5f\x8a\x6c\x24\x56\x5c\x68\x2e\x69\x93\
+\x80\x26\xec\x16\x9e\x96\x1d\x16\x91\x0e\xad\x03\xdc\x4a\xba\x13\
+\xd5\xbd\x58\xb5\x3e\x91\x32\x19\x8e\x3d\x32\x9b\x7a\x15\xcc\xff\
+\x60\x75\x3b\x44\x44\xfe\xab\x01\x38\x11\x98\x41\xba\x13\xd3\x01\
+\xc1\x7b\x29\x92\xd6\x06\xc0\x75\xa4\x9d\x4c\xbb\x08\x5b\x0c\xa9\
+\x67\xe0\xbe\x8a\x48\x01\xac\x81\x3d\x43\x9c\xe2\x64\xf4\x36\xf0\
+\x45\xf4\xd8\x92\x54\xcb\x56\xc0\xdf\x49\x3b\x1a\xf0\x04\xb0\x51\
+\xe8\x8e\x8a\x48\xbe\xf6\x02\x26\x11\xff\xe4\x33\x1b\x7b\x8e\xbf\
+\x7f\xf8\x2e\x8a\x64\x6b\x27\xe0\x6e\xd2\x25\x01\x73\xb1\xba\x01\
+\x22\x52\x21\xbd\x80\x5f\x10\xff\x71\xa5\x45\xd8\xbd\xd0\x61\xe1\
+\xbb\x28\x52\x18\x07\x00\xcf\x93\x2e\x11\xb8\x0e\x18\x10\xbc\x97\
+\x22\x92\xdc\x66\xd8\x73\xf5\xb1\x4f\x32\xb7\x00\x9b\x44\xe8\x9f\
+\x48\x11\xf5\x00\xce\xc4\xaa\xf9\xa5\x48\x02\x5e\x01\x76\x0c\xde\
+\x4b\x11\x49\xa2\x01\x38\x99\xf8\x8f\x24\xbd\x02\xec\x17\xa1\x7f\
+\x22\x65\x30\x14\xb8\x8a\x34\x13\x05\x17\x02\xdf\x40\x8f\xdf\x8a\
+\x94\x4a\x3f\x6c\xd1\x9c\xd8\x27\x93\x8b\x80\xbe\x11\xfa\x27\x52\
+\x36\xa3\x81\xfb\x49\x33\x1a\x30\x06\x18\x18\xbe\x8b\x22\x12\xda\
+\x96\xc0\x8b\xc4\x3d\x81\xdc\x83\x86\xfb\x45\x5c\x35\x00\xc7\x90\
+\x66\xa2\xee\x0b\x58\x45\x43\x11\x29\xa8\x63\xb0\x19\xf7\xb1\x4e\
+\x1a\x53\xb1\x15\xd2\x34\x84\x28\xe2\x4f\x5f\xec\xa9\x99\xc5\xc4\
+\x4d\x02\xe6\x02\x9f\x0d\xdf\x3d\x11\xf1\xa9\x17\x36\xfc\x1e\xeb\
+\x44\xb1\x04\xab\x7d\x3e\x38\x46\xe7\x44\x2a\x6a\x67\x6c\x45\xcc\
+\xd8\xa3\x01\x57\xa0\xc2\x41\x22\x85\xb0\x1e\xf0\x38\xf1\x4e\x0e\
+\xff\xc1\x56\x41\x13\x91\xf0\x7a\x01\xe7\x01\x0b\x88\x9b\x04\xdc\
+\x87\x12\x7c\x91\xac\xed\x05\x4c\x23\xce\x09\xa1\x09\xf8\x31\xd0\
+\x3b\x4a\xcf\x44\xa4\xad\x4d\x81\x07\x89\x9b\x04\xbc\x82\x3d\x46\
+\x2c\x22\x99\x39\x85\x78\xcb\x8f\xbe\x0c\xec\x1a\xa7\x5b\x22\xd2\
+\x81\x6e\xd8\xf7\x7e\x26\xf1\x92\x80\x19\xe8\xb1\x5e\x91\x6c\x74\
+\x27\xde\xfd\xfe\x25\xd8\xfd\xc0\x55\xa3\xf4\x4c\x44\xba\x62\x5d\
+\x6c\x25\xcd\x58\x49\xc0\x62\xe0\xac\x28\x3d\x13\x91\x0e\xad\x06\
+\xdc\x49\x9c\x2f\xfd\x64\xe0\xc0\x38\xdd\x12\x91\x1a\x75\xc3\xea\
+\xfa\xc7\x9c\x1b\xf0\x1b\xac\x82\xa1\x88\x44\xb6\x31\xf1\x9e\xef\
+\xff\x3f\x54\x18\x44\xa4\x08\xb6\x05\x26\x10\x2f\x09\xf8\x27\x56\
+\x68\x4c\x44\x22\xd9\x13\xf8\x80\xf0\x5f\xee\xf7\x80\x4f\x45\xea\
+\x93\x88\xf8\xd1\x07\xb8\x84\x78\x8b\x7d\x3d\x8e\x95\x30\x16\x91\
+\xc0\x0e\x05\xe6\x11\xfe\x4b\x7d\x1f\x30\x3c\x52\x9f\x44\xc4\xbf\
+\xbd\x81\xb7\x88\x93\x04\xbc\x0a\x6c\x14\xa7\x5b\x22\xd5\x74\x26\
+\xe1\xb3\xfa\x25\xc0\x0f\xb0\xc9\x85\x22\x52\x6c\x43\x80\xdb\x89\
+\x93\x04\xbc\x07\xec\x10\xa7\x5b\x22\xd5\xd1\x00\xfc\x88\xf0\x5f\
+\xe0\xf7\x81\xfd\x23\xf5\x49\x44\xe2\x68\xc0\x66\xed\xc7\x28\x25\
+\x3c\x1b\x38\x20\x4e\xb7\x44\xca\xaf\x17\x70\x3d\xe1\xbf\xb8\x0f\
+\x01\xeb\x44\xea\x93\x88\xc4\xb7\x17\xf6\x2b\x3d\xf4\xb9\x64\x11\
+\x70\x54\xa4\x3e\x89\x94\xd6\x00\xe0\x2e\xc2\x7e\x59\x97\x00\x3f\
+\x45\x8f\xf3\x88\x54\xc1\x70\xe0\x01\xc2\x27\x01\x8b\x81\xcf\x47\
+\xea\x93\xd4\x49\xab\xb6\xe5\x6b\x10\x30\x96\xb0\xf7\xd4\x66\x02\
+\x5f\x00\xfe\x1c\xf0\x3d\x24\x9e\x81\xc0\xea\x58\x7d\x88\xb6\x6d\
+\x55\xec\x78\x02\x68\x04\xfa\xb7\xfc\x73\x6b\xd2\xb7\xa8\xe5\xef\
+\x4c\xac\xc4\x33\xd8\x53\x26\xb3\xb1\xd2\xd2\x6d\xdb\x54\x60\x7a\
+\xb0\x1e\x48\x0c\xdd\x81\x6f\x01\xe7\x62\xf5\x03\x42\x69\x06\xce\
+\x00\x7e\x19\xf0\x3d\xc4\x81\x12\x80\x3c\xad\x01\xdc\x01\x6c\x19\
+\xf0\x3d\xc6\x01\x87\x03\xaf\x07\x7c\x0f\xf1\x6b\x28\x56\x03\x7e\
+\x04\x30\xb2\xe5\x6f\xdb\x16\x6b\x5d\x86\xf9\xc0\x44\xe0\x4d\xe0\
+\x8d\x96\xf6\x7a\xcb\x7f\x7b\x0e\x1b\x66\x96\xfc\x1d\x02\xfc\x9e\
+\xa5\x09\x61\x28\xdf\x00\x7e\x12\xf8\x3d\x44\x4a\x61\x18\xf0\x0c\
+\x61\x87\xe7\x6e\x00\x56\x89\xd5\x21\xa9\xd9\x00\x60\x0f\xe0\x64\
+\xe0\xd7\xc0\xbf\xb0\x09\x9a\xa1\x87\x6d\x7d\xb5\x29\xc0\x3d\x2d\
+\xb1\x9f\x04\xec\xde\xd2\x27\xc9\xcf\x86\xc0\x0b\x84\x3f\x26\x7e\
+\x18\xab\x43\x22\x45\xb5\x2e\xb6\xd0\x4e\xa8\x2f\xe1\x12\x6c\xd8\
+\x4f\x23\x3f\xf9\x68\xc4\x56\x58\x3b\x16\x5b\xd3\x61\x1c\x36\x0c\
+\x9f\xfa\x22\x1e\xa2\xbd\x02\x5c\x83\x95\xac\xdd\x15\xad\x31\x9f\
+\x8b\xc1\x58\x92\x19\xfa\xf3\xbf\x30\x52\x7f\x44\x0a\x67\x24\x76\
+\x82\x0c\xf5\xe5\x9b\x8d\x15\x11\x92\xb4\x1a\x81\x1d\x81\x73\xb0\
+\x5f\xc9\x73\x48\x7f\x61\x4e\xd5\x66\x03\x77\x03\xdf\x04\xb6\x6f\
+\xd9\x37\x92\x46\x77\xac\x7a\x60\xe8\xcf\xfc\xbc\x48\xfd\x11\x29\
+\x8c\x0d\x81\x49\x84\xfb\xd2\xbd\x01\x6c\x1d\xad\x37\xd2\xde\x06\
+\xd8\x50\xf8\x4d\xd8\x44\xba\xd4\x17\xde\x5c\xdb\x54\x6c\x42\xea\
+\x89\xc0\x7a\x75\xed\x69\x71\x75\x1a\xe1\xeb\x05\x9c\x13\xad\x37\
+\x22\x99\x1b\x44\xd8\x45\x7d\x1e\x42\x75\xba\x53\xd8\x0c\xfb\xb5\
+\x33\x8e\xf4\x17\xd6\xa2\xb6\x67\xb1\x7b\xc7\xbb\xa2\xdb\x56\x31\
+\x7d\x9c\xf0\x6b\x8d\x7c\x23\x5a\x6f\x44\x32\x76\x29\xe1\xbe\x64\
+\xd7\x60\x85\x84\x24\xbc\x6e\xc0\x2e\xc0\xcf\xb0\xba\xe8\xa9\x2f\
+\x9e\x65\x6b\xaf\x60\x33\xc9\x77\x46\xc9\x40\x0c\x1b\x13\xfe\x38\
+\x3e\x3d\x5a\x6f\x44\x32\x34\x04\x58\x88\xff\x2f\x56\x13\xca\xb0\
+\x63\x59\x07\x2b\xb3\x1a\x72\xf2\xa6\xda\xb2\xed\x4d\x6c\x64\x60\
+\xfd\x2e\x7c\x3e\x52\xbf\x35\x81\x27\x09\xf7\x39\x2e\xc1\x6e\x8d\
+\x89\x54\xd2\x71\xf8\xff\x52\xcd\x07\x0e\x8b\xd9\x89\x0a\xea\x83\
+\xd5\x50\xb8\x83\x78\x4b\xae\xaa\xad\xb8\x8d\x03\x4e\x40\x6b\xd2\
+\x87\x32\x00\x9b\xa8\x19\xea\xf3\x6b\x02\x8e\x8c\xd6\x1b\x91\x8c\
+\xfc\x18\xbf\x5f\xa6\x59\xc0\x3e\x51\x7b\x50\x2d\x5b\x02\xbf\xc1\
+\x66\xaf\xa7\xbe\xf0\xa9\x2d\x7f\xec\x5f\x09\x6c\xd1\xe1\xa7\x27\
+\xf5\xea\x49\xd8\xf5\x48\x16\x02\xfb\x45\xeb\x8d\x48\x26\x2e\xc7\
+\xdf\x97\xe8\x1d\x60\x9b\xb8\xe1\x57\x42\x37\xe0\x20\xf4\x6b\xbf\
+\x48\xed\x01\x6c\x84\x46\x4b\x5a\xfb\xd3\x0d\xf8\x15\xe1\x3e\xb3\
+\x59\x68\x29\x61\xa9\x98\xf3\xf1\xf3\xe5\x79\x19\xdd\x0f\xf5\x6d\
+\x10\xf0\x75\xac\xc4\x6d\xea\x0b\x9a\x5a\x7d\xed\x55\xe0\x4c\x54\
+\x85\xd0\xa7\xb3\x09\x97\x08\x4f\xc1\x26\x1f\x8a\x54\xc2\x81\xb8\
+\x7f\x69\x9e\x40\x8f\xf9\xf9\xb4\x3a\xf6\xf8\x5e\xe8\xc7\xa0\xd4\
+\xe2\xb5\x99\x58\x95\x45\x7d\x4f\xfc\xf8\x3c\xe1\x6a\x05\x4c\x04\
+\xd6\x8e\xd7\x15\x91\x74\xfa\x60\x59\x6f\xbd\x5f\x96\xbb\x09\xbf\
+\x90\x47\x55\x0c\xc1\x2e\xfc\xd3\x49\x7f\xc1\x52\x0b\xd3\x66\x61\
+\x89\xc0\x9a\x88\xab\xa3\x09\x97\x04\xfc\x07\x8d\xda\x48\x45\x9c\
+\x4e\x7d\x5f\x92\x1b\xd1\x33\xfe\x3e\xac\x09\xfc\x82\x6a\x97\xe4\
+\xad\x5a\x9b\x03\xfc\x1c\x5b\x78\x4b\xea\x77\x04\x61\x1e\x63\x6e\
+\x06\xfe\xc9\xd2\xe5\xaa\x25\x10\x15\xd4\x48\xaf\x1b\x70\x33\x36\
+\xd1\xac\xab\x7e\x87\x3d\xfa\xb4\x38\x48\x44\xd5\xd0\x17\xbb\xc7\
+\xff\xb5\x96\x7f\x2e\x83\x05\xc0\x5b\xd8\xca\x81\xd3\xda\xb5\xb9\
+\xd8\xe8\x06\xd8\xa3\x57\x33\xdb\x6d\xdb\x9f\xa5\xb5\xf8\x07\x62\
+\xab\x45\xae\xd6\xae\x0d\x01\x86\x53\x9e\xc4\x73\x36\x56\x5c\xe8\
+\x67\x58\x52\x20\xb5\x3b\x10\x2b\xdf\x1c\xe2\x98\xf8\x2d\x70\x7c\
+\x80\xd7\x15\xc9\x4a\x6f\xe0\xff\xe8\x3c\x2b\x5e\x8c\x15\x9d\x91\
+\xfa\x35\x02\x5f\x04\xde\x26\xfd\x2f\xd1\x7a\xda\x7b\xd8\xad\x9f\
+\x4b\x81\xaf\x62\x35\x1f\x76\x20\xee\xaf\xd9\x35\xb1\x05\x8d\x0e\
+\x03\xce\x68\x89\xe5\x1e\xdc\x6e\x67\xa5\x6c\x93\x80\x2f\xa0\xc5\
+\x88\xea\xb5\x3f\x30\x8f\x30\x9f\xcd\xd7\x23\xf6\x43\x24\x99\x06\
+\xe0\x53\xc0\xe3\x2c\xff\x25\x58\x08\xdc\x82\x16\xf4\x71\xb5\x3f\
+\x76\x7f\x31\xf5\x05\xa7\x2b\xad\x09\xab\x85\xff\xbf\xc0\x29\xc0\
+\x1e\xd8\x2f\xf0\xdc\xad\x01\x7c\x0c\xf8\x32\x36\x52\xf5\x1c\xc5\
+\x59\xde\x78\x3c\xb0\xaf\xff\x5d\x52\x09\xfb\x11\x26\x09\x68\xc2\
+\xce\x8b\x22\x95\xb1\x0e\xf6\x85\x3a\x1c\xd8\x1d\x4d\x88\x71\x35\
+\x0a\xf8\x3b\xe9\x2f\x30\x2b\x6b\x33\x5b\x62\xfc\x16\xb0\x17\xe5\
+\xfa\xcc\x07\x60\x05\xaa\xce\x05\xfe\x81\x4d\xc6\x4b\xbd\xbf\x57\
+\xd6\x6e\x01\xd6\x0d\xb2\x27\xca\x6d\x6f\xec\x56\x93\xef\xcf\x63\
+\x0e\xb6\x5c\xb4\x88\x48\x97\x75\xc7\x96\x37\xcd\xf1\x82\xb3\x18\
+\x2b\x63\xfb\x43\xec\x82\xdf\x33\xd0\x3e\xc8\x51\x23\xb0\x2d\x76\
+\x3b\xeb\x0e\x6c\xee\x42\xea\xcf\xa3\x7d\x9b\x8b\x3d\x15\x52\xa5\
+\xcf\xc5\x87\xbd\xb1\x72\xe4\xbe\x3f\x8f\xc9\xd8\xfc\x13\x11\x91\
+\x4e\xed\x0a\x3c\x43\xfa\x0b\x49\xdb\x36\x1d\xb8\x16\xbb\x77\xae\
+\xc7\x37\x97\x1a\x80\x8d\x76\x5d\x0f\xcc\x20\xfd\xe7\xd4\xb6\x8d\
+\xc7\x56\x20\x94\xae\xfb\x24\xb0\x08\xff\x9f\xc5\x43\x94\x67\x02\
+\xaa\x88\x04\x30\x00\xab\xd7\x9f\x4b\xd9\xde\xf7\xb0\x1a\xf5\xfb\
+\xa1\x5f\x93\x5d\xd1\x0b\x38\x00\xb8\x8a\x7c\x26\x15\x2e\x01\xae\
+\x40\x49\x5b\x2d\x8e\x23\xcc\x77\xf0\xf2\x98\x9d\x10\x91\xe2\xd8\
+\x85\x3c\x96\xe5\x9d\x0f\x8c\xc1\x7e\xd5\xea\x59\xe6\xfa\x35\x62\
+\xb7\x47\xae\x21\xcc\xbd\xe5\x5a\xdb\xeb\xd8\x64\x4c\xe9\x9a\x53\
+\x09\xf3\x39\x9c\x10\xb3\x13\x22\x92\xb7\xde\xd8\xbd\xf4\xd4\xb3\
+\xcd\x9f\xc5\xee\x6b\x17\x61\xb6\x7e\xd1\x0c\xc4\x4e\xfc\x0f\x90\
+\xf6\x33\x6e\x1d\x0d\x58\x25\x6c\x77\x4b\xe3\x3c\xfc\x7f\x06\x0b\
+\x81\x8f\x44\xec\x83\x88\x64\x6a\x0b\xe0\x29\xd2\x5d\x10\xe6\x03\
+\x37\x00\x3b\x85\xee\xa8\xfc\xd7\x36\xd8\x45\x38\xe5\xa8\xc0\xb3\
+\xd8\x44\x46\xe9\xdc\xcf\xf1\xbf\xff\x27\xa1\x92\xce\x22\x95\xd5\
+\x80\xad\x4c\x16\xaa\x14\x69\x67\xed\x4d\xe0\x9b\xe8\xd7\x7e\x4a\
+\x6b\x60\x8f\x4d\x4e\x22\xcd\x31\xb0\x10\x1b\xf1\x51\x45\xd5\x95\
+\x6b\xc0\x6a\x42\xf8\xde\xff\xf7\xa0\xe2\x4d\x92\x58\x23\x30\x12\
+\x2b\xd2\xa3\x8b\x41\x1c\xab\x91\xee\xb9\xfe\xf1\xc0\x91\x68\xad\
+\xf9\x9c\xf4\x00\x3e\x43\xba\x22\x4f\xb7\x60\xcb\x47\x4b\xc7\x7a\
+\x60\xf5\xfd\x7d\xef\xfb\xef\xc6\xec\x84\x48\xab\xed\x80\x3f\xb2\
+\xfc\x63\x4b\x13\x81\xef\xa3\x13\x42\x28\xa3\x81\x57\x48\x73\xe1\
+\x3f\x16\xfd\xe2\xc8\x59\x03\xb6\xa6\xc6\x63\xc4\x3f\x3e\x26\x62\
+\xe5\x91\xa5\x63\xfd\x81\xa7\xf1\xbb\xdf\x9b\xb0\xda\x03\x22\x51\
+\x34\x02\x3f\xa6\xf3\x09\x67\xef\xa1\xb2\xa2\xbe\x9d\x44\x98\x22\
+\x23\x2b\x6b\x8f\x60\x0b\x9e\x68\x98\xb7\x38\x1a\x80\x4f\x10\x3f\
+\x11\x98\x0f\x9c\x18\xa1\x7f\x45\x36\x1c\xbb\x7d\xe6\x73\xbf\xbf\
+\x0b\xac\x15\xb3\x13\x52\x4d\x0d\xd8\xf3\xc9\x5d\x3d\x30\x17\x52\
+\xdb\x2a\x7f\xb2\x62\x7d\x80\x3f\x10\xf7\x64\xfe\x22\x70\x68\x8c\
+\xce\x49\x30\x0d\xd8\xa3\x98\x2f\x11\xf7\xd8\xb9\x06\x7b\x32\x45\
+\x56\x6c\x34\xfe\xab\x73\xfe\x0b\x8d\xce\x49\x60\xf5\x3c\xd7\x3a\
+\x0d\x58\x3b\x45\xb0\x25\x31\x18\xb8\x9f\x78\x27\xef\xa9\xd8\xc4\
+\x2e\x55\x1c\x2b\x8f\x1e\xd8\x23\x84\xef\x12\xef\x38\xfa\x37\x30\
+\x34\x46\xe7\x0a\xea\x00\xac\x1c\xb6\xcf\x7d\x7e\x5e\xcc\x0e\x48\
+\xb5\x6c\x4e\xfd\x8f\x1d\x5d\x9c\x20\xde\x32\xd8\x02\x2b\xbe\x12\
+\xe3\x84\x3d\x1f\xab\x25\x50\xa6\x45\x78\x64\x59\x03\xb1\xdb\x77\
+\xb1\x6e\x23\xbd\x86\x9d\x37\x64\xc5\xbe\x88\xdf\xfd\xdd\x04\x7c\
+\x34\x6a\x0f\xa4\x12\xfa\x02\x13\xa8\xff\xc0\x9c\x81\x66\x8d\xd7\
+\x6a\x1f\xac\x76\x7e\x8c\x13\xf5\xbd\xc0\x26\x71\xba\x25\x19\xd8\
+\x80\x30\x33\xd2\x57\xd4\x66\x61\x73\x48\x64\xc5\x7e\x89\xdf\xfd\
+\xfd\x0a\xd0\x2f\x6a\x0f\xa4\xf4\x6a\xb9\xef\xdf\x51\x1b\x1d\x3d\
+\xea\xe2\x3a\x81\x38\xcf\xf7\x4f\x6d\x79\x2f\x4d\xf0\xab\xa6\xc3\
+\x89\x73\x5b\x60\x31\x76\xfb\x50\x96\xd7\x08\xdc\x8e\xdf\xfd\xfd\
+\xdb\xa8\x3d\x90\x52\x3b\x0c\x3f\x07\xe5\x7e\xb1\x03\x2f\xa0\x06\
+\x6c\x18\x3e\xf4\x09\x79\x09\xb6\x40\xcf\x6a\x71\xba\x25\x19\x5b\
+\x0d\x4b\xf0\x63\x2c\x1e\x75\x61\xa4\x3e\x15\xcd\xea\xc0\xab\xf8\
+\xdd\xd7\x87\x47\xed\x81\x94\xd2\x28\xfc\x0d\x43\xef\x19\x39\xf6\
+\xa2\x69\xc0\xff\x70\xe0\x8a\xda\xdb\xc0\xfe\x91\xfa\x24\xc5\xb1\
+\x17\xf0\x06\xe1\x8f\xbf\xcb\x80\x6e\x91\xfa\x54\x24\x5b\x03\x73\
+\xf0\xb7\x9f\xa7\xa0\x52\xc1\xe2\xa0\x3b\xf0\x30\xfe\x0e\xc8\x11\
+\x71\xc3\x2f\x94\x46\xc2\x94\x0a\x6d\xdf\x6e\x40\xbf\xfa\xa5\x63\
+\x03\xb0\x35\x06\x42\x1f\x87\xd7\xa2\x55\x22\x57\xe4\x38\xfc\xee\
+\xe7\x5b\xd1\xed\x3d\xa9\xd3\xb9\xf8\x3b\x10\x9f\x8a\x1c\x7b\x91\
+\xf4\x04\x6e\x22\xec\x09\xf7\x03\xe0\xe8\x58\x1d\x92\xc2\x3b\x0c\
+\xfb\x05\x19\xf2\x98\x1c\x83\xd5\xb7\x90\x65\x5d\x8c\xdf\xfd\x7c\
+\x7c\xdc\xf0\xa5\x0c\xb6\x02\x16\xe0\xef\x20\xfc\x5c\xdc\xf0\x0b\
+\xa3\x2f\x70\x27\x61\x4f\xb4\x77\x01\xc3\x62\x75\x48\x4a\x63\x4d\
+\xe0\x6e\xc2\x1e\x9b\x77\x62\xdf\x01\x59\xaa\x07\x56\xd4\xc7\xd7\
+\x3e\x9e\x81\xea\xb0\x74\x48\xc3\x23\xcb\xeb\x01\x3c\x8a\xdd\x93\
+\xf2\xe1\x11\x60\x67\x6c\x92\x91\x2c\xd5\x80\xad\xa5\x70\x44\xa0\
+\xd7\x6f\xc6\x7e\x4d\x9c\x89\xcd\xc2\xae\x8a\xc1\xc0\x3a\xd8\x05\
+\x6c\xb5\x76\xad\x17\xf6\x2c\x7c\x03\x76\x1f\xba\xb5\xe6\xc1\x0c\
+\x96\x4e\x82\x9b\x8e\x25\xbf\xd3\xda\xb5\xc9\xd8\x3d\xf2\xa9\x91\
+\xfa\x91\x83\x46\x6c\x24\xf0\x5c\xc2\xdd\xb7\xbf\x19\xf8\x14\xb6\
+\xef\xc5\x0c\x03\x9e\xc0\xdf\x3d\xfc\x31\x58\x69\x68\x91\x4e\x7d\
+\x17\x7f\xd9\xe7\x7c\x60\xb3\xb8\xe1\x17\xc6\x67\x08\xf7\xcb\x6a\
+\x2a\x56\x69\xac\xac\x06\x01\xbb\x62\x75\xe7\x7f\x05\x8c\xc5\xd6\
+\xa7\xf7\x39\x89\xaa\xa3\x36\xa7\xe5\xbd\x6e\x6b\x79\xef\x13\x5b\
+\x62\x29\xf3\xe2\x57\x07\x62\x49\x50\xa8\x7d\xfa\xe9\x78\x5d\x29\
+\x8c\x8f\xe2\xb7\x52\xe0\x51\x71\xc3\x97\x22\xda\x06\xbf\xcf\x9f\
+\x7f\x23\x6e\xf8\x85\x12\x6a\xe9\xd6\xc7\xb0\xe5\x99\xcb\x62\x00\
+\x36\x43\xfd\x1c\x6c\xd9\xd9\x49\x84\xbf\xc8\xd7\xdb\xde\x6a\x89\
+\xf1\x1c\xec\xa9\x97\xfe\x01\xf6\x47\x2a\xa3\x80\x71\x84\xd9\x6f\
+\x4f\x47\xec\x47\x91\x5c\x88\xbf\x7d\xfc\x3e\xb0\x46\xdc\xf0\xa5\
+\x48\x7a\x61\x4b\xbe\xfa\x3a\xe0\xfe\x8d\x16\xa7\xe8\xc8\x06\x84\
+\x39\x91\x5e\x47\xf1\x17\x61\x19\x00\x1c\x0c\x5c\x82\xfd\xd2\xee\
+\x6c\xd5\xc9\x9c\x5b\x13\x96\xe8\x5d\x8c\x0d\xc1\x16\x3d\x21\xe8\
+\x0d\x5c\x4f\x98\x7d\x35\x32\x5e\x37\x0a\xa3\x3b\xf0\x20\xfe\xf6\
+\xf1\xf5\x71\xc3\x97\x22\xf9\x3e\xfe\x0e\xb4\x79\xa8\xb4\xec\xca\
+\x7c\x12\xbf\x27\xcf\x25\x58\x01\xa1\xa2\x3e\x5f\xbd\x35\xb6\x90\
+\xc9\x83\xc0\x22\xd2\x5f\xb8\x43\xb5\x45\x2d\x7d\xfc\x0e\x36\xd1\
+\xb6\x88\x1a\xb0\xc5\xa2\x7c\x17\x0e\x52\xb9\xe0\x15\x1b\x89\x3d\
+\xc5\xe3\x6b\x3f\x97\xf9\xd6\xa0\xd4\x69\x33\xfc\x0e\xfd\x7f\x3d\
+\x6e\xf8\x85\x73\x1c\xfe\xf6\xf5\x3c\x6c\x3e\x41\x91\x74\x03\xb6\
+\xc5\x2e\xfa\xcf\x93\xfe\xc2\x9c\xaa\xbd\x0e\x5c\x84\xcd\x21\x28\
+\x5a\xf2\x76\x0c\x7e\x17\x15\xd2\x63\xaa\x1d\x3b\x14\xbf\xc7\x9c\
+\x9e\xbc\x90\xff\x6a\x00\xee\xc1\xdf\x01\xa6\xa1\xff\xce\xed\x8f\
+\x9f\x7d\xfd\x1e\xf6\x84\x45\x51\x6c\x84\xdd\xd7\x7c\x93\xf4\x17\
+\xdf\xdc\xda\x1b\xd8\x28\xdc\x86\x75\xef\xdd\xf8\x76\xc1\x5f\xbd\
+\x80\xbd\x23\xc7\x5e\x34\x57\xe2\xef\x58\x3b\x3f\x72\xec\x92\x31\
+\x9f\x4b\x52\x6a\xd6\x7f\xd7\xac\x81\xfb\xbd\xed\x89\x14\xe3\x62\
+\xd1\x1f\x9b\x29\xff\x10\xe9\x2f\xb2\x45\x69\x0f\x62\x8b\x34\x15\
+\x61\xce\xc0\x46\xb8\x97\x10\x5e\x8c\xd5\xc3\x97\x8e\xad\x82\xcd\
+\x89\xf1\x75\x9e\x2e\xc2\xb9\x43\x02\x5b\x1d\xbf\x15\xbf\xbe\x16\
+\x37\xfc\x42\xbb\x8b\xfa\xf7\xf3\x0b\xe4\x5f\x5a\x79\x03\x6c\x5e\
+\x82\xcf\xfb\x97\x55\x6b\x33\xb1\xd2\xbc\x9b\xd6\xb8\xef\x63\x5b\
+\x17\x78\x91\xfa\xfb\x79\x5b\xfc\x90\x0b\x69\x6b\xfc\xdd\xaa\xfd\
+\x67\xe4\xd8\x25\x43\xd7\xe0\xef\x64\xf5\x30\x1a\xfa\xaf\xc5\x2e\
+\xd4\x37\x91\xea\x29\x60\x68\x82\x78\xbb\xa2\x01\xd8\x17\x3b\xa1\
+\xc7\x58\x5d\xae\x2a\xad\x09\xf8\x07\xf0\x71\xf2\x2d\x5e\x36\x14\
+\x3b\x36\xeb\xe9\xdb\x0e\x09\xe2\x2d\xaa\xef\xe1\xef\xb8\xd2\x8a\
+\x81\x15\xb6\x07\xfe\x4e\xd2\x0b\xd0\xac\xff\x7a\x7c\x87\xda\xf6\
+\xf3\xa3\xe4\x39\x54\xda\x00\x1c\x84\xc5\x97\xfa\x62\x59\xf6\xf6\
+\x34\x70\x2c\x79\x4e\x1a\x1c\x48\xed\x8f\xad\x7d\x33\x49\xa4\xc5\
+\xd5\x13\x7f\x8f\x6b\xbf\x05\xac\x1a\x37\x7c\xc9\x41\x4f\xfc\xce\
+\xbe\xfe\x61\xdc\xf0\x4b\xa3\x01\x4b\x02\xba\x92\x88\xfd\x91\xfc\
+\x66\xef\x76\xc3\x2e\xfc\x8f\x93\xfe\xc2\x58\xb5\xf6\x0c\x96\x08\
+\xe4\x36\xea\xd6\x17\x3b\x56\x3b\x8b\xbf\x09\x2b\x98\x94\xeb\x88\
+\x46\xce\x7c\xde\x0a\xf8\x5e\xe4\xd8\x25\x03\x5f\xc3\xdf\x89\xe8\
+\x4d\x94\x45\xba\xfa\x30\xb6\x30\xca\x8a\x4a\x7f\x3e\x85\xad\xce\
+\x96\x9b\xfd\xb0\x8b\x50\xea\x0b\x61\xd5\xdb\x78\xec\xb6\x4b\x6e\
+\x0e\x67\xc5\xb7\x04\x16\x63\xa5\x9b\x35\xec\xef\xc6\xd7\xad\x80\
+\xb9\xd8\x1c\x0e\xa9\x88\x21\xf8\x9d\x98\x75\x68\xdc\xf0\x4b\x6d\
+\x08\x76\x9f\xf7\x18\xec\x97\x75\x8e\x5f\xcc\xcd\x80\xbf\x93\xfe\
+\xc2\xa7\xb6\x6c\xbb\x13\x2b\xe5\x9d\x9b\x75\xb1\x22\x3f\x47\x61\
+\x25\x9d\x73\xbc\x85\x55\x44\x3d\xf0\x37\xf2\x76\x6d\xe4\xd8\x25\
+\xa1\x5f\xe3\xef\xa4\xa3\x99\xa4\xd5\x31\x0c\xb8\x9a\x62\x97\xe6\
+\x2d\x7b\x6b\x02\x7e\x47\xbe\x93\x44\xc5\x2f\x5f\xb7\x02\x96\x60\
+\x93\x92\xa5\xe4\x36\xc1\x5f\xa9\xd5\x05\xd8\x33\xc0\x52\x6e\x0d\
+\xd8\xbd\xe6\xf7\x49\x7f\x81\x53\xeb\x5a\xfb\x00\x38\x8d\xfc\xe6\
+\x07\x88\x7f\xbe\x4a\xb8\x3f\x44\x05\xe7\x63\x54\xad\xc3\x63\xb1\
+\x21\x66\x1f\x2e\xc0\xd6\x09\x97\xf2\xda\x0a\xb8\x1c\xd8\x29\x75\
+\x20\x35\x58\x8c\xad\x18\xf8\x06\x56\x2c\x69\x2a\xb6\x94\x6d\x6b\
+\x5b\x84\x3d\x5f\xdf\xd4\x6e\xbb\x46\xac\xf0\x4e\x0f\x60\x35\x6c\
+\xa8\x7a\xb5\x96\x36\x12\xab\xbb\xb0\x16\xb6\x40\x4b\x51\x3c\x0c\
+\x9c\x84\x56\xdb\x2b\xb3\x3e\xd8\x82\x53\xeb\x79\x78\xad\xa3\xb0\
+\x09\x9c\x52\x42\x07\xe0\xef\x17\xc6\x44\xf2\x9b\x91\x2e\xfe\xf4\
+\xc4\x4a\xf6\xe6\xbc\x30\xcf\x5c\xec\x02\xf7\x1b\xe0\x0c\x60\x1f\
+\xec\x22\x1d\xf2\x57\x6f\x23\x76\x4f\x7b\x9f\x96\xf7\xbc\x0a\x2b\
+\x7d\x3d\x37\x62\xbf\x6b\x6d\x8b\xb0\x5f\x89\x3d\x03\xec\x0f\xc9\
+\xc3\x81\xf8\x39\x56\x5e\x45\xc7\x49\x29\x75\x07\x9e\xc3\xdf\x49\
+\xe5\xe0\xb8\xe1\x4b\x44\x5b\x00\x4f\x92\xfe\xc2\xd5\xbe\xbd\x06\
+\xfc\x1e\x38\x19\x18\x4d\x5e\xbf\xc4\x7b\x60\x8b\x1b\x9d\x8c\xc5\
+\xf8\x3a\xe9\xf7\x57\xfb\xf6\x24\xb0\x79\xa0\xfe\x4b\x7a\x37\xe3\
+\xe7\x38\x39\x25\x76\xe0\x12\x9e\xcf\x7a\xff\x63\x23\xc7\x2e\x71\
+\x74\xc3\x56\x71\xf4\xb9\xc2\x9b\x4b\x9b\x01\xdc\x84\x0d\x61\x6f\
+\x10\xb0\xdf\xa1\x7c\x08\x8b\xfd\x2f\x58\x5f\x52\xef\xcf\x66\x6c\
+\xe5\xc8\x33\xc9\xb3\x88\x90\xb8\x19\x01\xcc\xc6\xfd\x18\x79\x1b\
+\x5b\x77\x40\x4a\xa2\x37\xee\x8b\x75\xb4\xb6\x85\xd8\x89\x4d\xca\
+\x65\x18\x7e\x57\x84\xac\xb7\xbd\x87\x0d\xe9\xef\x0f\xf4\x0a\xda\
+\xe3\xb8\x7a\x61\xb7\xe0\xae\xc2\xef\xda\x1b\xf5\xb6\xbb\xd0\x93\
+\x02\x65\xf4\x4d\xfc\x1c\x1f\x67\xc5\x0e\x5c\xc2\x39\x1d\x7f\x27\
+\x8e\x8b\x23\xc7\x2e\xe1\x7d\x14\xcb\xfa\x53\x5d\x8c\xe6\x62\xcf\
+\x21\xef\x43\x35\x66\xad\x37\x62\x13\x71\xaf\xc3\x7e\x91\xa7\xda\
+\xef\x93\x80\x8f\x04\xee\xab\xc4\xd5\x13\x3f\xb7\x7a\x3f\x00\x06\
+\x45\x8e\x5d\x02\xe8\x0b\xbc\x83\x9f\x13\xc6\x2c\xf4\xab\xa1\x4c\
+\x1a\x80\x6f\x90\x6e\xa2\xdf\x38\x6c\x99\xe0\x01\xa1\x3b\x9a\xb1\
+\x81\xd8\x3e\x18\x47\x9a\xcf\x60\x11\x76\xdb\xa7\x6a\x4f\x43\x95\
+\xd9\x6e\xf8\x59\xe3\x45\x25\x82\x4b\xe0\x1c\xfc\x9d\x2c\xbe\x1d\
+\x39\x76\x09\x67\x55\xe0\xaf\xc4\xbf\xe0\x2c\xc4\x1e\x33\xda\x39\
+\x7c\x17\x0b\x67\x17\xe0\x4f\xf8\xab\xf1\x5e\x4b\xfb\x0b\x7a\xaa\
+\xa7\x4c\x6e\xc0\xfd\x98\x98\x05\xac\x11\x3b\x70\xf1\x67\x20\xf6\
+\x0c\xb4\x8f\x13\xc4\xbb\x40\xbf\xb8\xe1\x4b\x20\x6b\x13\x7f\x96\
+\xff\x2c\xe0\x27\xc0\xf0\x08\xfd\x2b\xba\xe1\xc0\x4f\xf1\x33\xa1\
+\xab\x96\xf6\x04\xfa\x7c\xca\x62\x14\x7e\x26\xf3\x6a\x91\xb7\x02\
+\xbb\x10\x7f\x27\x87\x93\x22\xc7\x2e\x61\x6c\x85\xbf\x09\xa1\x5d\
+\xbd\xf0\x5f\x84\x4d\x32\x94\xda\x0c\x06\xce\xc3\xef\xba\x1d\x9d\
+\xb5\xb7\x81\xed\x22\xf4\x4d\xc2\xfb\x25\xee\xc7\xc3\x6c\xec\x38\
+\x94\x82\x59\x0d\xab\x76\xe6\xe3\xa4\xf0\x02\xf6\x9c\xb3\x14\xdb\
+\x21\xc4\xfb\x55\x39\x0f\xf8\x11\x9a\x48\xe4\xc3\x6a\xd8\xe8\x49\
+\xac\xc7\x33\x67\xa3\x3a\x1f\x65\x30\x08\x3f\x23\xc0\xe7\x45\x8e\
+\x5b\x3c\xf8\x36\xfe\x4e\x08\x9f\x8a\x1c\xbb\xf8\x77\x0c\x71\x26\
+\xfb\x2d\xc1\xee\x3f\xfa\x28\x4b\x2a\xcb\x5a\x07\xb8\x82\x38\x8b\
+\x31\x2d\x06\xbe\x10\xa7\x5b\x12\xd0\x59\xb8\x1f\x0b\xd3\xa9\xf6\
+\x44\xdd\xc2\x59\x05\x7b\x9e\xda\xc7\x89\xe0\x11\x34\x43\xb8\xe8\
+\x4e\xc3\xcf\xac\xe0\xce\xda\xa3\x58\x35\x3c\x09\x6b\x07\xe2\x3c\
+\x35\xb0\x04\x3b\x76\xa4\xb8\x7a\xe3\xa7\x2a\xe5\xff\x8b\x1c\xb7\
+\x38\xf0\xf9\xdc\xff\x1e\x91\x63\x17\xbf\x7c\xfc\x02\xe8\xca\x2f\
+\x04\xad\x3c\x17\x57\x37\xe0\x04\xe2\x54\x18\xd4\x44\xb0\x62\xfb\
+\x1f\xdc\x8f\x81\x29\xd8\x93\x43\x92\xb9\x1e\xd8\x42\x3d\x3e\xbe\
+\xf8\x2a\xf9\x5b\x6c\x17\x10\xfe\xe2\x70\x13\xb6\x42\x9e\xa4\xb1\
+\x16\xf6\x08\x5f\xe8\xcf\xf9\x07\xb1\x3a\x24\xde\x75\xc3\x9e\xf0\
+\x70\x3d\x06\x34\x1a\x54\x00\x9f\xc7\xdf\x97\x5e\x55\xc2\x8a\xeb\
+\x70\xc2\x5e\x10\x3e\xc0\xe6\x15\x48\x1e\x8e\xc5\x46\x62\x42\x7e\
+\xe6\x47\x45\xeb\x8d\xf8\xb6\x2f\xee\x9f\xff\xab\x68\x94\x2f\x6b\
+\xdd\x80\x67\xf1\xf3\x65\x7f\x28\x72\xec\xe2\x4f\x2f\xc2\x3e\xea\
+\x77\x07\x56\x4b\x40\xf2\x32\x02\xab\xf1\x1f\xea\x73\x7f\x07\x5b\
+\x7b\x5e\x8a\xe9\x01\xdc\x8f\x81\xc3\xa2\x47\x2d\x5d\x76\x08\xfe\
+\xbe\xec\x1f\x8f\x1c\xbb\xf8\x13\xea\xd7\xff\x22\xac\x74\xb0\x26\
+\x85\xe6\xab\x01\x38\x1b\x9b\xc5\x1f\xe2\x18\x38\x3a\x5e\x57\xc4\
+\xb3\xfd\x71\xff\xfc\x1f\x8d\x1e\xb5\x74\xd9\x3d\xf8\xf9\x92\x3f\
+\x81\x4e\xf2\x45\x76\x05\xfe\x4f\xfc\x93\xb1\x45\x83\xa4\x18\xf6\
+\xc0\xdf\x1a\x20\x6d\xdb\xd5\x11\xfb\x20\xfe\x3d\x82\xfb\x31\xf0\
+\xe1\xe8\x51\x4b\xa7\x36\xc3\xdf\xa3\x5e\x87\x44\x8e\x5d\xfc\xba\
+\x0d\xbf\x27\xfd\x7b\x81\x35\xa3\xf6\x40\x7c\x58\x0b\xb8\x0f\xbf\
+\xc7\xc2\x7d\x51\x7b\x20\xbe\x1d\x84\xfb\x31\x70\x43\xf4\xa8\xa5\
+\x53\x57\xe2\xe7\x0b\xfe\x2c\x36\x97\x40\x8a\xeb\x76\xfc\x9d\xf0\
+\xaf\x42\x55\x20\x8b\xac\x27\xf0\xbf\xf8\x3b\x1e\x1e\x88\x1b\xbe\
+\x04\xf0\x28\x6e\xc7\xc0\x62\x54\xe8\x2b\x2b\x83\xf0\x57\xe2\x55\
+\x33\x7d\x8b\xef\x37\xb8\x1f\x07\x4d\xd8\xfd\x7e\x29\x87\xb3\xf0\
+\x53\x41\xf0\xba\xd8\x81\x8b\x77\x07\xe3\x7e\x1c\xfc\x34\x7a\xd4\
+\xd2\x21\x5f\xc5\x5e\x5e\x06\xba\x47\x8e\x5d\xfc\x3b\x02\xb7\xe3\
+\x60\x2e\xf0\xc9\xe8\x51\x4b\x68\x9f\xc2\x3e\x5b\x97\x63\xe3\xc4\
+\xe8\x51\x8b\x6f\x0d\xc0\x63\xb8\x1d\x07\xd3\xb0\x8a\xb3\x92\x58\
+\x23\x7e\x4a\x3d\x36\x63\x35\x04\xa4\xf8\xfa\x00\x93\xa8\xef\x18\
+\x98\x81\x26\xfb\x95\xd9\xee\xd4\xbf\x48\xd8\x0c\x6c\x61\x22\x29\
+\xbe\x43\x71\xbf\x5e\x1c\x1b\x3d\x6a\x59\x8e\xaf\x47\xff\xde\xc1\
+\x9e\x1f\x97\x72\x38\x9a\xda\x8f\x81\xf7\x81\xed\x53\x04\x2b\x51\
+\x6d\x8f\x7d\xd6\xb5\x1e\x1f\x67\xa4\x08\x56\x82\x68\xc4\x46\x7c\
+\x5d\xae\x19\x0f\x46\x8f\x3a\x80\xa2\x0f\x79\x1f\xef\xe9\x75\xae\
+\x00\x16\x78\x7a\x2d\x49\xef\x5a\x60\x4b\xba\x7e\x1f\xff\x6d\xac\
+\xf6\xc3\x7f\x82\x45\x94\xc6\xea\xd8\x13\x32\x1b\x03\xeb\x63\x6b\
+\x9b\xaf\x0e\xf4\x05\xe6\x60\x15\x0d\x17\xb2\xb4\x8a\xde\x5c\x6c\
+\x78\x73\x2a\xf0\x2e\x56\x56\xfb\xcd\x96\xff\x4f\x59\x3c\x86\x8d\
+\xf2\xdc\x0e\x0c\xef\xe2\x36\x7f\xc4\xd6\x97\x97\x72\x68\x02\x2e\
+\x01\x7e\xe1\xf0\x1a\x3b\x03\xdb\x00\x4f\x7a\x89\x48\x6a\x36\x0c\
+\x3f\x4b\xbc\x2e\xa4\xeb\x27\x02\x29\x96\x93\x81\x59\xac\xfc\xf3\
+\xbf\x0b\x3b\x96\x8a\xae\x07\xb0\x13\xf6\x4b\xf5\xaf\x58\xed\x02\
+\x1f\xa3\x63\x4d\xd8\x6d\xb6\x7f\x60\x0b\xe3\x1c\x05\x8c\x8c\xd2\
+\xa3\xb0\x86\x63\x15\x3f\x57\xd6\xf7\xc5\xc0\x4f\x28\xfe\x0f\x25\
+\x59\x5e\x3f\xdc\xcb\x47\xff\x3a\x7a\xd4\xf2\x5f\xdf\xc4\xcf\x09\
+\xee\xfa\xd8\x81\x4b\x54\x43\x81\xef\x60\x8f\xff\x7c\x80\x8d\xf4\
+\x4c\x04\xfe\x40\xf1\x2b\x3e\x8e\x04\x4e\x02\xc6\x60\xbf\xe8\x7d\
+\x7c\x1f\xba\xda\xde\xc6\x9e\x89\x3e\x1e\x58\x27\x70\x3f\x43\x69\
+\xc0\x26\x8d\x8e\x05\xe6\xb3\xb4\x6f\x93\xb1\x47\x40\xb7\x4c\x17\
+\x9a\x44\xf0\x0b\xdc\xbe\x03\xb3\x80\xfe\xd1\xa3\x16\x00\x26\xe0\
+\xe7\x44\xb6\x73\xec\xc0\x45\x1c\x6c\x06\x7c\x0f\x7f\xeb\x5e\xf8\
+\x6a\x4f\x03\xdf\x06\x36\x0d\xd7\xf5\xa0\x1a\xb0\x64\x71\x50\xea\
+\x40\x24\x9a\x51\xb8\x97\x8d\xfe\x62\xf4\xa8\x85\xdd\xf0\x73\xd2\
+\x7a\x22\x76\xe0\x22\x75\x18\x89\x8d\x78\x8d\x27\xfd\x85\xbe\x2b\
+\xed\x49\xe0\x54\x34\x6b\x5e\xf2\x77\x13\x6e\xc7\xba\x8a\x43\x25\
+\x70\x35\x7e\x4e\x54\x9f\x8d\x1b\xb6\x48\x97\x75\xc7\xea\x11\x8c\
+\xc5\x4f\x11\x9b\x14\x6d\x1e\xf6\x5d\xdd\xda\xef\xae\x11\xf1\xe6\
+\x23\xb8\x1f\xe7\x1b\x45\x8f\xba\xc2\xfa\xe3\xa7\xf2\xdf\x14\xb4\
+\xbc\xa7\xe4\x67\x28\xf0\x5d\xea\xaf\x65\x90\x6b\xbb\x1b\xf8\x98\
+\xc7\xfd\x24\xe2\xcb\x38\xdc\x8e\xed\xf3\xe3\x87\x5c\x5d\x9f\xc5\
+\xcf\x09\xe9\xc2\xc8\x71\x8b\xac\xcc\x48\xe0\x52\xdc\xab\xd5\xe5\
+\xde\xee\x43\xc5\x96\x24\x2f\x5f\xc4\xed\x98\x7e\x1d\xad\x21\x13\
+\xcd\xad\xb8\x9f\x84\x16\x03\x23\x62\x07\x2e\xb2\x02\x1b\x02\xd7\
+\x60\x8f\xa3\xa6\xbe\x38\xc7\x6c\x37\xb7\xf4\x5d\x24\xb5\x55\xa9\
+\xbf\x42\x64\x6b\xdb\x3d\x76\xd0\x55\x34\x18\x3f\x27\xca\xdb\x62\
+\x07\x2e\xd2\xce\x60\xe0\x62\xaa\x77\xe1\x6f\xdb\x16\x02\x3f\x42\
+\x75\xd5\x25\xbd\xdf\xe2\x76\x2c\xff\x2e\x7e\xc8\xd5\xf3\x25\xfc\
+\x9c\x78\xb4\xea\x9f\xa4\xd2\x1b\x5b\xc0\xca\xb5\x08\x49\x99\xda\
+\x2b\xc0\x3e\x2e\x3b\x55\xc4\xd1\x87\x71\x3b\x86\x67\xa2\x39\x65\
+\xc1\xfd\x0b\xf7\x93\xcd\x0c\xf4\x8b\x43\xd2\xd8\x09\x7f\xf5\x2b\
+\xca\xd8\xae\xc1\x86\x63\x45\x52\x70\xad\xad\x71\x68\xfc\x90\xab\
+\x63\x4d\xdc\x8b\x36\x34\x63\xeb\xc5\x8b\xc4\xd4\x1b\xf8\x31\x7e\
+\x8e\xdf\xb2\xb7\xe7\x81\xd1\xf5\xed\x66\x11\x27\x67\xe2\x76\xec\
+\xfe\x31\x7e\xc8\xd5\xf1\x55\xfc\x9c\x60\x76\x8b\x1d\xb8\x54\xda\
+\x46\xc0\x73\xa4\xbf\xb0\x16\xa9\xcd\xc3\xdf\x42\x5f\x22\x5d\xb5\
+\x3a\xcb\x96\x84\xae\xb5\xcd\xc1\x16\xda\x92\x00\x1e\xc4\xfd\xc4\
+\xf2\x2a\x56\xf2\x53\x24\x86\xbd\xb1\xf5\x07\x52\x5f\x50\x8b\xda\
+\x7e\x03\xf4\xac\x79\xaf\x8b\xd4\xef\x46\xdc\x8e\xd9\xc3\xe2\x87\
+\x5c\x7e\x6b\xe0\x67\xf8\xf4\xbc\xc8\x71\x4b\x75\x9d\x8c\x9f\xd5\
+\x2a\xab\xde\xee\x46\xf5\xf9\x25\x9e\xfd\x71\x3b\x5e\xff\x14\x3f\
+\xe4\xfa\x15\xe5\xd7\xf0\xe7\xb1\xc7\x34\x5c\x6d\x04\xbc\xe8\xe1\
+\x75\x44\x56\xe6\x1b\xd8\xe3\x6d\xb9\x58\x08\xbc\x06\xbc\x8c\x0d\
+\x53\x4e\x6f\xf9\x3b\xb7\xe5\x7f\x5f\x05\x1b\xba\x1c\xd8\xf2\x77\
+\x03\x6c\xa1\x94\x5c\x7e\x7d\x4f\x00\xf6\xc3\x56\x71\x14\x09\xa9\
+\x07\xb6\x1a\xe4\xea\x75\x6e\x3f\x17\xfb\xc1\x3a\xc7\x5b\x44\xc2\
+\x5f\x71\xff\x25\x71\x7f\xf4\xa8\xa5\x8a\x3e\x4f\xda\x5f\xcc\x33\
+\xb0\x62\x59\x67\x63\xb7\x20\x46\x01\x8d\x75\xf4\xa3\xb1\x65\xdb\
+\x7d\x5a\x5e\xeb\x56\xdc\x8b\xa5\xb8\xb4\x89\xa8\x70\x90\xc4\x71\
+\x15\x6e\xc7\xaa\x9e\x06\xf0\xa8\x37\xb6\xee\xb2\xeb\x09\xe4\x84\
+\xd8\x81\x4b\xe5\x6c\x8f\xdb\x24\xa2\x7a\xdb\x93\x58\x6d\x81\xd1\
+\xd4\x77\xb1\xef\xaa\x46\x60\xdb\x96\xf7\x7a\x2a\x41\x3f\x27\x53\
+\xdc\xe5\x86\xa5\x38\xf6\xc1\xed\x38\xbd\x3a\x7a\xc4\x25\xe6\x7a\
+\x4f\xa6\x19\x9b\x3f\x30\x24\x76\xe0\x52\x29\xbd\x70\x7f\x8e\xb8\
+\x96\xf6\x12\xb6\x68\xd0\x26\x31\x3a\xd7\x81\x4d\x5a\x62\x78\x89\
+\x78\xfd\x7e\x19\xcd\x09\x90\xb0\xba\x03\xef\x52\xff\x31\xfa\x1e\
+\x61\x13\xf1\x4a\xb9\x0c\xf7\x93\xc6\xbd\xd1\xa3\x96\xaa\xf9\x0a\
+\x71\x2e\x80\xe3\x80\x63\xc9\xeb\x04\xd3\x00\x1c\x04\xdc\x41\x9c\
+\x7d\x70\x51\x9c\x6e\x49\x85\x5d\x81\xdb\x31\xfa\xe1\xf8\x21\x97\
+\x4f\x03\xf0\x26\xee\x27\x8c\xaf\xc6\x0e\x5c\x2a\xa5\x01\x9b\x64\
+\x17\xf2\xa2\x77\x33\xb0\x73\xac\x0e\x39\xd8\x05\xb8\x85\xb0\xfb\
+\x62\x1e\x36\x61\x51\x24\x94\x3d\x71\x3b\x46\xb5\xda\xac\x07\x9b\
+\xe2\xe7\x84\x31\x2a\x76\xe0\x52\x29\xa3\x09\x77\xb1\x7b\x9a\x62\
+\x2e\x9f\xbb\x07\x30\x9e\x70\xfb\x45\x13\xad\x24\xa4\x46\xe0\x1d\
+\xea\x3f\x3e\x9f\x89\x1f\x72\xf9\x9c\x8a\xfb\x89\xe2\xc9\xe8\x51\
+\x4b\xd5\x84\x98\xf9\x3f\x0d\x38\x0d\xbb\x1f\x59\x54\xdd\xb0\xdb\
+\x15\x53\xf0\xbf\x7f\xce\x89\xd8\x0f\xa9\xa6\x5f\xe3\x76\x8c\x66\
+\xff\xc3\xb3\x5b\xea\x00\x3a\xb1\xa7\x87\xd7\xb8\xd9\xc3\x6b\x88\
+\xac\x4c\xbd\xcf\x0c\x77\xe4\xef\x58\xcd\x8a\x8b\xb0\x09\xac\x45\
+\xb5\x04\x5b\xe0\x67\x33\xe0\x1f\x9e\x5f\x5b\x25\x57\x25\x34\xd7\
+\x6b\xc7\xfe\x5e\xa2\xa8\xa8\x46\xfc\x94\x51\xdd\x32\x76\xe0\x52\
+\x39\x5f\xc4\xcf\xaf\xda\xf9\xd8\x64\xc2\xa2\x14\xe8\xaa\x45\x03\
+\x70\x3a\xfe\x1e\x93\xfc\x4a\xdc\xf0\xa5\x82\x7a\xe1\xf6\x08\xba\
+\x7e\x7c\x3a\xd8\x11\xf7\x93\xc4\x6b\xd1\xa3\x96\x2a\xda\x1a\xf7\
+\x63\xf5\xf9\x96\xd7\x29\xbb\xd1\xc0\x0b\xb8\xef\xaf\x6d\x63\x07\
+\x2e\x95\x34\x86\xfa\x8f\xd1\xe9\x14\xfb\x16\x5e\x52\xe7\xe0\x7e\
+\x92\xf8\x59\xf4\xa8\xa5\x8a\xba\x61\x17\xf0\x7a\x8f\xd3\x7b\xa9\
+\xd6\xac\xf6\x41\xc0\x7d\xd4\xbf\xbf\x26\x50\xce\x51\x12\xc9\xcf\
+\xc9\xb8\x5d\x83\x76\x8c\x1f\x72\x39\xdc\x85\x7b\x02\xf0\xd1\xe8\
+\x51\x4b\x55\x1d\x47\x7d\xc7\xe8\x9f\xb1\x6a\x97\x55\xd3\x1b\xb8\
+\x89\xfa\xf6\xd9\x21\x09\xe2\x95\x6a\x1a\x89\xdb\x35\x48\x93\x55\
+\xeb\xd0\x13\x7b\xd6\xd7\x65\xc7\xcf\x26\x9f\xc5\x4c\xa4\xfc\x1a\
+\x80\xdb\xa8\xed\x18\xbd\x94\xbc\x0a\xfa\xc4\xd6\x88\xed\x83\x5a\
+\xf6\x99\x8a\x00\x49\x6c\xcf\x51\xff\x75\xe8\xee\x04\xf1\x16\xde\
+\x4e\xb8\xff\xfa\xbf\x35\x7a\xd4\x52\x75\x03\xe9\x5a\x12\xb0\x08\
+\x7b\xc4\x4f\xcc\x97\x81\x05\xac\x7c\x9f\x35\x01\xe7\x93\xff\x93\
+\x4b\x52\x3e\x3f\xa3\xfe\xeb\xd0\x02\xf4\xc4\x4a\xcd\xce\xc0\x3d\
+\x01\xf8\x5a\xf4\xa8\x45\xec\x02\x75\x1c\x76\x9f\x7a\x45\x17\xfe\
+\xbf\x51\x71\xd3\xc9\x2c\x00\x00\x20\x00\x49\x44\x41\x54\x8d\xc9\
+\x7e\xb5\xda\x18\x7b\x64\x70\x06\xcb\xee\xb3\xb9\xc0\x5f\x80\x6d\
+\xd2\x85\x26\x15\xe7\x5a\x15\x70\x9f\xf8\x21\x17\xdb\x8d\xb8\x27\
+\x00\x3a\x61\x48\x6a\x1f\xc2\x6a\xe4\x1f\x0d\xec\x05\x0c\x48\x1b\
+\x4e\x21\x74\x07\x36\x07\x76\x6f\xf9\xbb\x4a\xd2\x68\x44\xec\x56\
+\xb2\xcb\xe3\x80\x17\xc4\x0f\xb9\xd8\x5c\xeb\xff\xbf\x8f\x86\x0a\
+\x45\x44\xc4\x8f\xb1\xd4\x7f\x3d\xba\x27\x41\xbc\x5d\x92\xe3\x45\
+\x72\x04\xb0\xb6\xe3\x6b\xdc\x83\x55\x21\x13\x11\x11\x71\x75\xbf\
+\xc3\xb6\x3b\x92\xe9\x84\xf4\x1c\x13\x00\x1f\x2b\x9e\x69\xe6\xa5\
+\x88\x88\xf8\xe2\x92\x00\xf4\x01\xb6\xf2\x15\x88\x4f\x39\x26\x00\
+\x3e\x0a\x27\x28\x01\x10\x11\x11\x5f\x1e\xc1\x66\xf4\xd7\x6b\x17\
+\x5f\x81\xf8\x94\x63\x02\xe0\x5a\xe2\xf3\x6d\xac\xd4\xa8\x88\x88\
+\x88\x0f\x0b\x80\xc7\x1d\xb6\x57\x02\xd0\x05\x0d\xb8\x2f\xde\xa3\
+\x5f\xff\x22\x22\xe2\x9b\xcb\x6d\x80\x5d\xbd\x45\xe1\x51\x6e\x0b\
+\x15\xac\x87\xfb\xa3\x52\x8f\xf8\x08\x44\xa4\x44\x7a\x61\x73\x6b\
+\x76\xc1\x96\xe6\xdd\x18\x58\x8d\xa5\xdf\xb5\x19\xc0\x34\x6c\x3d\
+\x83\x67\x81\x07\x80\x87\x71\x1b\xf2\x14\x29\x9b\xfb\x81\xb3\xea\
+\xdc\x76\x18\x36\xc1\xfd\x0d\x7f\xe1\x94\xcf\xa1\xb8\x3f\xff\xaf\
+\xc5\x17\x44\x2c\xb9\x3f\x10\x5b\x6b\x60\x0e\xb5\x7f\x8f\xe6\x60\
+\xf5\x38\x0e\x24\xbf\x1f\x0a\x22\x29\x0c\xc4\x2a\x52\xd6\x7b\x6d\
+\xd2\x1a\x16\x9d\x38\x1f\xb7\x8b\xff\x02\xec\xd7\x8e\x48\x55\xf5\
+\x04\x8e\x05\x5e\xc2\x3d\x99\x6e\x6d\xaf\x63\xa5\x8b\xab\xb8\x68\
+\x91\x48\x5b\x4f\x53\xff\xf7\xe8\xbb\x09\xe2\x2d\x14\x97\xb5\x97\
+\x9b\x81\xc7\xe2\x87\x2c\x92\x8d\x3d\x58\x71\x09\x62\x5f\xed\x65\
+\x60\xdf\x68\xbd\x11\xc9\xcf\x6f\xa8\xff\xfb\x33\x26\x41\xbc\x85\
+\xe2\x5a\x01\xf0\xd2\xf8\x21\x8b\x24\xd7\x17\xf8\x1d\xe1\x2e\xfc\
+\xed\xdb\x6f\x51\x89\x5e\xa9\xa6\x53\xa8\xff\x7b\x33\x29\x41\xbc\
+\x85\x31\x10\xf7\x13\xd3\xe7\xa2\x47\x2d\x92\xd6\x06\xc0\x7f\x88\
+\x77\xf1\x6f\x6d\xe3\xb1\x49\xbb\x22\x55\xb2\x0b\x6e\xdf\x9b\x61\
+\xf1\x43\x2e\x86\x1d\x71\x3f\x29\x6d\x16\x3d\x6a\x91\x74\x36\xc7\
+\x7e\x55\xc4\xbe\xf8\xb7\xb6\xc9\x68\x65\x43\xa9\x96\x55\x71\x9b\
+\x08\xb8\x7f\xfc\x90\x3b\x96\x53\x1d\x80\x0d\x1d\xb7\x9f\x85\x3d\
+\xc6\x24\x52\x05\x5b\x00\xf7\x01\x6b\x25\x8c\x61\x18\x56\x77\x43\
+\x89\xb7\x54\xc5\x6c\xe0\x15\x87\xed\xb3\x5a\xa5\x36\xa7\x04\xe0\
+\x43\x8e\xdb\x3f\x8e\x65\x66\x22\x65\xb7\x2e\xb6\x3a\xd9\xa0\xd4\
+\x81\x60\x31\x8c\xc5\x7d\x01\x2f\x91\xa2\x78\xca\x61\xdb\x4d\xbc\
+\x45\xe1\x41\x4e\x09\x80\xeb\x08\x80\xcb\x87\x22\x52\x14\x3d\x80\
+\x3f\x92\xf6\x97\x7f\x7b\x6b\x03\x37\x91\xe9\x8a\x67\x22\x9e\xb9\
+\x5c\x6b\x36\xf5\x16\x85\x07\x39\x25\x00\x1b\x39\x6e\x3f\xc1\x4b\
+\x14\x22\x79\xbb\x10\xd8\x29\x75\x10\x2b\xb0\x03\x56\xc7\x43\xa4\
+\xec\x5c\x12\x80\x8d\xc8\xeb\xba\x9b\x85\x06\xec\x1e\xbe\xcb\x84\
+\xa4\xdd\xa2\x47\x2d\x12\xd7\x16\xc0\x22\xd2\x4d\xfa\xeb\xac\x2d\
+\x26\xd3\x65\x4f\x45\x3c\x5a\x13\xb7\xef\xc9\xa8\xf8\x21\xe7\x6d\
+\x38\xee\x27\x9f\xa1\xd1\xa3\x16\x89\xeb\x41\xd2\x5f\xe4\x3b\x6b\
+\xf7\x06\xeb\xbd\x48\x3e\xa6\x51\xff\x77\xe4\x80\x04\xf1\xae\x50\
+\x2e\x43\x11\xae\x19\xd1\x34\xe0\x5d\x1f\x81\x88\x64\x6a\x1f\x6c\
+\x41\x9f\xdc\xed\x06\xec\x99\x3a\x08\x91\xc0\x5c\x9e\x04\xd8\xd8\
+\x5b\x14\x8e\x72\x49\x00\xd6\x71\xdc\x5e\x8f\xff\x49\xd9\xfd\xbf\
+\xd4\x01\xd4\xe0\xec\xd4\x01\x88\x04\xf6\xb2\xc3\xb6\xd9\x4c\x04\
+\x54\x02\x20\x92\xbf\x0d\x80\xdd\x53\x07\x51\x83\x8f\x01\xeb\xa7\
+\x0e\x42\x24\x20\x97\x11\x80\x0d\xbc\x45\xe1\x48\x09\x80\x48\xfe\
+\x8e\xc1\x26\xca\xfa\xf0\x16\x70\x1e\x36\x6b\x7f\x70\x4b\xdb\x01\
+\x5b\xa9\xec\x2d\x4f\xef\xd1\x00\x1c\xed\xe9\xb5\x44\x72\xe4\x92\
+\x00\x8c\xf4\x15\x44\x59\xfc\x0d\xb7\x89\x47\x07\xc5\x0f\x59\x24\
+\x9a\xc7\xf1\x33\x41\xef\xc7\xac\x7c\x11\x9f\x55\x80\x9f\x78\x7a\
+\x2f\xad\xcc\x29\x65\xb6\x1b\xf5\x7f\x37\x9a\x50\xcd\x8c\x65\xb8\
+\x9e\xe0\x5c\xab\x08\x8a\xe4\x6a\x10\x6e\xb5\xc7\x5b\xdb\x97\x6a\
+\x78\xcf\x2f\x79\x78\xbf\xc5\xd8\x02\x5f\x22\x65\xb4\x16\x6e\xdf\
+\x0f\xdd\x22\x6b\x63\x0a\xca\xa6\x44\x56\x64\x5f\xdc\x2f\xc6\xf5\
+\x2c\x93\x7d\x99\x87\xf7\xdd\xa7\x8e\xf7\x15\x29\x82\x06\x6c\x5d\
+\x80\x7a\xbf\x1b\x7b\xc5\x0f\x79\x79\x39\xcc\x01\xe8\x05\xac\xee\
+\xb0\xfd\x14\x60\xa1\xa7\x58\x44\x72\xe3\x5a\x21\x73\x3a\x70\x6e\
+\x1d\xdb\x9d\xd3\xb2\xad\x8b\x6c\x1e\x77\x12\xf1\xac\x19\x78\xcd\
+\x61\xfb\x2c\x8a\x01\xe5\x90\x00\x0c\xc6\x6d\x82\x93\xaf\x89\x4b\
+\x22\x39\x72\x9d\x31\x7c\x03\x56\x27\xa3\x56\xd3\x80\x1b\x1d\xdf\
+\x3b\x9b\xd9\xce\x22\x01\x28\x01\xf0\x60\xb0\xe3\xf6\x93\xbc\x44\
+\x21\x92\x27\xd7\x15\xff\xfe\x99\x68\x5b\x80\xd5\x1c\xb7\x17\xc9\
+\xd9\x3b\x0e\xdb\x8e\xf0\x16\x85\x83\x32\x24\x00\x1a\x01\x90\x32\
+\x5b\xd5\x71\xfb\x37\x12\x6d\x0b\xee\xb1\x8b\xe4\xcc\xa5\xfa\xec\
+\x9a\xde\xa2\x70\x50\x86\x04\x40\x23\x00\x52\x66\xae\xcf\xff\xbb\
+\x6c\xef\xab\xf6\x80\x48\x19\xb9\x24\x00\xc3\xbc\x45\xe1\x40\x09\
+\x80\x48\xde\x66\x39\x6e\xef\x52\x64\x6b\x6d\xc7\xf7\x9e\xed\xb8\
+\xbd\x48\xce\x94\x00\x78\xe0\xf2\x04\x00\x28\x01\x90\x72\xfb\xc0\
+\x71\xfb\xbd\x1d\xb6\x75\x7d\x8c\xcf\x35\x76\x91\x9c\xb9\x24\x00\
+\x83\xb0\x27\xe0\x92\x52\x02\x20\x92\x37\x97\x45\x47\x00\x8e\xa0\
+\xbe\x89\x84\x83\x80\xc3\x1d\xdf\xfb\x25\xc7\xed\x45\x72\xe6\x92\
+\x00\x34\x90\xc1\x12\xf6\x39\x24\x00\x03\x1c\xb7\x7f\xdb\x4b\x14\
+\x22\x79\x7a\xc1\x71\xfb\x41\xc0\xf9\x75\x6c\x77\x01\xee\x4f\x20\
+\xb8\xc6\x2e\x92\x33\x97\xa7\x00\x20\x93\x89\x80\xa9\xdd\x88\x5b\
+\xb9\x51\x4d\x54\x92\x32\x5b\x0d\x3f\xa5\x80\x8f\xaf\xe1\x3d\x8f\
+\xf7\xf0\x7e\x8b\x71\x4f\x20\x44\x72\x37\x8f\xfa\xbf\x23\x9f\x48\
+\x10\x6f\x76\x6e\xa3\xfe\x1d\x58\x4f\x81\x13\x91\xa2\xf1\xb1\x18\
+\xd0\x12\xe0\x42\xa0\xcf\x4a\xde\xa7\x0f\xf0\x83\x96\xff\xaf\xeb\
+\xfb\x8d\xf3\xd0\x6f\x91\xdc\x4d\xa4\xfe\xef\xc8\xe7\x12\xc4\xbb\
+\x8c\x1c\x6e\x01\xf4\x75\xd8\x76\xa6\xb7\x28\x44\xf2\xf5\x77\x0f\
+\xaf\xd1\x00\x9c\x8d\x2d\x9d\x7d\x0e\x30\x1a\xe8\xd7\xd2\x46\x03\
+\xdf\x6a\xf9\xdf\xfe\x1f\x7e\x46\xd5\xc6\x78\x78\x0d\x91\xdc\xb9\
+\x3c\xe9\xe2\x7a\xfb\xbb\x14\x5c\x7e\xdd\x3c\x9d\x20\x5e\x91\xd8\
+\x36\xc0\xcf\xaf\xf2\x98\x6d\xc3\x20\x7b\x42\x24\x2f\x8f\x52\xff\
+\x77\xe4\x3b\x09\xe2\x5d\x86\x46\x00\x44\xf2\xf7\x32\x70\x6f\xea\
+\x20\x6a\x70\x0f\xf0\x62\xea\x20\x44\x22\x98\xeb\xb0\x6d\xf2\x11\
+\x80\x1c\x12\x00\x97\x72\xa1\x33\xbc\x45\x21\x92\xb7\x1f\xa6\x0e\
+\xa0\x06\x17\xa6\x0e\x40\x24\x92\x39\x0e\xdb\x2a\x01\x60\xe5\x93\
+\x92\x3a\xa3\x11\x00\xa9\x8a\xdb\x81\x87\x52\x07\xd1\x05\x0f\x00\
+\x77\xa6\x0e\x42\x24\x12\x25\x00\x8e\xba\x3b\x6c\xab\x11\x00\xa9\
+\x92\x2f\x63\x8f\x04\xe6\xaa\x09\x38\x35\x75\x10\x22\x11\xe9\x16\
+\x80\x23\x97\x18\x34\x02\x20\x55\xf2\x24\xf0\xcb\xd4\x41\xac\xc4\
+\xcf\x80\xa7\x52\x07\x21\x12\x91\xcb\x08\x40\x7f\x6f\x51\xd4\x29\
+\x87\x04\xc0\xe5\x91\x23\x97\xec\x4b\xa4\x88\xce\x06\xfe\x9d\x3a\
+\x88\x15\x78\x0c\x38\x37\x75\x10\x22\x91\xb9\x5c\x83\x7a\x7a\x8b\
+\xa2\x4e\x39\x24\x00\x8d\x0e\xdb\xe6\x3c\x1c\x2a\x12\xc2\x22\xe0\
+\x48\x60\x72\xea\x40\xda\x98\x04\x1c\x0a\x2c\x4c\x1d\x88\x48\x64\
+\x2e\x23\x00\x5a\x0c\x08\xb7\x18\x96\x78\x8b\x42\xa4\x38\x26\x02\
+\xfb\x91\xc7\x1c\x98\x19\xc0\xfe\xc0\x9b\xa9\x03\x11\x49\xc0\x25\
+\xe9\x55\x02\x80\x12\x00\x91\x7a\x3c\x0d\x7c\x84\xb4\x8b\x61\xbd\
+\x0b\x7c\x0c\x18\x9f\x30\x06\x91\x94\x5c\x46\xb0\x75\x0b\x00\x25\
+\x00\x22\xf5\x7a\x06\xd8\x1d\x78\x2e\xc1\x7b\x3f\x0b\xec\x0a\x3c\
+\x91\xe0\xbd\x45\x72\xe1\x72\xfd\xd2\x08\x00\x6e\x17\xf1\x66\x6f\
+\x51\x88\x14\xd3\x4b\xc0\x0e\xc0\x35\x11\xdf\xf3\xea\x96\xf7\x7c\
+\x39\xe2\x7b\x8a\xe4\xc8\x65\x12\xbb\x12\x00\x6c\x52\x53\xbd\x34\
+\x02\x20\x62\x13\x91\x8e\xc3\x86\xe3\x5f\x08\xf8\x3e\xaf\x62\x73\
+\x0f\x3e\x87\x9e\xc0\x11\x01\xb7\x04\x40\xb7\x00\x80\x05\x0e\xdb\
+\x2a\x01\x10\x59\xea\x1e\x60\x4b\x2c\x19\x78\xc5\xe3\xeb\xbe\x09\
+\x9c\x0e\x6c\x06\x8c\xf5\xf8\xba\x22\x45\xe7\x72\x0d\xf5\xb1\xea\
+\xa6\x93\x1c\x12\x00\x97\x59\x94\x4a\x00\x44\x96\xb5\x10\xbb\x1d\
+\xb0\x09\x70\x08\xf0\x37\x60\x7e\x1d\xaf\x33\x0f\xb8\xb9\xe5\x35\
+\xd6\x07\x2e\xaa\xf3\x75\x44\xca\xac\xd0\x73\xd8\x5c\xca\xf0\xfa\
+\xa2\x11\x00\x11\xff\x16\x61\x17\xff\xbf\x61\xeb\x6d\xec\x82\x4d\
+\xda\xdb\x0c\xd8\x18\x58\x1d\x18\xd8\xf2\xff\x9d\x0e\x4c\x05\x26\
+\x60\x13\x0a\x1f\x68\x69\xba\xe0\x8b\xac\x9c\x12\x00\x47\x2e\x23\
+\x00\xc9\xef\xa1\x88\x14\xc0\x3c\x6c\x81\x1e\x2d\xd2\x23\xe2\x57\
+\xa1\x13\x80\xa2\xdf\x02\xe8\xeb\x2d\x0a\x11\x11\x91\xda\x28\x01\
+\x70\xe4\x32\xcc\xa8\x04\x40\x44\x44\x52\x59\xd5\x61\x5b\x25\x00\
+\xb8\xad\xe8\xa7\x04\x40\x44\x44\x52\x71\x59\xd2\x57\x09\x00\x6e\
+\xf5\xcc\x57\xf1\x16\x85\x88\x88\x48\x6d\x5c\x96\xf4\x4d\xbe\x98\
+\x5d\x0e\x09\xc0\x74\x87\x6d\x35\x02\x20\x22\x22\xa9\xb8\x8c\x00\
+\x24\x2f\xa6\x95\x43\x02\xe0\x32\x02\xa0\x04\x40\x44\x44\x52\x71\
+\x49\x00\x5c\x96\x12\xf6\x22\x87\x04\x40\x23\x00\x22\x22\x52\x44\
+\x4a\x00\x1c\x69\x0e\x80\x88\x88\x14\x91\xcb\x1c\x00\x25\x00\xb8\
+\x8d\x00\xb8\x64\x5f\x22\x22\x22\xf5\x6a\x00\xfa\x39\x6c\xaf\x04\
+\x00\x98\xe6\xb0\xed\x1a\xde\xa2\x10\x11\x11\xe9\xba\x55\x81\x46\
+\x87\xed\x35\x09\x10\x78\xc7\x61\xdb\x41\x40\x6f\x5f\x81\x88\x88\
+\x88\x74\xd1\x20\xc7\xed\x35\x02\x80\x5b\x02\x00\x30\xc4\x4b\x14\
+\x22\x22\x22\x5d\xb7\xb6\xe3\xf6\x2e\xb7\xbf\xbd\x28\x43\x02\x30\
+\xd4\x4b\x14\x22\x22\x22\x5d\x37\xdc\x71\xfb\xf7\xbd\x44\xe1\x20\
+\x87\x04\x60\x1e\x6e\x4f\x02\x0c\xf3\x15\x88\x88\x88\x48\x17\x29\
+\x01\xf0\xe4\x5d\x87\x6d\x35\x02\x20\x22\x22\xb1\x29\x01\xf0\xc4\
+\xe5\x36\x80\x12\x00\x11\x11\x89\xcd\x75\x0e\x80\x12\x80\x16\x93\
+\x1d\xb6\x55\x02\x20\x22\x22\xb1\xb9\x8e\x00\x4c\xf1\x12\x85\x83\
+\x5c\x12\x80\x89\x0e\xdb\x6a\x0e\x80\x88\x88\xc4\xa6\x5b\x00\x9e\
+\xbc\xee\xb0\xed\x28\x5f\x41\x88\x88\x88\x74\x41\x03\xb0\xa6\xc3\
+\xf6\x4b\x80\x0f\x3c\xc5\x52\xb7\x32\x24\x00\x1b\xf8\x0a\x42\x44\
+\x44\xa4\x0b\x56\x07\xfa\x38\x6c\x3f\x19\x58\xec\x29\x96\xba\xe5\
+\x92\x00\xbc\xe6\xb0\xed\x20\x60\x35\x5f\x81\x88\x88\x88\x74\x62\
+\x3d\xc7\xed\xdf\xf4\x12\x85\xa3\x5c\x12\x80\xd7\x81\x66\x87\xed\
+\x35\x0a\x20\x22\x22\xb1\x6c\xec\xb8\xbd\x12\x80\x36\xe6\xe3\xf6\
+\x28\xa0\x12\x00\x11\x11\x89\x65\x23\xc7\xed\xdf\xf0\x12\x85\xa3\
+\x5c\x12\x00\x70\xbb\x0d\xa0\x04\x40\x44\x44\x62\xd9\xc4\x71\x7b\
+\x8d\x00\xb4\xf3\x92\xc3\xb6\x4a\x00\x44\x44\x24\x16\xdd\x02\xf0\
+\xec\x79\x87\x6d\xd7\xf7\x16\x85\x88\x88\x48\xc7\xba\xe3\x7e\xcd\
+\x51\x02\xd0\xce\x73\x0e\xdb\x6a\x04\x40\x44\x44\x62\x58\x1f\xe8\
+\xe9\xf8\x1a\x2e\xc5\xef\xbc\xc9\x29\x01\x98\xe0\xb0\xed\x1a\xa8\
+\x24\xb0\x88\x88\x84\xe7\x7a\xff\x7f\x3a\xf0\x9e\x8f\x40\x5c\xe5\
+\x94\x00\xbc\x8a\x3d\x0d\x50\xaf\xad\x7c\x05\x22\x22\x22\xd2\x01\
+\xd7\xfb\xff\x2f\x78\x89\xc2\x83\x9c\x12\x80\x26\xdc\x26\x02\x6e\
+\xed\x2b\x10\x11\x11\x91\x0e\xb8\x26\x00\x2f\x7a\x89\xc2\x83\x9c\
+\x12\x00\x70\x9b\x07\xa0\x11\x00\x11\x11\x09\x6d\xb4\xe3\xf6\x1a\
+\x01\xe8\xc0\xb3\x0e\xdb\x6e\xe3\x2d\x0a\x11\x11\x91\xe5\xad\x82\
+\xfb\x1c\x00\x8d\x00\x74\xe0\x29\x87\x6d\x37\xc4\x3e\x1c\x11\x11\
+\x91\x10\xb6\xc5\x1e\x03\x74\xa1\x11\x80\x0e\x3c\xee\xb0\x6d\x23\
+\xb0\x85\xaf\x40\x44\x44\x44\xda\xd9\xce\x71\xfb\x25\xc0\xcb\x3e\
+\x02\xf1\x21\xb7\x04\xe0\x6d\xdc\xd6\x04\xd0\x44\x40\x11\x11\x09\
+\x65\x07\xc7\xed\x5f\x06\xe6\xfa\x08\xc4\x07\xd7\xa1\x8c\x10\x9e\
+\x00\xf6\xaf\x73\x5b\x25\x00\x7e\xf5\xc1\x8e\x91\x59\xa9\x03\x91\
+\xff\x1a\x0a\xf4\x05\x06\x02\x0d\x89\x63\xa9\xd7\x02\xac\x12\xda\
+\x8c\xd4\x81\x78\xd2\x13\xfb\x4c\x06\xb5\xfc\xad\xa5\x48\xcc\x42\
+\x60\x36\xf6\x6c\xf8\x6c\x60\x91\xf7\xe8\xc4\xa7\xed\x1d\xb7\x77\
+\xb9\xcd\x5d\x09\xdf\xc3\x96\x06\xae\xa7\xb9\xdc\x42\x10\xb3\x1d\
+\xf0\x5b\x6c\xb5\xaa\xd6\xfd\x3a\x1d\xb8\x19\x38\x88\xe2\x5e\x74\
+\x56\x64\x7b\xe0\x0a\xac\x06\xc5\x02\xac\x0e\xc5\xcb\xc0\x65\xe4\
+\xf1\x54\x49\x4f\xe0\x40\xe0\x97\xc0\x38\xec\x02\x51\xef\x77\x23\
+\xc7\xf6\x3c\xf0\x6d\xa0\xbf\xaf\x1d\x16\xc1\x9a\xc0\x67\x80\x4b\
+\x80\x3b\x58\xf6\x7b\xe2\xda\x96\x60\x4b\xa3\xdf\x0e\x5c\x04\x1c\
+\x81\x15\x39\x93\x3c\xac\x86\x7d\x46\x2e\x9f\xf1\x37\xa3\x47\x5d\
+\x30\x9f\xa2\xfe\x9d\xbb\x18\x18\x10\x3f\xe4\x52\xe8\x05\x5c\x4e\
+\xe7\x07\xf8\x5d\xc0\x5a\x89\x62\xf4\xa5\x0f\x70\x35\x2b\xef\x6b\
+\x13\xb6\x3f\x7a\x25\x88\x6f\x6d\xe0\xe7\xc0\xfb\x2b\x89\xaf\x4c\
+\xed\x1d\x60\x37\x2f\x7b\x2e\x8c\xf5\x81\xf3\xb0\xa7\x94\x62\xef\
+\x9b\x25\xc0\xd3\xc0\xb7\x80\x75\x03\xf7\x53\x56\xee\xe3\xb8\x7f\
+\x9e\x07\x44\x8f\xba\x60\xd6\xc5\x6d\x07\xef\x1b\x3f\xe4\xc2\xeb\
+\x09\xfc\x93\xae\xef\xe3\x57\x29\x6e\x12\xd0\x07\x78\x88\xae\xf7\
+\xf5\x6e\xdc\xeb\x7e\x77\x55\x3f\xe0\x67\xd8\x68\x44\xea\x8b\x72\
+\xec\xb6\x00\xd8\xd3\x7d\x17\x7a\xd3\x00\x1c\x0c\xdc\x87\xfb\xaf\
+\x3e\x5f\xad\x09\x4b\xc0\x75\x8e\x4b\xe3\x5b\xb8\x7f\x86\xc3\xa3\
+\x47\x5d\x40\x6f\x53\xff\x0e\xbe\x20\x41\xbc\x45\xf7\x13\x6a\xdf\
+\xcf\xf7\x63\x4f\x5e\x14\xcd\xef\xa8\xbd\xaf\x17\x47\x88\x6b\x37\
+\xfc\x0e\x27\x17\xb1\xbd\x0f\x0c\x71\xdd\x91\x1e\x1c\x0e\x8c\x27\
+\xfd\xfe\x58\x59\x1b\x87\xdd\x1e\x92\x78\x6e\xc1\xed\x33\x9b\x12\
+\x3f\xe4\x62\xfa\x33\xf5\xef\xe4\x7b\x13\xc4\x5b\x64\xeb\x61\xb7\
+\x4e\xea\xd9\xd7\xa7\x26\x88\xd7\xc5\x76\xd4\xf7\x6b\x6e\x31\xb0\
+\x69\xc0\xb8\x4e\xc3\x26\x7f\xa5\xbe\xa8\xe4\xd0\x7e\xe6\xb8\x2f\
+\x5d\x6c\x00\x8c\xed\x20\xae\x5c\xdb\x18\x60\x54\x88\x9d\x21\xcb\
+\x68\x04\xa6\xe1\xf6\x59\xdd\x11\x3d\xea\x82\x3a\x83\xfa\x77\xf2\
+\x7c\xa0\x77\xfc\x90\x0b\xeb\xfb\xd4\xbf\xaf\x67\x50\xac\x21\xad\
+\xcb\xa8\xbf\xaf\x3f\x09\x14\x93\xcb\xa4\xd7\x32\xb6\x77\x89\xff\
+\x78\x72\x03\xf0\x35\xec\xdc\x91\xba\xff\xf5\xb4\xb9\xc0\xc9\xde\
+\xf7\x8a\xb4\xb5\x03\xee\x9f\xd3\x8f\xa3\x47\x5d\x50\x3b\xe2\xb6\
+\xa3\x77\x89\x1f\x72\x61\x3d\x88\xdb\xbe\xfe\x73\xfc\x90\xeb\xf6\
+\x22\xf5\xf7\xf3\xc9\x00\xf1\x9c\xe5\x10\x4f\x99\xdb\x66\x2e\x3b\
+\xb5\x46\xab\x03\x7f\x0f\xd4\x8f\xd8\xed\x2f\xd8\xe3\xa1\xe2\xdf\
+\xd9\xb8\x7f\x3e\x87\x44\x8f\xba\xa0\x7a\x00\x73\xa8\x7f\x47\x9f\
+\x15\x3f\xe4\xc2\x7a\x13\xf7\x03\xfb\xa0\xe8\x51\xd7\xae\x01\xb7\
+\x5f\x78\x1f\x78\x8e\xe7\x20\xf2\x99\x5c\x96\x5b\xdb\xdb\x61\xbf\
+\xd6\x62\x14\x6e\x49\x61\x8e\xed\x39\x60\x1d\x9f\x3b\x49\x00\xb8\
+\x13\xf7\xcf\x66\x58\xf4\xa8\x0b\xec\x5e\xea\xdf\xd1\x7f\x4f\x10\
+\x6f\x51\x4d\xc1\xfd\xc0\x9e\x08\xac\x1a\x3b\xf0\x1a\x35\xe2\xd6\
+\xc7\x05\x1e\x63\x59\x0b\x98\xea\x18\x4f\x99\xdb\xae\xf5\xef\xda\
+\x2e\xdb\x1c\x98\x94\xa8\x7f\xa1\xdb\x24\x54\x16\xdd\xa7\x5e\xd8\
+\x6d\x16\x97\xcf\x24\x9b\xf2\xbf\x6d\xe5\x56\x0a\xb8\xad\x87\x1c\
+\xb6\xdd\x8d\x78\x8f\x6e\x09\x8c\xc0\x9e\x93\x96\xae\xf9\x05\x56\
+\x54\x44\x96\xd7\x8c\x3d\x66\x1a\xd2\x96\xd8\x53\x2c\x45\x7d\x94\
+\xb5\x33\x6b\x61\xbf\x58\x3f\x94\x3a\x90\x92\xd8\x19\x7b\x7c\xd8\
+\x85\xcb\xf5\xac\x92\xf6\xc3\x2d\xe3\xfa\x58\xfc\x90\x0b\xc9\xc7\
+\x08\x40\x33\x36\x53\xde\x75\x9d\xec\x90\x72\x19\x01\xd8\xd9\x31\
+\x8e\xb2\xb7\xd0\xd5\x3c\x47\xe1\xf6\x98\x71\x91\xda\x1b\xe8\x76\
+\x80\x0f\x17\xe0\xfe\x59\x9c\x14\x3d\xea\x82\xeb\x8b\xdb\x3d\x5b\
+\xcd\xb8\xec\x1a\x5f\x09\x40\x33\xf0\x18\xf9\xd6\x06\xc8\x25\x01\
+\x28\xcb\x84\xb3\x50\xed\xe8\xfa\x77\x6d\xa7\xfa\x63\x4b\xb1\xa6\
+\xee\x63\xcc\xf6\x04\x7a\x2a\xca\xd5\xc3\xb8\x7f\x0e\x39\x94\x16\
+\x2f\x9c\xfb\xa8\x7f\x87\xff\x27\x41\xbc\x45\xe4\x33\x01\x68\x26\
+\xdf\xda\x00\x39\x24\x00\x23\xd1\xc4\xbf\x95\xb5\x3b\x08\x7b\x5b\
+\xf2\x0f\x19\xf4\x31\x45\xbb\xcc\xc7\xce\xab\xa8\xfe\xb8\xd7\xe8\
+\x98\x49\xbe\x3f\x8c\xb2\xf6\x1d\xdc\x76\xfc\xba\xf1\x43\x2e\x1c\
+\xdf\x09\xc0\x4c\xac\x96\x7d\x6e\x72\x48\x00\xce\x71\x8c\xa1\xcc\
+\x6d\x1c\xf6\x48\x5e\x28\x27\x64\xd0\xc7\x94\xed\x08\xf7\x5d\x58\
+\x49\x07\xe3\xbe\xef\x6f\x8d\x1e\x75\x17\xe5\x3c\x09\x10\x6c\x22\
+\x8b\x0b\xd5\xcc\x8e\xaf\x1f\xb6\x7a\x9d\x2c\x6f\xbf\xd4\x01\x64\
+\x68\x31\x70\x29\x36\x71\x77\x6a\xa0\xf7\x18\x86\x6e\x09\xfe\x9a\
+\xb0\x09\x56\x59\xf9\x78\x76\xdf\xf5\x3a\x16\x4c\xee\x4b\xbb\x76\
+\xc7\x4e\x0a\xf5\x2e\x17\xfa\x37\x54\x7c\xa1\x33\x53\x80\xc1\x01\
+\x5e\xf7\x60\xac\x76\x76\x2e\x1a\xb1\x8b\x4d\xbd\x16\xe2\xb6\x32\
+\xe0\x2a\xd8\xb2\xca\x3d\x1c\x5e\xa3\xd5\x14\x96\xd6\x6f\x28\xa2\
+\x26\xec\x51\xb5\x47\x80\x3f\x61\x4b\xe0\x86\x74\x3d\x70\x64\xe0\
+\xf7\x98\x83\x55\x31\x9c\x4e\x6d\x9f\x4b\x37\x6c\x05\xd3\x35\x71\
+\x9f\x69\xde\x99\xcb\x50\xc5\xc0\x5a\x34\x62\x2b\x55\xba\x9e\x1f\
+\xb7\xc6\x56\x74\x94\x3a\x8c\xa1\xfe\xa1\x97\xd9\xa4\x59\xce\xb5\
+\x48\x7c\xdf\x02\x68\x6d\xb9\xd5\x06\x48\x7d\x0b\x60\x1b\xc7\xf7\
+\x6f\xc6\x16\xcb\x39\x92\xfc\x13\xf7\x9c\xec\x4a\x98\xe3\x7b\x21\
+\x36\x67\xe1\x14\x6c\x3d\x0d\xd7\xcf\xa4\x1b\xf6\xd8\xde\x69\xc0\
+\x3d\xd4\xbf\x3e\xc7\xca\x5a\x13\xf6\x08\xa4\x74\xcd\xee\xb8\xef\
+\xf3\x29\xe4\x3f\xd2\x9e\xb5\x53\x71\xfb\x00\x62\x55\x15\x2b\xaa\
+\x50\x09\x40\x33\xf0\xd3\x88\xfd\xe8\x4c\xea\x04\xe0\x70\xc7\xf7\
+\x5f\x02\xec\xe1\x18\x43\x15\xdd\x8e\xff\x0b\xff\x65\x84\xaf\xea\
+\xb6\x0e\xb6\x72\x65\x93\xe7\xf8\xff\x18\x38\xee\x32\xf9\x25\xda\
+\xdf\xc9\x8d\xc2\xed\x03\xf8\x75\xfc\x90\x0b\x25\x64\x02\x90\x53\
+\x6d\x80\xd4\x09\x80\xeb\x24\xb4\xb1\x8e\xef\x5f\x45\xdb\xe3\xf7\
+\x78\xbe\x0f\xd8\x30\x6a\x0f\xac\xa2\xdf\x63\x1e\x62\x6f\xfb\x9d\
+\xdc\x28\x6a\x0f\x8a\xeb\x55\xdc\xf7\xf7\x17\xa3\x47\x5d\x42\xcf\
+\x52\xff\x07\xf0\x1e\x36\x97\x40\x56\x2c\x64\x02\xd0\x4c\x3e\xb5\
+\x01\x52\x27\x00\x5f\x75\x7c\xff\x9f\x3b\xbe\x7f\x15\xfd\x1f\xfe\
+\x8e\xe3\xab\x48\x57\x5d\xb4\x0f\x36\x8f\xc1\x57\x5f\x2e\x89\x1b\
+\x7e\x21\x8d\xc6\xcf\xbe\x5e\x2f\x76\xe0\xb5\x28\xca\xbd\x89\x31\
+\x0e\xdb\x0e\xc1\xee\xe5\x48\x1a\xdb\xa1\x89\x47\xe0\x9e\x04\x2d\
+\xf2\x12\x45\x75\xf4\x03\x3e\xe9\xe9\xb5\xbe\x0b\x1c\x8f\x0d\xff\
+\xa7\x30\x0f\xf8\x0c\xfe\x92\xc0\x23\x51\xa9\xf4\xce\x1c\xec\xe1\
+\x35\x5e\x21\x7c\x59\x6b\x27\x45\x49\x00\x5c\x17\xf7\xd1\x33\xb0\
+\x69\x7d\x9f\x3c\x6b\x03\x48\x79\x1d\x86\x55\x13\x75\x75\x23\x96\
+\x00\xa4\xd6\x0c\x7c\x1d\x3f\x4f\xd6\xac\x0e\xec\xef\xe1\x75\xca\
+\xcc\x47\xf2\x98\xd3\x53\x50\x2b\x54\x94\x04\xe0\x61\x6c\x06\x74\
+\xbd\x0e\x43\x19\x6f\x4a\xaa\x0d\x20\xb1\xf9\xf8\x05\xf7\x38\x70\
+\x2c\x76\xf1\xcd\xc1\x12\xe0\x18\x60\x82\x87\xd7\xd2\xe3\xd1\x1d\
+\x1b\x89\x9f\xd5\x14\x5d\x46\xae\xa3\x28\x4a\x02\xd0\x04\xdc\xe6\
+\xb0\xfd\x20\x34\x83\x3a\xb5\x43\x81\x4f\xa4\x0e\x42\x2a\xa1\x11\
+\x2b\x2c\xe4\xea\x34\x6c\x3d\x92\x9c\xcc\x02\xce\xf0\xf0\x3a\x5a\
+\x2c\xad\x63\x3e\x46\x8c\xa7\x03\x0f\x78\x78\x9d\xa0\x8a\x92\x00\
+\x80\x7b\x36\xf5\x69\x2f\x51\x88\x8b\x8b\xc9\xab\x36\x80\x94\xd3\
+\x36\x58\xd2\xef\xe2\x2f\xc0\x83\x1e\x62\x09\x61\x2c\x70\x97\xe3\
+\x6b\xac\x03\x6c\xe0\x21\x96\x32\x3a\xc6\xc3\x6b\xdc\x4a\x01\xe6\
+\xed\x14\x29\x01\xf8\x07\x56\x6d\xab\x5e\x9f\x44\xb7\x01\x52\x1b\
+\x01\x9c\x97\x3a\x08\x29\xbd\xed\x3d\xbc\x46\x0e\xf7\xfd\x57\xc6\
+\x47\x7c\x3e\xf6\x53\xd9\x6c\x4b\x45\x86\xff\xa1\x58\x09\xc0\x5c\
+\xdc\x6e\x03\x0c\x04\x3e\xee\x29\x16\xa9\xdf\xe9\xe4\x53\x1b\x40\
+\xca\xc9\xf5\x39\xf7\x27\x80\xf1\x3e\x02\x09\xe8\x01\xdc\x67\x98\
+\xab\x1e\xc0\xf2\x8e\xf5\xf0\x1a\x8b\x28\x48\xdd\x8e\x22\x25\x00\
+\x00\x37\x38\x6e\xff\x59\x1f\x41\x88\x93\x46\xe0\x0a\xf2\xa8\x0d\
+\x20\xe5\xe4\x7a\x61\x73\xf9\xa1\x11\x4b\x33\xee\x17\x19\x25\x00\
+\xcb\xea\x01\x1c\xe5\xe1\x75\xee\xc7\xe6\x00\x64\xaf\x68\x09\xc0\
+\x3f\xb0\xfa\xfe\xf5\xfa\x04\xe1\x4b\x78\x4a\xe7\x54\x1b\x40\x42\
+\x5a\xc7\x71\xfb\x87\xbd\x44\x11\x9e\xeb\x1c\x85\x11\x5e\xa2\x28\
+\x8f\xfd\xb0\xba\x31\xae\x5c\x7f\xa8\x46\x53\xb4\x04\x60\x2e\x96\
+\x04\xd4\xab\x3b\xf0\x3f\x9e\x62\x11\x37\xaa\x0d\x20\xa1\xf4\x73\
+\xdc\xfe\x05\x2f\x51\x84\xe7\x1a\x67\xbd\xab\xac\x96\x95\x8f\xe1\
+\xff\xc5\xc0\x5f\x3d\xbc\x4e\x14\x45\x4b\x00\xc0\x0a\x73\xb8\x38\
+\x1e\xad\xa6\x96\x03\xd5\x06\x90\x50\x5c\x2f\x6c\xef\x79\x89\x22\
+\x3c\xd7\x38\x5d\x13\xa5\x32\x59\x0d\x38\xd0\xc3\xeb\xdc\x49\x71\
+\x8e\x9f\x42\x26\x00\xb7\xe2\x76\x1b\x60\x43\x6c\x89\x50\x49\x4f\
+\xb5\x01\x24\x84\x3e\x8e\xdb\xcf\xf3\x12\x45\x78\xd3\x1c\xb7\xef\
+\xe1\x25\x8a\x72\x38\x12\x3f\x4b\xc7\xff\xc9\xc3\x6b\x44\x53\xc4\
+\x04\x60\x1e\x70\x93\xe3\x6b\x7c\xde\x47\x20\xe2\x85\x6a\x03\x88\
+\x6f\xae\x23\x7c\xb9\x54\xfe\xeb\xcc\x1c\xe0\x03\x87\xed\xdf\xf2\
+\x15\x48\x09\xf8\xb8\x35\xbc\x90\x02\x94\xff\x6d\xab\x88\x09\x00\
+\xc0\x35\x8e\xdb\x7f\x1a\x7b\x2c\x50\xd2\x53\x6d\x00\x91\xfa\xb9\
+\x4c\x04\xbc\xdf\x5b\x14\xc5\xb6\x19\xb0\x93\x87\xd7\x19\x8b\xfb\
+\xa8\x4c\x54\x45\x4d\x00\xee\x01\x5e\x73\xd8\xbe\x0f\xaa\x0c\x98\
+\x13\xd5\x06\x10\xa9\xcf\x1f\xea\xdc\xae\x19\xb8\xce\x67\x20\x05\
+\x76\xaa\xa7\xd7\xf9\xa3\xa7\xd7\x89\xa6\xa8\x09\x40\x33\x70\xad\
+\xe3\x6b\x9c\xe4\x23\x10\xf1\x52\x2b\xbd\x11\xb8\x1c\xd5\x06\x10\
+\xa9\xd5\x8d\xc0\xa3\x75\x6c\x77\x3d\x56\xf0\xa8\xea\x06\xe2\xa7\
+\xf4\xef\x2c\x0a\x52\xfd\xaf\xad\xa2\x26\x00\x60\xb7\x01\x5c\xee\
+\xd5\x6d\x85\x16\xc4\xf0\xe1\x07\x9e\x5e\x67\x7b\x54\x1b\x40\xa4\
+\x56\x4b\xb0\xd1\xcc\x77\x6b\xd8\xe6\x59\xf4\x03\xa8\xd5\xe7\xf0\
+\xb3\x6c\xf4\x9f\x70\x9b\x9c\x2e\x75\x78\x08\x4b\x02\xea\x6d\x85\
+\xcb\xd8\x02\x98\x82\xdb\x3e\x5c\x1d\xf7\xcf\xa1\xb5\xcd\x24\x5c\
+\x6d\x80\x46\xc7\xd8\x16\x38\xbe\xff\xd7\x1c\xdf\xff\x47\x8e\xef\
+\x5f\x25\x0b\x70\xdb\xd7\xdd\xe3\x87\xec\x6c\x7d\xe0\x19\x3a\xef\
+\xdb\x5d\xc0\xe0\x44\x31\xe6\xa6\x01\xab\xa5\xe0\xe3\xdc\xe5\x63\
+\x0e\x81\xd4\xe8\x44\xdc\x3e\xb4\x26\xec\xb1\xc0\x2a\x73\x4d\x00\
+\x06\x01\x5b\x62\x33\x60\x7d\x7c\x91\xfe\x1c\xa8\x9f\x4a\x00\xaa\
+\xa3\x8a\x09\x00\xd8\x63\x7d\x27\x03\x8f\xb3\x6c\x7f\x16\x03\xf7\
+\x61\xcb\xdc\xaa\x06\xca\x52\xfb\xe3\xe7\x9c\x35\x21\x76\xe0\x62\
+\xfa\x01\x33\x70\xfb\xf0\x2e\x8d\x1e\x75\x5e\x7c\x24\x00\x00\x3f\
+\x75\x7c\x9d\xb6\x2d\x44\x6d\x00\x25\x00\xd5\x51\xd5\x04\xa0\xad\
+\xd5\xb0\x55\xed\x36\x45\x05\x7f\x3a\x72\x1b\x7e\xce\x57\x67\xc4\
+\x0e\x5c\x96\xba\x1c\xb7\x0f\x6f\x0e\x36\x8c\x5d\x55\xbe\x12\x80\
+\x55\xb0\xd5\xc9\x7c\x7c\xa1\x26\xe2\xbf\x36\x80\x12\x80\xea\x50\
+\x02\x20\x9d\xd9\x00\x1b\x01\x76\x3d\x57\x2d\xa2\xc0\xeb\xcb\x14\
+\x79\x12\x60\xab\xcb\x1c\xb7\x5f\x05\x2b\x0f\x2c\x6e\xe6\x02\xa7\
+\x78\x7a\x2d\xd5\x06\x10\x91\x90\xbe\x8c\x9f\xeb\xdf\x2d\xc0\x3b\
+\x1e\x5e\x47\x1c\x3c\x8c\x5b\x16\xf7\x16\xd0\x33\x7a\xd4\x79\xf0\
+\x35\x02\xd0\xea\xcf\x8e\xaf\xd7\xda\x16\xe3\xb7\x36\x80\x46\x00\
+\xaa\x43\x23\x00\xb2\x32\x7d\xb1\x0a\x8a\x3e\xce\x53\xfb\x45\x8e\
+\xdd\xab\x32\x8c\x00\x80\xdd\x06\x70\x31\x1c\x9b\x20\x23\xee\x4e\
+\xc5\xcf\x5a\xd8\x8d\xc0\x15\xa8\x36\x80\x88\xf8\x75\x3c\x7e\x2a\
+\xc1\xbe\x04\xdc\xee\xe1\x75\x92\x29\x4b\x02\x70\x03\xee\x25\x18\
+\xbf\x49\x79\xf6\x47\x4a\x93\x81\x6f\x7b\x7a\xad\xed\x50\x6d\x00\
+\x11\xf1\xa7\x07\xfe\x26\xed\x5d\x82\xd5\x61\x28\xac\xb2\x5c\xf0\
+\xe6\x01\x57\x3b\xbe\xc6\x26\x68\x14\xc0\x97\x4b\xb1\xdb\x32\x3e\
+\x7c\x9f\x70\xb5\x01\x44\xa4\x5a\x3e\x87\xcd\x31\x72\x35\x0b\xf8\
+\xbd\x87\xd7\x49\xaa\x4c\xf7\xba\x7e\x05\x7c\x05\xb7\x3e\x9d\x8b\
+\x8d\x26\x14\x3a\xab\xcb\xc0\x12\xe0\x4b\xc0\x38\xdc\x97\x1c\xed\
+\x07\xfc\x12\x38\xcc\x35\xa8\x82\xeb\xcd\xf2\xf3\x2d\x72\xb7\x08\
+\x55\x47\x93\x7c\x34\x62\x73\x71\x7c\xb8\x1a\x7b\x04\x5d\x32\x72\
+\x03\xee\x93\x3a\xaa\x76\xa1\xf1\x3d\x09\xb0\xad\x9c\x6a\x03\x14\
+\x7d\x12\x60\x51\xdb\x0c\x6c\xf1\xae\x93\xf0\xb3\xde\x7a\x57\x68\
+\x12\xa0\xac\xc8\xb1\xf8\x39\xa6\x97\x00\x1b\x47\x8e\x5d\xba\x60\
+\x7b\xdc\x3f\xdc\xff\x50\x9e\x5b\x23\x5d\x11\x32\x01\xc8\xa9\x36\
+\x80\x12\x80\xf4\xed\x15\x60\x47\xc7\xfd\xd8\x15\x4a\x00\xa4\xbd\
+\x6e\xd8\xb9\xdd\xc7\x71\x7c\x5b\xe4\xd8\xa5\x06\x3e\xea\xd2\x7f\
+\x2a\x7a\xd4\xe9\x84\x4c\x00\xc0\x1e\x93\xf1\x75\x01\xf9\xa9\x43\
+\x3f\x95\x00\xe4\xd1\xe6\x12\x7e\x11\x2e\x25\x00\xd2\xde\x61\xf8\
+\x3b\x86\x0f\x88\x1c\xbb\xd4\xe0\x70\xdc\x3f\xe0\xa7\xa8\x4e\xcd\
+\xec\xd0\x09\x00\xe4\x51\x1b\x40\x09\x40\x3e\xed\x7d\x60\x4d\xb7\
+\xdd\xb9\x52\x4a\x00\xa4\xbd\x71\xf8\x39\x76\x9f\xa3\x5a\x23\xc4\
+\x85\xd3\x88\x9f\x61\xe7\x4f\xc6\x0e\x3c\x91\x18\x09\xc0\x9a\xf8\
+\x2b\xbc\xf1\x18\xf5\xd5\x06\x50\x02\x90\x57\x73\xad\xdd\xb1\x32\
+\x4a\x00\xa4\xad\x03\xf1\x77\xdc\x1e\x1d\x39\x76\xa9\xc3\x69\xb8\
+\x7f\xd0\xcf\x51\x8d\x13\x41\x8c\x04\x00\xac\x40\x90\xaf\x2f\xe1\
+\xa9\x75\xf4\x53\x09\x40\x5e\x6d\x0e\x36\x47\x24\x04\x25\x00\xd2\
+\x96\xaf\xe5\xca\x5f\x45\xc7\x46\x21\xac\x02\xbc\x8b\xfb\x07\x7e\
+\x62\xec\xc0\x13\x88\x95\x00\x74\xc3\xdf\x17\x71\x26\xb5\xd7\x06\
+\x50\x02\x90\x5f\xdb\xdd\x65\x87\xae\x84\x12\x00\x69\x75\x00\xfe\
+\x8e\xd7\x2f\x45\x8e\x3d\xb8\xb2\xde\xcb\x98\x8b\x3d\x3b\xee\xea\
+\x7c\xa0\xbf\x87\xd7\x91\xa5\xb5\x01\x16\x79\x78\xad\xd6\xda\x00\
+\x52\x6c\xeb\xa4\x0e\x40\x4a\xad\x1b\x70\x81\xa7\xd7\x7a\x97\x12\
+\x14\xfe\x69\xaf\xac\x09\x00\x58\x35\xba\x0f\x1c\x5f\x63\x0d\xfc\
+\x15\x8e\x10\x18\x8f\x15\x6c\xf2\xe1\x50\xdc\x6b\x03\x48\x5a\x4d\
+\xa9\x03\x90\x52\x3b\x0e\xd8\xda\xd3\x6b\xfd\x1c\xab\x38\x2b\x05\
+\x72\x1e\xee\xc3\x3e\x73\x29\xf7\x2f\x95\x58\xb7\x00\x5a\xa5\xaa\
+\x0d\xa0\x5b\x00\xf9\xb5\x5d\x9c\xf6\x68\xc7\x74\x0b\x40\x7a\x63\
+\xe7\x07\x1f\xc7\xe9\x74\x60\x40\xdc\xf0\xe3\x28\xf3\x08\x00\xd8\
+\xaf\xcd\x59\x8e\xaf\xd1\x07\xf8\x8e\x87\x58\xc4\xcc\x05\x4e\xf1\
+\xf4\x5a\x23\xb0\x24\x4f\x8a\x67\x3a\xf0\x68\xea\x20\xa4\xb4\xbe\
+\x8c\x9f\x9a\xff\x60\xbf\xfe\x55\xf6\xb7\xa0\x7e\x88\x7b\x06\xb8\
+\x18\xd8\x22\x76\xe0\x91\xc4\x1e\x01\x68\x15\xbb\x36\x80\x46\x00\
+\xf2\x6a\x17\xba\xed\xce\x95\xd2\x08\x40\xb5\x0d\x04\xa6\xe2\xe7\
+\x38\x9d\x82\xe6\x81\x15\xda\x10\x6c\x14\xc0\xf5\x40\xb8\x35\x76\
+\xe0\x91\xa4\x4a\x00\x62\xd7\x06\x50\x02\x90\x4f\x7b\x0d\x3f\xeb\
+\xb1\x77\x44\x09\x40\xb5\xfd\x18\x7f\xc7\xea\x99\x91\x63\x97\x00\
+\xbe\x87\x9f\x83\xe1\xe0\xd8\x81\x47\x90\x2a\x01\x80\xb8\xb5\x01\
+\x94\x00\xe4\xd1\xa6\x00\x5b\x39\xee\xcb\xce\x28\x01\xa8\xae\xe1\
+\x58\x8d\x09\x1f\xc7\xea\xdb\x84\xab\x55\x21\x11\x0d\xc0\xcf\x90\
+\xd0\x44\xa0\x6f\xe4\xd8\x43\x4b\x99\x00\xc4\xac\x0d\xa0\x04\x20\
+\x7d\x7b\x00\x58\xdf\x71\x3f\x76\x85\x12\x80\xea\xfa\x1d\xfe\x8e\
+\xd7\x93\x22\xc7\x1e\x5d\x55\x0e\xf4\x19\xc0\x4f\x80\x1f\x38\xbe\
+\xce\x08\xe0\x9b\xc0\x39\xce\x11\x09\x2c\xad\x0d\x30\x0e\xe8\xe1\
+\xf8\x5a\xad\xb5\x01\xca\xba\x9c\xf3\x7c\x8a\xf7\x18\xd2\x12\xec\
+\x57\xd4\xe3\xd8\x52\xdd\x63\xb1\x13\xab\x48\x08\x9b\x03\xff\xe3\
+\xe9\xb5\x5e\x03\x7e\xeb\xe9\xb5\x24\x03\x7d\x80\xb7\x70\xcf\x0a\
+\x17\x00\x9b\x44\x8e\x3d\xa4\x94\x23\x00\xad\x7e\xea\x18\x43\xdb\
+\xd6\x51\x6d\x80\xa2\x8f\x00\xfc\xc8\xf1\xfd\xab\x44\x23\x00\xd5\
+\x74\x17\xfe\xce\x23\xc7\x45\x8e\x5d\x22\x38\x05\x3f\x07\xc7\xbd\
+\x94\x67\xb5\xc0\x1c\x12\x80\x18\xb5\x01\x94\x00\x54\x87\x12\x80\
+\xea\x39\x12\x7f\x17\xff\x67\xa8\x6f\xc1\xb1\xc2\x29\x7b\x1d\x80\
+\xf6\x7e\x83\x0d\xed\xb8\xda\x0d\x3b\xe0\xc4\x0f\xd5\x06\x10\x91\
+\x7a\xf5\xc3\x46\x11\x7d\x39\x13\x55\xa9\x2c\xad\x4f\xe3\x27\x4b\
+\x9c\x4c\xd8\x47\x99\x62\xc9\x61\x04\xa0\x55\xc8\xda\x00\x1a\x01\
+\xa8\x0e\x8d\x00\x54\xcb\xcf\xf0\xf7\xeb\xff\x6f\x91\x63\x97\xc8\
+\x1a\x80\x07\xf1\x73\xb0\x5c\x1c\x39\xf6\x10\x72\x4a\x00\x42\xd6\
+\x06\x50\x02\x50\x1d\x4a\x00\xaa\x63\x33\x60\x21\x7e\xce\x19\x0b\
+\x81\x0d\xe3\x86\x9f\x56\xd5\x6e\x01\x80\x7d\xd0\x67\xb4\xfc\x75\
+\x75\x32\xf0\x51\x0f\xaf\x23\x66\x32\xf0\x6d\x4f\xaf\xb5\x1d\xf6\
+\xf9\x88\x48\x79\x5d\x8c\xfb\x13\x44\x6d\x5f\xeb\x45\x4f\xaf\x25\
+\x99\xbb\x16\x3f\x59\xe3\xab\x74\x7d\x41\x9a\x1c\xe5\x34\x02\x00\
+\xe1\x6a\x03\x68\x04\xa0\x3a\x34\x02\x50\x0d\xc7\xe0\xe7\x3c\xd1\
+\x8c\xd5\x89\x59\x2d\x6e\xf8\xe9\x55\x71\x04\xa0\xd5\x59\xd8\xe4\
+\x33\x57\xa3\x08\x5b\xd7\xbc\x6a\x5a\x6b\x03\x2c\xf2\xf0\x5a\xad\
+\xb5\x01\x44\xaa\xa4\x11\xd8\x06\x38\x10\xd8\x9f\x72\x3d\xb6\xdc\
+\xaa\x3f\x7e\x93\xe2\x73\x81\x69\x1e\x5f\x4f\x0a\xc0\x57\x89\xe0\
+\x26\x8a\x7b\x2b\x20\xb7\x11\x80\x56\xbe\x6b\x03\x68\x04\xa0\x3a\
+\xaa\x3a\x02\xb0\x3a\x56\x07\x7f\x45\xdf\xe9\x89\xd8\x8f\x9e\x3e\
+\xc9\xa2\xf3\xeb\x97\xf8\x3b\x3f\x8c\xa7\xb8\x9f\xb9\x38\x58\x15\
+\x3f\xc5\x81\x9a\x81\x57\x28\x66\x99\xe0\x5c\x13\x00\xdf\xb5\x01\
+\x06\x38\xbe\x86\x12\x80\xe2\xa8\x62\x02\xf0\x61\xac\xea\x62\x67\
+\x7d\x7b\x16\xd8\x20\x51\x8c\xbe\x6c\x85\x8d\x10\xfa\x38\x37\x34\
+\x01\x3b\xc7\x0d\x5f\x72\x72\x04\x7e\x0e\xa4\x66\x8a\xf9\x54\x40\
+\xae\x09\x00\xc0\x7e\x8e\xb1\xb5\x6d\xbf\x70\xdc\x5e\x09\x40\x71\
+\x54\x2d\x01\xd8\x9a\xda\x56\x3c\x9d\xc4\xca\xd7\xcd\xc8\x59\x77\
+\xec\x09\x1f\x5f\xe7\x85\x2b\xe2\x86\x2f\x39\xba\x15\x3f\x07\xd3\
+\x12\x60\xef\xc8\xb1\xbb\xca\x39\x01\x00\xbf\xb5\x01\x94\x00\x54\
+\x43\x95\x12\x80\x1e\xd8\xcc\xf5\x5a\xfb\x38\x36\x45\xb0\x1e\x7c\
+\x0b\x7f\x17\xff\xf7\x81\xc1\x71\xc3\x97\x1c\x6d\x88\x2d\xb6\xe2\
+\xe3\xa0\x7a\x9d\x62\x15\x08\xca\x3d\x01\xf0\x59\x1b\x40\x09\x40\
+\x35\x54\x29\x01\xf8\x22\xf5\xf7\xf3\xa3\x09\xe2\x75\xb1\x09\xb6\
+\x20\x96\xaf\xef\xb4\xaf\x85\x83\x0a\xab\xca\x4f\x01\xb4\xf5\x22\
+\xb6\x5a\xa0\x0f\xeb\x02\x57\x79\x7a\x2d\xf1\x5b\x1b\x40\xa4\x6c\
+\x8e\x4a\xb4\x6d\x6c\xdd\x81\xdf\x03\xbd\x3d\xbd\xde\x7d\xc0\x1f\
+\x3c\xbd\x96\x94\x40\x1f\x6c\x22\x9f\xaf\xec\xf2\x84\xb8\xe1\xd7\
+\x2d\xf7\x11\x00\xf0\x5b\x1b\x40\x23\x00\xe5\x57\xa5\x11\x80\x99\
+\xd4\xdf\xcf\x71\x09\xe2\xad\xd7\x39\xf8\xfd\x2e\x97\xf1\xd1\xc8\
+\x9a\x69\x04\x60\xa9\x79\xc0\x57\x3c\xbe\xde\x2f\xb1\x32\x95\xe2\
+\xce\x67\x6d\x00\x29\xbf\x25\x8e\xdb\x17\xe5\xbc\xd8\x1f\xab\x75\
+\x51\xaf\xb5\x7c\x05\x12\xd8\x66\xd8\x73\xfa\xbe\x5c\x08\x4c\xf0\
+\xf8\x7a\x85\x55\x94\x03\x3d\x96\x7f\x00\x7f\xf4\xf4\x5a\x7d\x80\
+\x3f\x61\x8f\xb3\x89\xbb\xf1\xc0\xaf\x52\x07\x21\x85\xe0\x5a\xe0\
+\xab\x28\xdf\x59\xd7\xd1\xb7\xf9\x5e\xa2\x08\xab\x3b\xf0\x3b\xa0\
+\x97\xa7\xd7\x7b\x1a\xf8\x81\xa7\xd7\x2a\x3c\x25\x00\xcb\x3b\x15\
+\x78\xcf\xd3\x6b\x6d\x06\xfc\xdc\xd3\x6b\x89\xcd\x05\x78\x2d\x75\
+\x10\x92\xbd\x59\x8e\xdb\x0f\xf3\x12\x45\x78\xae\x71\xba\xee\xa7\
+\x18\xbe\x01\x6c\xef\xe9\xb5\x16\x02\xc7\xb6\xfc\x15\x94\x00\xac\
+\xc8\xfb\xc0\xe9\x1e\x5f\xef\x44\xe0\x48\x8f\xaf\x57\x65\x73\x81\
+\x53\x52\x07\x21\xd9\x9b\xe9\xb8\x7d\x51\xee\x0f\xbb\xc6\x39\xc3\
+\x4b\x14\xe1\x6c\x82\xdf\xa1\xff\xf3\xb1\x91\x44\x69\xa1\x04\x60\
+\xc5\xae\x07\x6e\xf1\xf8\x7a\xbf\x06\xd6\xf3\xf8\x7a\x55\x76\x1b\
+\x70\x53\xea\x20\x24\x6b\x13\x1d\xb7\xdf\xc5\x4b\x14\xe1\x7d\xc4\
+\x71\xfb\xd7\x7d\x04\x11\x48\x37\xe0\x6a\xfc\xcd\xfa\x1f\x87\x26\
+\xd2\x2e\x47\x09\x40\xc7\xbe\x84\x3d\x7f\xee\xc3\x20\xe0\xaf\x14\
+\xb3\x54\x70\x8e\x4e\x05\xa6\xa7\x0e\x42\xb2\xf5\xbc\xe3\xf6\x07\
+\x7a\x89\x22\xac\x46\xac\x52\xa6\x8b\x17\x7c\x04\x12\xc8\x67\x81\
+\x1d\x3c\xbd\xd6\x82\x96\xd7\x5b\xec\xe9\xf5\x4a\x43\x09\x40\xc7\
+\x26\x03\x5f\xf7\xf8\x7a\x5b\x02\xd7\x00\x0d\x1e\x5f\xb3\xaa\x54\
+\x1b\x40\x56\xc6\xf5\xc2\xb6\x11\xb0\xab\x8f\x40\x02\xda\x17\x2b\
+\x92\xe5\x22\xe7\x04\xe0\xab\x1e\x5f\xeb\x3b\xd8\x1a\x08\x22\x35\
+\x69\xc0\x5f\x99\xe0\xd6\xf6\xb5\xa8\x3d\xe8\x5c\x11\xea\x00\xac\
+\x48\xec\xda\x00\xaa\x03\x50\x1c\x9b\xe3\xfe\x79\xdf\x1b\x3d\xea\
+\xae\x6b\xc0\x86\xb4\x5d\xfb\x98\xeb\x7a\x00\x23\xf0\xf7\xbd\x7d\
+\x00\x1b\x2d\x11\xa9\xcb\x1a\xc0\x3b\xf8\x3b\x20\x17\x63\xd9\x7b\
+\x2e\x8a\x9a\x00\x80\x8d\xaa\x2c\xec\x20\x2e\x25\x00\xd5\xd5\x80\
+\x9f\xef\xec\xfe\xb1\x03\xef\xa2\xa3\x71\xef\x9b\xeb\x6d\x92\x90\
+\xf6\xc4\xcf\x77\xf6\x03\xac\x32\xab\x74\x40\xb7\x00\x3a\xf7\x1e\
+\x36\x93\xdf\x97\x46\xe0\x5a\x34\x29\xd0\x07\xd5\x06\x90\x15\x69\
+\x06\xee\xf1\xf0\x3a\x17\x91\x36\xc1\x5d\x91\x61\xf8\x49\x06\x7d\
+\xec\x9f\x50\x7c\x55\x62\x3c\x09\xf7\x09\xa1\x22\x00\xfc\x16\xbf\
+\xbf\x28\x9f\x22\x8f\x82\x23\x45\x1e\x01\x00\xdb\x87\xaf\xa2\x11\
+\x00\x59\xd6\xe1\xf8\xf9\xdc\xef\x20\x9f\xd2\xc0\x3d\xb1\x5b\x13\
+\x3e\xfa\xb5\x57\xe4\xd8\x6b\xb1\x25\xee\xfd\xbb\x32\x7a\xd4\x52\
+\x6a\xfd\xf0\xbb\x56\x40\x33\x36\x12\x90\x7a\x52\x60\xd1\x13\x00\
+\xb0\xd9\xd0\x4a\x00\xa4\xad\xde\xc0\x34\xfc\x7c\xf6\x57\x92\xfe\
+\x3e\x72\x4f\xe0\x3a\xfc\xf4\xe7\x4d\xf2\x1e\xfd\xed\x06\x4c\xa5\
+\xfe\xfe\x3d\x47\x1e\x3f\xae\xa4\x64\x76\xc6\x7d\x5d\xf9\xf6\xed\
+\xbc\x98\x1d\x58\x81\x32\x24\x00\x00\x7f\x46\x09\x80\x2c\xeb\x72\
+\xfc\x7d\xfe\xb7\x91\x6e\x99\xef\x21\xf8\xfb\xe5\xdf\x4c\x31\x4a\
+\xe1\xfe\x9c\xfa\xfa\x36\x1f\xd8\x3a\x41\xbc\x52\x11\xe7\xe1\xf7\
+\xc2\xb2\x04\x7b\x46\x35\x95\xb2\x24\x00\x6b\x62\x93\x7e\x94\x00\
+\x48\xab\x8d\x81\x26\xfc\x1d\x03\xcf\x03\x7b\x44\xed\x81\x4d\x44\
+\x7c\xcd\x43\xec\x6d\x2f\x90\xb9\xce\xfe\x6f\x6b\x18\x36\xff\xaa\
+\xd6\xfe\x9d\x9a\x22\x58\xa9\x8e\x6e\xc0\x3f\xf1\x7b\x71\x59\x08\
+\xec\x1d\xb3\x13\x6d\x94\x25\x01\x00\xfb\xf2\x2b\x01\x90\xb6\x6e\
+\xc0\xff\xb1\x70\x2b\xb0\x4d\xe0\xb8\x77\x04\xee\x0e\x10\xfb\xe5\
+\x81\xe3\xf6\x69\x6f\x6c\x95\xd6\xae\xf6\xed\x0a\xd2\xdf\x52\x95\
+\x0a\x18\x0a\xbc\x8d\xdf\x2f\xe6\x0c\x6c\xf2\x4b\x6c\x65\x4a\x00\
+\x42\xd6\x06\x50\x02\x50\x4c\x5b\xe2\xff\xb6\x5d\x6b\x7b\x1c\x2b\
+\x48\xb5\x3b\xf6\xb8\xb0\x8b\x61\xd8\xe3\x6f\xad\xf5\xea\x43\xc4\
+\x3b\x1f\x18\xe5\x18\x67\x6c\x1f\x05\x26\xb1\xf2\x7e\x2d\x06\x2e\
+\x20\xef\x79\x0d\x52\x32\xbb\xe3\xff\xc4\xf2\x16\x30\x3c\x62\x1f\
+\xa0\x5c\x09\x00\x84\xab\x0d\xa0\x04\xa0\xb8\x2e\x21\xcc\x05\xb5\
+\x7d\x5b\x84\x4d\x3c\xac\xb5\x85\x4a\x50\xda\xb7\xf3\x5d\x77\x64\
+\x22\xfd\x80\x73\xb0\xc9\x7d\x6d\xfb\x33\x05\xf8\x3d\xb0\x55\xba\
+\xd0\xa4\xca\xbe\x8b\xff\x2f\xe9\x38\xe2\xae\x19\x50\xb6\x04\x00\
+\xe0\xa7\x28\x01\x90\xa5\xfa\xe3\x7f\xc4\xae\x68\xed\x75\xca\xb1\
+\x16\x49\x3f\xac\x86\xca\x08\x34\xdc\x2f\x89\x35\x12\xe6\x3e\xdd\
+\x18\xe2\x3d\x7b\x5c\xc6\x04\x20\x44\x6d\x00\x25\x00\xc5\x76\x08\
+\x36\xe1\x36\xf5\x85\x38\x45\x5b\x4c\xfc\xc9\x8b\x52\x00\xba\x67\
+\xe2\xa6\x09\xf8\x0c\x76\x8f\xca\xa7\x03\xb1\xa5\x30\xf5\xf9\xd4\
+\x67\x2e\x70\x4a\xea\x20\x24\x2b\x37\x53\xdd\xaa\x91\xdf\x23\xef\
+\xca\x7f\x22\x85\xb6\x23\x36\xc1\xc6\x77\xe6\xfe\xbf\x84\x1f\xe6\
+\x2a\xe3\x08\x40\x2b\x9f\xb5\x01\x34\x02\x50\x7c\x3d\x89\xbb\x80\
+\x54\x0e\xed\x76\xf4\x43\x42\x3a\xa0\x03\xc3\x8f\x47\x80\x13\x02\
+\xbc\xee\xe7\xb0\x82\x18\x52\x9f\x53\x81\xe9\xa9\x83\x90\x6c\x2c\
+\x04\x0e\x02\x26\xa4\x0e\x24\x92\xf1\xc0\xa7\xb1\x5b\x1f\x22\xcb\
+\x51\x02\xe0\xcf\x35\xc0\x65\x01\x5e\xf7\x74\xe0\xec\x00\xaf\x5b\
+\x05\x93\xb1\xc7\xb4\x44\x5a\x4d\xc5\x56\xe3\x7c\x33\x75\x20\x81\
+\xbd\x0c\xec\x83\x12\x60\x91\x68\x7a\x00\xff\x22\xcc\x50\xde\x19\
+\x81\x62\x2e\xf3\x2d\x00\xf0\x57\x1b\x40\xb7\x00\xca\x65\x5d\x6c\
+\x24\x20\xf5\x10\x7d\x88\xf6\x0c\xf1\x1f\x27\x16\x11\xac\x48\xd0\
+\x9b\xf8\xff\x52\x2f\x01\xbe\x10\x20\x5e\x97\xd9\xf2\x4d\xd8\x7d\
+\xd5\xdc\x6d\x83\x3d\xa3\xed\xb2\xff\x3f\x70\x8c\xe1\x44\xc7\xf7\
+\xff\x96\xe3\xfb\xcb\xf2\x06\x03\xff\x26\xfd\x05\xdb\x67\xbb\x0b\
+\x18\xe0\x73\x27\x89\x48\x6d\xb6\x05\x66\xe3\xff\xcb\xbd\x08\x7b\
+\xea\xc0\xa7\xbb\x1c\xe2\x79\xdd\x73\x2c\x21\xb9\xd6\x06\x18\xef\
+\xf8\xfe\xfb\x38\xbe\xff\x51\x8e\xef\x2f\x2b\xd6\x0b\xb8\x88\xf4\
+\x17\x6e\xd7\xb6\xa4\xa5\x1f\x3d\xfc\xee\x9e\xba\x0d\xc0\xaa\xf8\
+\x1d\x86\x2d\x3d\xbc\x56\xda\x70\x44\xe2\x3a\x04\xbf\x0b\x91\xb4\
+\xb6\xc5\xc0\xb1\x1e\xe3\xfc\xba\x43\x2c\x45\xaa\x2b\xbe\x2a\x30\
+\x91\xfa\xfb\xea\xfa\x08\x59\x1f\x60\x56\x9d\xef\xbd\x18\x5b\x11\
+\x4e\xc2\x39\x0c\xf7\xdb\x61\xa9\xda\xdb\xd8\xa2\x41\x39\x18\x0d\
+\xdc\xc2\xf2\xd5\x38\x97\x60\x93\xa5\x0f\x4a\x17\x9a\x48\x5c\x67\
+\x12\xe6\x0b\xbf\x04\x38\xd9\x53\x8c\xc3\xa8\xef\xc2\xd4\x44\xf1\
+\x96\xdd\x3c\x88\xfa\xf7\xf7\x16\x1e\xde\xff\xe2\x3a\xdf\xff\x7a\
+\x0f\xef\x2d\x9d\x1b\x84\xfd\x8a\x8e\x55\x9a\xd7\xb5\x35\x61\x0b\
+\xe0\xe4\x32\xe4\x7f\x02\x5d\xbb\xd5\x76\x1d\x96\x10\x8b\x94\xde\
+\xa5\x84\x4b\x02\x7c\x2d\x7d\x79\x46\x1d\xef\x7f\x89\xa7\xf7\x8e\
+\xed\x5a\x6a\xef\xeb\x95\x9e\xde\x7b\x30\x9d\x2f\x6c\xd2\xbe\x4d\
+\xc3\x26\xac\x49\x3c\xdb\x63\xd5\x38\x73\xad\x1c\xd8\x84\x9e\x70\
+\x43\xa9\x00\x00\x0b\x73\x49\x44\x41\x54\xd5\xb8\xf0\x91\x94\xfa\
+\xd0\x08\xfc\x9a\xda\xfa\xf0\x57\xf4\x14\x9a\x54\x40\x77\x60\x2c\
+\xf9\x27\x01\x57\xd6\xf0\xbe\x63\xc9\xe7\x5e\x63\xad\xfa\x03\x8f\
+\xd1\xf5\xbe\x3e\x80\xdf\x5f\x2b\xdb\x62\x17\xf5\xae\xbc\xf7\x6c\
+\xe0\x63\x1e\xdf\x5b\x6a\xb3\x35\xf0\x7f\xc0\x1c\xd2\x5f\xf4\x9b\
+\x81\x99\x58\x71\xb0\x4d\x43\x76\xba\x46\xbd\x80\x1b\xa9\xaf\x3f\
+\xbe\x46\x31\x45\xb2\xd6\x9f\x70\x4b\x7c\x36\x63\xb7\x1a\x7c\x38\
+\x0d\x3b\xc9\x74\xf4\x3e\xf3\x81\x0b\x89\xb7\x4e\x41\x28\xfd\x81\
+\x3f\xd2\xf9\x7e\xbd\x06\x5b\x57\xc0\xb7\x0d\xe8\xfc\xd1\xc4\x27\
+\x49\xb3\x3c\xb4\x2c\xaf\x1f\x56\x94\xeb\x56\xea\x9f\xc7\x51\x6f\
+\x9b\x01\xfc\x0d\x38\x9a\x30\xc7\xa2\x8b\xfe\xb8\xad\x85\xf2\x0e\
+\x96\x40\x88\x94\xde\x70\x6c\xd6\x7c\xa8\x13\xc5\x39\x9e\xe2\x1c\
+\x82\x25\x14\xff\x04\x9e\x07\x5e\xc1\x6a\x1b\x9c\x0b\x8c\xf4\xf4\
+\x1e\xb9\xf8\x08\x76\x4b\xa0\xed\x4a\x71\x6f\x61\x17\xfe\x0f\x47\
+\x78\xff\x7d\x81\xab\xb0\x8b\xfd\x1b\x58\x92\x78\x0d\x36\x81\x54\
+\xc3\xa3\x79\xea\x01\xec\x82\x4d\x9e\xbd\x0a\xb8\x1f\x3b\x7e\x5c\
+\x13\x83\x99\xd8\xed\xa1\x7f\x61\xa3\x71\x67\x60\x25\xc6\x73\x4d\
+\xb6\x87\x01\x4f\xe0\x7e\xde\xfa\x78\xec\xc0\x45\x52\xd9\x08\x78\
+\x8f\x70\x49\xc0\xc5\xe8\xc2\x51\xaf\x55\xc8\xf7\x64\x2b\xc5\xd0\
+\x80\x4d\x24\xac\xb5\x15\xcd\xfa\x58\xa5\x41\x1f\xe7\x2c\x55\xea\
+\x94\x4a\xd9\x8e\x95\x0f\xb3\xbb\xb6\x1b\xd0\xb0\x9a\x88\x84\xb1\
+\x0d\x36\x74\xef\xeb\x7c\x55\xd4\xc9\xc4\x22\x75\xdb\x83\x30\xab\
+\x07\xb6\xb6\x7b\xc8\xe7\xd1\x20\x11\x29\x87\xdd\xb1\xb5\x05\x7c\
+\x9e\xab\x2e\x88\xd9\x01\x91\x5c\x1c\x41\x98\x42\x41\xad\xed\x29\
+\x60\xcd\x68\xbd\x11\x91\x32\x3b\x9c\x30\x3f\x5a\x7c\x57\x36\x15\
+\x29\x8c\x13\x09\xfb\xac\xf1\x6b\xd8\xbc\x03\x11\x91\x7a\x9d\x45\
+\x98\x1f\x2b\xf3\xb1\xda\x18\x22\x95\x75\x2a\xe1\x12\x80\x66\xac\
+\xbc\x69\x8c\x19\xed\x22\x52\x2e\xbd\xb1\xa7\x52\x42\x9d\x9b\x5c\
+\xcb\x6b\x8b\x94\xc2\xe9\x84\x4d\x02\xe6\x03\x9f\x8d\xd5\x19\x11\
+\x29\xbc\xc1\xc0\xbd\x84\x3b\x27\xbd\x00\x0c\x8c\xd6\x1b\x91\xcc\
+\x9d\x4d\xd8\x24\xa0\x19\xf8\x21\x7a\x4c\x50\x44\x56\x6e\x6b\xac\
+\x2e\x45\xa8\xf3\xd0\x24\x74\x6b\x52\x64\x39\xe7\x11\x3e\x09\xb8\
+\x15\x3d\x21\x20\x22\x2b\x76\x00\x56\x7d\x30\xd4\xf9\x67\x22\x56\
+\x09\x53\x44\x56\xe0\x02\xc2\x27\x01\xe3\x81\x51\xb1\x3a\x24\x22\
+\xd9\x6b\x00\xbe\x45\xd8\x49\xc9\x2f\x01\x23\x62\x75\x48\xa4\xa8\
+\xce\x22\x7c\x12\xf0\x3e\x56\x8f\x40\x44\xaa\xad\x17\x61\x27\xfb\
+\x35\x03\x13\xb0\x72\xe8\x22\xd2\x05\x67\x12\x7e\x39\xd2\x05\xc0\
+\x49\xb1\x3a\x24\x22\xd9\x59\x17\x78\x94\xb0\xe7\x99\xa7\x80\x35\
+\x62\x75\x48\xa4\x2c\x4e\x24\x6c\xb1\xa0\xd6\x76\x2d\xb0\x6a\xa4\
+\x3e\x89\x48\x1e\x0e\x04\xa6\x12\xf6\xdc\x32\x0e\x58\x3d\x56\x87\
+\x44\xca\xe6\xb3\xc0\x62\xc2\x27\x01\xcf\x91\xd7\x3a\xe3\x22\x12\
+\x46\x77\xe0\x27\x84\x1f\x61\xbc\x03\x5b\x32\x58\x44\x1c\x7c\x1a\
+\x58\x48\xf8\x24\x60\x36\x70\x4c\xa4\x3e\x89\x48\x7c\x6b\x03\x0f\
+\x10\x67\x54\xb1\x67\xa4\x3e\x89\x94\xde\x9e\x84\x7d\x3c\xa7\x6d\
+\xbb\x06\x5b\x1e\x57\x44\xca\x63\x4f\xfc\xae\xe4\xd7\x51\xbb\x08\
+\xd5\x1b\x11\xf1\x6e\x3b\xe0\x5d\xe2\x24\x01\x8f\x03\xeb\xc5\xe9\
+\x96\x88\x04\xd4\x1d\xf8\x3e\xe1\x87\xfc\x9b\xb0\xaa\xa6\x22\x12\
+\xc8\x28\xac\x8c\x66\x8c\x24\x60\x26\x70\x42\x9c\x6e\x89\x48\x00\
+\x6b\x60\xf7\xe2\x43\x9f\x2b\x16\x00\x47\x45\xea\x93\x48\xa5\x0d\
+\x05\x1e\x23\x4e\x12\xd0\x0c\xfc\x19\xcd\xe4\x15\x29\x9a\x43\x88\
+\x33\x62\x38\x0d\xd5\x14\x11\x89\x6a\x55\x60\x2c\xf1\x92\x80\xb7\
+\x81\x7d\xa3\xf4\x4c\x44\x5c\x0c\x00\xae\x26\xce\x79\xe1\x05\x60\
+\xc3\x28\xbd\x12\x91\x65\x74\xc7\x96\xd4\x8c\x95\x04\x2c\x01\xae\
+\x00\xfa\xc6\xe8\x9c\x88\xd4\x6c\x57\xe0\x65\xe2\x9c\x0f\xfe\x09\
+\x0c\x8a\xd3\x2d\x11\xe9\xc8\x09\xc4\x79\x4c\xb0\xb5\x4d\xc0\x26\
+\x24\x8a\x48\x1e\xfa\x60\xab\x7d\xc6\x28\x1c\xd6\x8c\xfd\x10\xe8\
+\x11\xa5\x67\x22\xd2\xa9\x8f\x03\xd3\x89\x97\x04\x2c\x04\xbe\x07\
+\xf4\x8e\xd1\x39\x11\xe9\xd0\x8e\xc0\xf3\xc4\xfb\xde\x9f\x18\xa7\
+\x5b\x22\x52\x8b\x4d\x88\x37\xfc\xd7\xda\x9e\x07\x76\x8b\xd1\x39\
+\x11\x59\x46\x4f\x6c\xf5\xd0\x45\xc4\xf9\xae\x6b\x01\x31\x91\xcc\
+\x0d\x06\xfe\x45\xdc\x24\x60\x09\x70\x39\x36\xf9\x48\x44\xc2\xdb\
+\x0e\x78\x92\x78\xdf\xf1\xc7\x80\x91\x31\x3a\x26\x22\x6e\xba\x63\
+\xf7\x03\x43\x17\xfe\x68\xdf\x26\x03\x87\x47\xe8\x9f\x48\x55\x0d\
+\xc0\x2a\xed\xc5\x58\x1f\xa4\xb5\x5d\x83\xcd\x31\x10\x91\x02\x39\
+\x98\xb8\xf3\x02\x5a\xdb\x18\xac\xe6\xb8\x88\xf8\x73\x10\xf0\x26\
+\xf1\xbe\xc7\xf3\x80\x2f\x44\xe9\x99\x88\x04\xb1\x11\xf0\x2c\xf1\
+\x93\x80\xd9\xc0\x79\x40\xaf\xe0\x3d\x14\x29\xb7\xf5\x89\x5b\xf3\
+\xa3\x19\x78\x11\xd8\x32\x46\xe7\x44\x24\xac\x7e\xc0\x8d\xc4\x4f\
+\x02\x5a\x4f\x24\x07\x86\xef\xa2\x48\xe9\xf4\x00\xce\xc2\x7e\x89\
+\xc7\xfc\xce\xfe\x0d\x18\x18\xa1\x7f\x22\x12\x49\x03\xf0\x35\xe2\
+\xd6\x0b\x68\xdb\xc6\x00\x1f\x0a\xde\x4b\x91\x72\xd8\x1b\x4b\x9e\
+\x63\x7e\x47\xe7\x02\x27\x63\xe7\x0a\x11\x29\xa1\x1d\x88\xff\xa8\
+\x60\x6b\x5b\x00\xfc\x08\x1b\x91\x10\x91\xe5\x6d\x08\xfc\x85\xf8\
+\xdf\xcd\xa7\x80\x4d\x23\xf4\x4f\x44\x12\xeb\x0f\xfc\x81\x34\x49\
+\x40\x33\xf6\xb4\xc0\xe7\x81\xc6\xd0\x1d\x15\x29\x88\x21\xc0\x25\
+\xc4\x1f\xa1\x5b\x02\xfc\x0c\xcd\xd5\x11\xa9\x9c\x63\x81\x59\xa4\
+\x4b\x04\x26\x60\x8f\x0d\x6a\xc8\x51\xaa\xaa\x0f\x76\x9f\x3f\xc5\
+\xd3\x3a\xef\x00\xfb\x87\xef\xa2\x88\xe4\x6a\x43\x60\x1c\xe9\x92\
+\x80\x66\xe0\x51\x60\xaf\xd0\x1d\x15\xc9\x48\x37\xe0\x38\xe2\x3e\
+\xd6\xd7\xb6\xdd\x8c\x15\x0d\x13\x91\x8a\xeb\x01\x7c\x97\x74\x13\
+\x04\x5b\xdb\x9d\xd8\x1c\x05\x91\x32\xdb\x1b\xbb\xe7\x9e\xe2\x3b\
+\xf6\x01\x76\xfb\x4d\x44\x64\x19\xa3\x81\x67\x48\x9b\x04\x2c\xc1\
+\x26\x41\x6d\x16\xb8\xaf\x22\xb1\xed\x86\x25\xb9\xa9\xbe\x5b\xb7\
+\x00\x6b\x05\xef\xa5\x88\x14\x56\x0f\xac\x80\x4f\xcc\x52\xa3\x1d\
+\x25\x02\x63\xb0\x95\xce\x44\x8a\x6c\x57\xec\x58\x4e\xf5\x5d\x9a\
+\x86\x2d\x19\x2e\x22\xd2\x25\x3b\x62\x93\xf4\x52\x26\x01\xad\xed\
+\x01\xac\x0c\xaa\x48\x91\xec\x0a\xdc\x4d\xda\xef\xce\x18\xf4\xab\
+\x5f\x44\xea\xd0\x07\xf8\x3e\xe9\xe7\x06\xb4\xb6\x87\x81\x4f\xa0\
+\xa7\x06\x24\x5f\x0d\xd8\x31\xfa\x18\x69\xbf\x2b\x6f\x03\x9f\x0c\
+\xdc\x57\x11\xa9\x80\xcd\xb1\x5f\xe1\xa9\x13\x80\xd6\xf6\x0c\x70\
+\x34\x76\xbb\x42\x24\x07\x8d\xd8\x23\xad\xa9\x26\xf7\xb5\xb6\xc5\
+\xc0\xa5\xc0\xa0\xb0\xdd\x15\x91\x2a\x69\xc0\xea\x06\xbc\x4f\xfa\
+\x04\xa0\xb5\x4d\xc6\x96\x3d\x5e\x27\x60\xbf\x45\x56\x66\x00\x70\
+\x1a\xf0\x1a\xe9\xbf\x0f\x8f\xa1\xa7\x68\x44\x24\xa0\xa1\xd8\xfa\
+\xe0\xa9\x4f\x76\x6d\xdb\x02\xe0\x06\x54\x4b\x40\xe2\xd9\x08\xb8\
+\x08\x5b\xf5\x32\xf5\xf1\xff\x3e\x96\x84\x74\x0b\xda\x63\x11\x91\
+\x16\x7b\x01\xff\x21\xfd\xc9\xaf\x7d\x1b\x07\x7c\x0e\xe8\x1d\xae\
+\xeb\x52\x51\x8d\xd8\x7d\xf5\xd4\x13\xfb\x5a\xdb\x22\xe0\x57\x68\
+\xe5\x3e\x11\x49\xa0\x3b\xf0\x65\x60\x2a\xe9\x4f\x86\xed\xdb\x14\
+\xe0\xa7\xd8\xfc\x05\x11\x17\x83\xb1\x95\x34\x5f\x23\xfd\x71\xdd\
+\xda\xee\x05\xb6\x0a\xd9\x69\x11\x91\xae\x18\x84\x0d\x87\x2e\x22\
+\xfd\x89\x71\x45\xed\x59\xac\xde\xfa\x1a\xa1\x76\x80\x94\x4e\x23\
+\x36\xca\x75\x03\x76\x8b\x29\xf5\x31\xdc\xda\x9e\xc7\x26\x1b\x8a\
+\x88\x64\x65\x73\xe0\x0e\xd2\x9f\x24\x3b\x6a\x0b\x80\xbf\x02\x07\
+\xa3\x27\x08\x64\xc5\xb6\xc5\x92\xd9\x29\xa4\x3f\x5e\xdb\xb6\xb7\
+\xb1\x62\x3e\xdd\xc3\x75\x5d\x44\xc4\xdd\x7e\xc0\x93\xa4\x3f\x69\
+\xae\xac\xbd\x87\x9d\xe8\x77\x41\x93\xa7\xaa\x6e\x2d\xe0\xeb\xe4\
+\x39\xa7\x65\x26\x70\x2e\xd0\x37\x58\xef\x45\x44\x3c\xeb\x06\x1c\
+\x05\xbc\x4c\xfa\x93\x68\x67\x6d\x12\xf6\xec\xf4\xc7\xb0\xa1\x5f\
+\x29\xbf\x35\x81\x13\x81\xdb\x49\x5f\xf6\x7a\x45\x6d\x21\x70\x09\
+\xba\x6d\x25\x22\x05\xd6\x03\x1b\xba\x9c\x44\xfa\x93\x6a\x57\xda\
+\x54\xec\x31\xc7\x83\x80\x9e\x01\xf6\x87\xa4\x33\x0a\x7b\x5c\xee\
+\x0e\xf2\x9d\xaf\xb2\x10\x3b\xfe\x3e\x14\x68\x1f\x88\x88\x44\xd7\
+\x17\x38\x9b\xbc\x0a\x09\x75\xd6\x3e\x00\xae\x05\xfe\x07\x18\xe6\
+\x7f\x97\x48\x04\xa3\x81\xef\x91\x7e\x95\xcb\xce\xda\x7c\xe0\x32\
+\x60\xdd\x30\xbb\x41\x44\x24\xbd\x55\xb1\xfb\xad\xef\x90\xfe\xa4\
+\x5b\x4b\x5b\x82\xcd\x6b\xf8\x11\xb0\x27\xd0\xcb\xf7\x8e\x11\x2f\
+\xd6\x00\x3e\x0d\x5c\x09\xbc\x4e\xfa\xe3\xa6\xb3\x36\x0f\x1b\xea\
+\x57\x35\x4b\x11\xa9\x8c\x3e\xc0\x57\x80\x37\x49\x7f\x12\xae\xa7\
+\xcd\x01\xfe\x81\x0d\x29\x6f\x8e\x26\x12\xa6\xd2\x0f\x38\x10\xf8\
+\x39\xf0\x34\x96\xa8\xa5\x3e\x36\xba\xd2\xe6\x62\x93\x50\xb5\x52\
+\x9f\x88\x54\x56\x2f\xe0\x4b\xe4\x55\x64\xa5\x9e\xf6\x01\x70\x2b\
+\x36\x63\xfb\x63\xd8\x48\x87\xf8\x37\x00\x7b\x3e\xff\x7c\xe0\x41\
+\xf2\xbd\x97\xdf\x51\x9b\x8c\x1d\x23\x83\x7d\xef\x18\x11\x91\xa2\
+\xea\x0e\x1c\x81\x2d\xf9\x9b\xfa\x24\xed\xa3\x2d\x02\x1e\xc7\x4a\
+\xb5\x1e\x05\xac\x87\x96\x31\xae\x55\x2f\x60\x47\xe0\x54\x6c\x62\
+\xdc\x04\x8a\xf3\x0b\xbf\x7d\x1b\x8f\x95\xa8\xd6\xad\x23\xc9\x86\
+\x4e\x48\x92\xa3\x0f\x03\x5f\xc5\xea\xae\x97\xa9\xf0\xc9\x2c\x6c\
+\x32\xda\x33\xd8\x70\xf5\xf8\x96\x7f\x9e\x99\x32\xa8\x4c\xf4\xc7\
+\x16\xd8\xd9\x1c\xd8\xbe\xa5\x6d\x45\xb1\x0b\x36\x35\x03\x63\xb1\
+\xdb\x13\x77\x26\x8e\x45\x64\x39\x4a\x00\x24\x67\xeb\x62\xbf\xfe\
+\x8e\xc7\x86\x7e\xcb\xea\x35\x2c\x19\x78\x0e\x78\xb5\x4d\x7b\x13\
+\x68\x4a\x18\x57\x08\xeb\x60\x17\xfa\x8d\x81\x4d\xda\xfc\xf3\xf0\
+\x94\x41\x79\x36\x13\xb8\x0e\xb8\x18\xfb\x4c\x45\xb2\xa4\x04\x40\
+\x8a\x60\x55\x6c\x18\xfd\x04\x60\xbb\xc4\xb1\xc4\xb4\x08\x98\xc8\
+\xb2\x49\xc1\x44\xec\x09\x8a\xf7\xb1\x72\xb5\x53\x92\x45\xb7\xbc\
+\x01\xc0\xda\x2d\x6d\x2d\xec\x62\x3f\xbc\xa5\xad\x83\x3d\x87\xdf\
+\x2f\x59\x74\xe1\x3d\x8a\x3d\x7d\xf0\x27\x6c\x99\x60\x91\xac\x29\
+\x01\x90\xa2\xd9\x16\x4b\x04\x8e\xa2\xdc\x17\x93\xae\x5a\xcc\xd2\
+\x64\xe0\xdd\x96\xf6\x3e\xf6\x5c\xf9\x0c\x2c\x89\x98\xd9\xf2\xef\
+\xf3\xb0\x0b\xd3\x22\x6c\xd2\x62\xab\xee\x74\xbc\x2f\xfb\x63\x17\
+\xf6\xd6\xbf\x6d\xff\x79\x50\x9b\x7f\x5e\x9b\x6a\x96\xab\x9d\x81\
+\xd5\x8a\xb8\x12\xbb\xad\x23\x22\x22\x81\xf5\xc3\x12\x81\xc7\x48\
+\x3f\xc1\x4b\xad\x5a\x6d\x09\xf6\x04\xc2\xe7\x80\x55\x10\x29\x28\
+\x8d\x00\x48\x19\x6c\x82\x15\x7f\x39\x06\x58\x3f\x71\x2c\x52\x5e\
+\x13\xb0\xe5\x81\xaf\x05\x5e\x4a\x1c\x8b\x88\x33\x25\x00\x52\x36\
+\xdb\x02\xc7\x62\xb7\x08\x86\x24\x8e\x45\x8a\x6f\x12\x70\x13\x70\
+\x23\xf0\x40\xe2\x58\x44\xbc\x52\x02\x20\x65\xd5\x0b\x5b\x96\xf8\
+\x48\x60\x7f\x34\x5f\x40\xba\xee\x3d\xe0\xaf\xd8\x4c\xfe\x07\xb0\
+\x21\x7f\x91\xd2\x51\x02\x20\x55\xd0\x0b\xf8\x08\xb6\xc2\xdf\x11\
+\x68\x61\x1f\x59\xde\xab\xc0\xdf\x81\x31\xc0\xbf\xb0\xc9\x95\x22\
+\xa5\xa6\x04\x40\xaa\xa6\x11\x4b\x06\x3e\x09\x1c\x02\x8c\x48\x1b\
+\x8e\x24\xd2\x84\x55\x9d\xbc\x05\xf8\x1b\xf0\x62\xda\x70\x44\xe2\
+\x53\x02\x20\x55\xb7\x29\xf0\x71\x60\x1f\xe0\xa3\xd8\x22\x45\x52\
+\x4e\x93\x81\xbb\x80\x3b\x80\xdb\xc8\xab\x86\x82\x48\x74\x4a\x00\
+\x44\x96\xea\x0e\xec\x84\xad\x2e\xb7\x17\xb6\x96\xbc\xbe\x23\xc5\
+\x35\x07\xfb\x95\x7f\x67\x4b\x7b\x02\x7b\x8c\x4f\x44\xd0\xc9\x4d\
+\x64\x65\x86\x02\xbb\x62\xb7\x0c\x3e\x82\xd5\xa6\x6f\x4c\x1a\x91\
+\xac\xcc\x4c\xe0\x11\xe0\x7e\xec\x82\xff\x18\xba\x97\x2f\xd2\x21\
+\x25\x00\x22\x5d\xd7\x0f\xd8\x19\x4b\x0a\x76\xc3\x1e\x39\xac\x62\
+\xf5\xbb\x1c\x34\x03\xcf\x03\xff\xc6\x7e\xe5\x3f\x8c\xd5\xdd\xd7\
+\x8c\x7d\x91\x2e\x52\x02\x20\x52\xbf\x46\x6c\x21\x9b\xd1\x58\x32\
+\x30\x1a\xd8\x06\x5b\xbb\x40\xfc\x69\x06\x5e\xc7\x16\x4c\x7a\x0a\
+\xfb\x95\xff\x6f\x96\x2d\x67\x2c\x22\x35\x52\x02\x20\xe2\x57\x37\
+\x60\x43\x2c\x19\xd8\x02\x4b\x10\x36\x05\xd6\xa3\x5c\x4b\x1b\x87\
+\xd2\xba\x64\xf2\x78\xac\xb6\x7e\xeb\xf2\xc9\x5a\x32\x59\xc4\x33\
+\x25\x00\x22\x71\xf4\xc4\x12\x83\x4d\x58\x36\x29\x18\x41\xf5\xea\
+\x12\xcc\x01\x5e\x01\x5e\x6e\xf9\xfb\x4a\x9b\x7f\x9f\x88\x26\xea\
+\x89\x44\xa1\x04\x40\x24\xbd\xde\xc0\x48\x2c\x19\x58\xb7\x4d\x5b\
+\x1b\x18\x8c\x95\x34\x1e\x4c\x31\x26\x20\xce\x06\xde\xc2\xaa\xe9\
+\x4d\xc2\x56\x27\x9c\x84\x2d\x61\xfc\x3a\x76\x91\x7f\x27\x55\x70\
+\x22\xb2\x94\x12\x00\x91\x62\x68\x60\x69\x32\x30\x04\x58\x03\x5b\
+\x8e\x77\x00\xb6\x22\x5d\x9f\x96\x7f\x6f\xfd\xe7\x01\xd8\x5c\x84\
+\x1e\xed\x5e\xa7\x11\x5b\xc2\xb7\xad\x66\x60\x7a\x9b\x7f\x5f\x8c\
+\x0d\xc5\xb7\x9a\xd9\xae\xcd\x68\xf9\xfb\x41\x9b\xff\x36\x15\xbb\
+\xd0\xcf\xa9\xbf\x8b\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
+\x22\x22\x22\x22\x22\x92\x9b\xff\x0f\x0b\xcd\x5a\x85\x1f\xad\xb3\
+\xe0\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00\x6f\xa6\x53\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x73\
+\x00\x0d\
+\x0e\x10\xe4\xc7\
+\x00\x6e\
+\x00\x66\x00\x63\x00\x5f\x00\x62\x00\x6c\x00\x61\x00\x63\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x99\xf3\xf7\x0b\xf0\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
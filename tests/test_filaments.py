@@ -0,0 +1,86 @@
+# tests/test_filaments.py
+# Parser tests for config/filaments.py (no reader / GUI required).
+import marshal
+import zlib
+
+from anycubic_nfc_qt5.config.filaments import load_filaments, unique_colors, write_filament_cache
+
+INI = """\
+# comment line
+SKU;FILAMENT;COLOR;COLOR_HEX
+
+BBB-101;petg;Black;#000000FF
+AAA-101;PLA Basic;Red;#FF0000FF
+AAA-102;PLA Basic;Red;#EE0000FF
+AAA-103; PLA Basic ; Blue ;
+SHORT-1
+"""
+
+
+def _write(tmp_path, text=INI):
+    p = tmp_path / "filaments.ini"
+    p.write_text(text, encoding="utf-8")
+    return p
+
+
+def test_load_filaments_records(tmp_path):
+    by_filament, by_sku = load_filaments(str(_write(tmp_path)))
+    assert set(by_sku) == {"BBB-101", "AAA-101", "AAA-102", "AAA-103"}
+    rec = by_sku["AAA-103"]
+    assert (rec.filament, rec.color, rec.color_hex) == ("PLA Basic", "Blue", "#000000FF")
+    assert [r.sku for r in by_filament["PLA Basic"]] == ["AAA-101", "AAA-102", "AAA-103"]
+
+
+def test_load_filaments_sorted_case_insensitive(tmp_path):
+    by_filament, _ = load_filaments(str(_write(tmp_path)))
+    assert list(by_filament) == ["petg", "PLA Basic"]
+
+
+def test_load_filaments_without_header(tmp_path):
+    by_filament, by_sku = load_filaments(str(_write(tmp_path, "X-1;ABS;White;#FFFFFFFF\n")))
+    assert list(by_sku) == ["X-1"]
+    assert list(by_filament) == ["ABS"]
+
+
+def test_unique_colors_first_record_wins(tmp_path):
+    by_filament, _ = load_filaments(str(_write(tmp_path)))
+    colors = unique_colors(by_filament)
+    assert colors["PLA Basic"] == [
+        ("Red", "AAA-101", "#FF0000FF"),
+        ("Blue", "AAA-103", "#000000FF"),
+    ]
+
+
+def test_filament_cache_matches_parser(tmp_path):
+    ini = _write(tmp_path)
+    out = write_filament_cache(str(ini), str(tmp_path / "cache.marshal"))
+    size, mtime_ns, crc, rows = marshal.loads(out.read_bytes())
+    st = ini.stat()
+    assert (size, mtime_ns, crc) == (st.st_size, st.st_mtime_ns, zlib.crc32(ini.read_bytes()))
+    _, by_sku = load_filaments(str(ini))
+    assert [r[0] for r in rows] == list(by_sku)
+    assert rows[-1] == ("AAA-103", "PLA Basic", "Blue", "#000000FF")
+
+
+def test_packaged_cache_skips_unchanged_ini(tmp_path, monkeypatch):
+    from pathlib import Path
+    from anycubic_nfc_qt5.config import filaments
+    ini = _write(tmp_path)
+    cache = marshal.loads(write_filament_cache(str(ini), str(tmp_path / "c.marshal")).read_bytes())
+    monkeypatch.setattr(filaments, "_read_filament_cache", lambda: cache)
+    reads = []
+    monkeypatch.setattr(Path, "read_bytes", lambda self: reads.append(self) or b"")
+    assert filaments._read_rows(ini, cache[:2], True)[-1][0] == "AAA-103"
+    assert reads == []  # (size, mtime) match: INI not read
+    assert filaments._read_rows(ini, (0, 0), True) == ()  # stamp differs: CRC of the bytes decides
+    assert reads == [ini]
+
+
+def test_load_filaments_reparses_after_edit(tmp_path):
+    p = _write(tmp_path)
+    by_filament, by_sku = load_filaments(str(p))
+    by_sku["AAA-101"].color_hex = "#123456FF"  # callers may modify the result
+    assert load_filaments(str(p))[1]["AAA-101"].color_hex == "#FF0000FF"
+
+    p.write_text(INI + "CCC-1;PLA Basic;Green;#00FF00FF\n", encoding="utf-8")
+    assert "CCC-1" in load_filaments(str(p))[1]
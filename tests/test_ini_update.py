@@ -0,0 +1,47 @@
+# tests/test_ini_update.py
+# Color update and line append of ac_filaments.ini in config/filaments.py (no reader / GUI required).
+import os
+
+import pytest
+
+from anycubic_nfc_qt5.config.filaments import append_filament_line, load_filaments, update_color_for_sku
+
+INI = "SKU;FILAMENT;COLOR;COLOR_HEX\r\nAAA-101;PLA;Red;#FF0000FF\r\nAAA-1010 ; PLA ; Red ; #EE0000FF\r\nBBB-1;PETG;Blue\r\n"
+
+
+def test_equal_length_update_only_touches_hex(tmp_path):
+    ini = tmp_path / "ac_filaments.ini"
+    ini.write_bytes(INI.encode())
+    assert update_color_for_sku("AAA-1010", "#00ff0080", ini)
+    assert ini.read_bytes() == INI.replace("#EE0000FF", "#00FF0080").encode()
+
+
+def test_short_line_and_missing_sku(tmp_path):
+    ini = tmp_path / "ac_filaments.ini"
+    ini.write_bytes(INI.encode())
+    assert update_color_for_sku("BBB-1", "#123456", ini)
+    assert b"BBB-1;PETG;Blue;#123456FF\r\n" in ini.read_bytes()
+    assert not update_color_for_sku("CCC-1", "#123456", ini)
+    assert os.listdir(tmp_path) == ["ac_filaments.ini"]  # temp file was replaced into place
+
+
+def test_equal_length_update_is_not_served_from_cache(tmp_path):
+    ini = tmp_path / "ac_filaments.ini"
+    ini.write_bytes(INI.encode())
+    st = ini.stat()
+    assert load_filaments(str(ini))[1]["AAA-101"].color_hex == "#FF0000FF"
+    assert update_color_for_sku("AAA-101", "#00FF00FF", ini)
+    os.utime(ini, ns=(st.st_atime_ns, st.st_mtime_ns))  # coarse mtime: same size, same stamp
+    assert load_filaments(str(ini))[1]["AAA-101"].color_hex == "#00FF00FF"
+
+
+def test_append_adds_line_and_refreshes_rows(tmp_path):
+    ini = tmp_path / "ac_filaments.ini"
+    ini.write_bytes(INI.rstrip("\r\n").encode())  # no trailing newline
+    assert "NEW-1" not in load_filaments(str(ini))[1]
+    rec = append_filament_line(" NEW-1 ", "PLA", "Green", "00ff00", ini)
+    assert (rec.sku, rec.color_hex) == ("NEW-1", "#00FF00FF")
+    assert ini.read_bytes().endswith(b"BBB-1;PETG;Blue\nNEW-1;PLA;Green;#00FF00FF\n")
+    assert load_filaments(str(ini))[1]["NEW-1"].color == "Green"
+    with pytest.raises(ValueError):
+        append_filament_line("NEW-2", "PLA", " ", "#00FF00", ini)
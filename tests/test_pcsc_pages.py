@@ -0,0 +1,73 @@
+# tests/test_pcsc_pages.py
+# Page-read batching in nfc/pcsc.py against an in-memory NTAG (no reader required).
+import pytest
+
+pytest.importorskip("smartcard")
+from anycubic_nfc_qt5.nfc.pcsc import read_anycubic_fields, read_page_map, read_pages_ultralight
+
+
+class FakeNtag:
+    """Answers READ BINARY (FF B0) like an NTAG213 (45 pages), counts APDUs.
+    Reads past the last page fail; a block read near the end rolls over to page 0."""
+    PAGES = 45
+
+    def __init__(self, block_reads=True):
+        self.mem = bytearray(self.PAGES * 4)
+        self.block_reads = block_reads
+        self.apdus = 0
+
+    def put(self, page, data):
+        self.mem[page * 4:page * 4 + len(data)] = data
+
+    def getATR(self):
+        return [0x3B, 0x8F]
+
+    def transmit(self, apdu):
+        self.apdus += 1
+        if apdu[:2] == [0xFF, 0xCA]:
+            return [0x04, 0xA1, 0xB2], 0x90, 0x00
+        if apdu[:2] == [0xFF, 0xB0]:
+            page, le = apdu[3], apdu[4]
+            if page >= self.PAGES or (le != 0x04 and not self.block_reads):
+                return [], 0x6A, 0x81
+            return [self.mem[(page * 4 + i) % len(self.mem)] for i in range(le)], 0x90, 0x00
+        return [], 0x6D, 0x00
+
+
+def _anycubic_tag(**kw):
+    tag = FakeNtag(**kw)
+    tag.put(0x05, b"AHHSCG-101\x00")
+    tag.put(0x0F, b"PLA\x00")
+    tag.put(0x14, bytes([0xFF, 0x00, 0x80, 0x00]))  # tag order -> '#008000FF'
+    tag.put(0x1F, (1000).to_bytes(2, "little"))
+    return tag
+
+
+@pytest.mark.parametrize("block_reads", [True, False])
+def test_read_anycubic_fields(block_reads):
+    info = read_anycubic_fields(_anycubic_tag(block_reads=block_reads))
+    assert info["sku"] == "AHHSCG-101"
+    assert info["material"] == "PLA"
+    assert info["color_hex"] == "#008000FF"
+    assert info["weight_g"] == 1000
+    assert info["uid"] == bytes([0x04, 0xA1, 0xB2])
+
+
+def test_read_page_map_uses_block_reads():
+    tag = _anycubic_tag()
+    pages = read_page_map(tag, 5, 38)
+    assert sorted(pages) == list(range(5, 43))
+    assert tag.apdus == 11  # 10 blocks + one single READ confirming the last page
+
+
+@pytest.mark.parametrize("block_reads", [True, False])
+def test_read_pages_no_rollover_past_end(block_reads):
+    tag = FakeNtag(block_reads=block_reads)
+    tag.mem[:] = bytes(i % 251 + 1 for i in range(len(tag.mem)))
+    assert read_pages_ultralight(tag, 0, 0x30) == bytes(tag.mem)  # pages 45..47 absent, not wrapped
+
+
+def test_read_pages_stops_at_first_gap():
+    tag = FakeNtag(block_reads=False)
+    assert len(read_pages_ultralight(tag, 40, 0x30)) == 5 * 4
+    assert tag.apdus == 1 + 5 + 1  # failed block, pages 40..44, failing page 45
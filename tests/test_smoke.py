@@ -1,2 +1,34 @@
+import subprocess
+import sys
+
+import pytest
+
+
 def test_import():
-    import anycubic_nfc_qt5
\ No newline at end of file
+    import anycubic_nfc_qt5
+
+
+def test_app_import_does_not_load_pyscard():
+    """pyscard is imported lazily; importing the GUI module must not pull it in."""
+    pytest.importorskip("PyQt5")
+    code = (
+        "import sys, anycubic_nfc_qt5.app; "
+        "sys.exit(any(m.split('.')[0] == 'smartcard' for m in sys.modules))"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("#ff0000", "#FF0000"),
+    ("  #00ff00ff\n", "#00FF00"),
+    ("#0000FF80EXTRA", "#0000FF"),  # longer than 9: first 7 characters
+    ("#1234567", "#000000"),        # 8 characters
+    ("123456", "#000000"),
+    ("#GGGGGG", "#000000"),
+    ("", "#000000"),
+    (None, "#000000"),
+])
+def test_normalize_hex_edge_cases(value, expected):
+    pytest.importorskip("PyQt5")
+    from anycubic_nfc_qt5.app import normalize_hex
+    assert normalize_hex(value) == expected